@@ -20,7 +20,7 @@ print("")
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
-from main import User, Base, get_password_hash
+from main import User, UserSkill, Base, get_password_hash, sync_user_skills, parse_skills_json, index_mentor_search
 
 # 데이터베이스 설정
 SQLALCHEMY_DATABASE_URL = "sqlite:///./mentor_mentee.db"
@@ -112,6 +112,7 @@ def create_test_data():
         
         if existing_users:
             print(f"기존 테스트 사용자 {len(existing_users)}명을 발견했습니다. 삭제 후 새로 생성합니다.")
+            db.query(UserSkill).filter(UserSkill.user_id.in_([user.id for user in existing_users])).delete(synchronize_session=False)
             for user in existing_users:
                 db.delete(user)
             db.commit()
@@ -130,6 +131,8 @@ def create_test_data():
             )
             db.add(mentor)
             db.flush()  # ID를 얻기 위해 flush
+            sync_user_skills(db, mentor.id, parse_skills_json(mentor.skills))
+            index_mentor_search(db, mentor.id, mentor.name, mentor.bio, parse_skills_json(mentor.skills))
             created_mentors.append(mentor)
             print(f"멘토 생성: {mentor.name} (ID: {mentor.id})")
         
@@ -147,6 +150,7 @@ def create_test_data():
             )
             db.add(mentee)
             db.flush()  # ID를 얻기 위해 flush
+            sync_user_skills(db, mentee.id, parse_skills_json(mentee.skills))
             created_mentees.append(mentee)
             
             # 어떤 멘토의 멘티인지 표시
@@ -63,13 +63,14 @@ def create_test_match_requests():
     # 매칭 요청 데이터 삽입
     for request in test_requests:
         cursor.execute("""
-            INSERT INTO match_requests (mentor_id, mentee_id, message, status, created_at)
-            VALUES (?, ?, ?, ?, ?)
+            INSERT INTO match_requests (mentor_id, mentee_id, message, status, version, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
         """, (
             request['mentor_id'],
             request['mentee_id'],
             request['message'],
             request['status'],
+            1,
             datetime.now().isoformat()
         ))
     
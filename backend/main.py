@@ -1,19 +1,40 @@
-from fastapi import FastAPI, HTTPException, Depends, status, File, UploadFile
+from fastapi import FastAPI, HTTPException, Depends, status, File, UploadFile, Request, Response, Query, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, LargeBinary
+from sqlalchemy import create_engine, Column, Integer, Float, String, Text, DateTime, ForeignKey, Index, event, inspect, text, func, select, tuple_, update, insert, literal
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, make_transient_to_detached, aliased
+from sqlalchemy.exc import IntegrityError
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, List
 import os
 import base64
+import calendar
 import json
+import orjson
+import hashlib
+import hmac
+import mmap
+import re
+import io
+import asyncio
+import heapq
+import threading
+import time
+import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageOps
+from multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
 import uuid
 
@@ -22,18 +43,99 @@ SECRET_KEY = "your-secret-key-here-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 1
 
+# 목록 페이지네이션 설정
+PAGE_DEFAULT_LIMIT = 50
+PAGE_MAX_LIMIT = 100
+REFRESH_TOKEN_EXPIRE_DAYS = 14
+REFRESH_TOKEN_AUDIENCE = "mentor-mentee-refresh"  # 리프레시 토큰을 액세스 토큰으로 쓸 수 없도록 audience 분리
+
+# 사용자 요약 설정 (매칭 요청의 상대방 프로필, 사용자 일괄 조회)
+BIO_SUMMARY_LENGTH = 120
+USERS_BATCH_MAX_IDS = 100
+
+# 빈 시간 조회 설정
+FREE_SLOTS_MAX_DAYS = 62  # 한 번에 조회할 수 있는 최대 기간
+FREE_SLOTS_DEFAULT_SLOT_MINUTES = 60
+
+# 미팅 일괄 생성 설정
+BULK_MEETINGS_MAX_ITEMS = 100
+
+# 반복 미팅 설정
+SERIES_FREQUENCIES = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1)}
+SERIES_DEFAULT_WINDOW_DAYS = 90  # 기간 없이 미팅 목록을 조회할 때 펼치는 반복 회차 범위 (오늘부터)
+SERIES_MAX_INTERVAL = 52
+SERIES_MAX_DAYS = 731  # 반복은 첫 회차부터 이 기간 안에 끝나야 하므로 생성 시 모든 회차의 충돌을 검사할 수 있음
+
+# 미팅 목록 조회 설정
+MEETINGS_RANGE_MAX_DAYS = 366  # start/end 로 조회할 수 있는 최대 기간 (반복 회차를 펼치는 범위)
+
+# 달력 범위 조회 설정
+CALENDAR_RANGE_MAX_DAYS = 366
+
+# 실시간 알림(SSE) 설정
+EVENT_BUS_BACKEND = os.getenv("EVENT_BUS_BACKEND", "memory")  # memory: 단일 프로세스, sqlite: 같은 DB 를 쓰는 여러 워커가 공유
+EVENT_QUEUE_MAX_SIZE = 64  # 연결당 밀린 이벤트 수 상한. 넘치면 비우고 resync 이벤트 하나로 대체
+EVENT_MAX_CONNECTIONS_PER_USER = 5
+EVENT_HEARTBEAT_SECONDS = 15  # 이 주기로 토큰 만료/로그아웃도 확인
+EVENT_STREAM_TICKET_SECONDS = 30  # 스트림 연결용 1회용 티켓 유효 시간
+EVENT_STREAM_TICKET_AUDIENCE = "mentor-mentee-event-stream"
+EVENT_POLL_INTERVAL_SECONDS = 0.5  # sqlite 백엔드가 event_outbox 를 확인하는 주기
+EVENT_OUTBOX_RETENTION_SECONDS = 300
+
+# 운영용 지표 설정 (설정하지 않으면 /api/metrics 비활성화)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# 인증 사용자 캐시 설정
+PRINCIPAL_CACHE_MAX_ENTRIES = 10000
+PRINCIPAL_CACHE_TTL_SECONDS = 300
+
+# 이미지 응답 설정
+IMAGE_CHUNK_SIZE = 64 * 1024
+IMAGE_CACHE_CONTROL_IMMUTABLE = "private, max-age=31536000, immutable"  # ?v=<해시> 로 요청한 경우
+IMAGE_CACHE_CONTROL_REVALIDATE = "private, no-cache"  # 버전 없는 URL은 ETag로 재검증
+
+# 업로드 이미지 처리 설정
+IMAGE_SIZES = (64, 200, 500)  # 업로드 시 미리 렌더링하는 정사각형 크기 (px)
+IMAGE_DEFAULT_SIZE = 500
+IMAGE_LIST_SIZE = 200  # 멘토 목록 카드에서 사용하는 크기
+IMAGE_OUTPUT_FORMAT = "WEBP"
+IMAGE_OUTPUT_QUALITY = 80
+IMAGE_MAX_PIXELS = 40_000_000  # 디코딩 폭탄 방지용 최대 픽셀 수
+IMAGE_ALLOWED_FORMATS = {"JPEG", "PNG", "GIF", "WEBP"}
+IMAGE_PROCESS_WORKERS = int(os.getenv("IMAGE_PROCESS_WORKERS", "2"))
+IMAGE_PROCESS_TIMEOUT_SECONDS = 30
+IMAGE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024  # multipart 업로드 파일 최대 크기
+IMAGE_UPLOAD_MULTIPART_OVERHEAD = 16 * 1024  # 경계 문자열, 파트 헤더 등 파일 외 본문 허용량
+
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))  # 비용이 다른 기존 해시는 로그인 시 재해싱
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))  # 실행 중 + 대기 중 최대 작업 수
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=PASSWORD_BCRYPT_ROUNDS
+)
 
 # JWT Bearer 토큰 스키마
 security = HTTPBearer(auto_error=False)
 
 # 데이터베이스 설정
 SQLALCHEMY_DATABASE_URL = "sqlite:///./mentor_mentee.db"
+MIGRATION_LOCK_PATH = "./mentor_mentee.migrate.lock"  # 마이그레이션을 한 프로세스씩 적용하기 위한 잠금 전용 DB 파일
+MIGRATION_LOCK_TIMEOUT_SECONDS = 300
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+@event.listens_for(engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite 는 연결마다 PRAGMA 로 켜야 외래 키를 검사함"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 # Pydantic 모델들
 class UserSignup(BaseModel):
     email: EmailStr
@@ -45,6 +147,12 @@ class UserLogin(BaseModel):
     email: EmailStr
     password: str
 
+class TokenRefresh(BaseModel):
+    refreshToken: str
+
+class UserLogout(BaseModel):
+    refreshToken: Optional[str] = None
+
 class UserProfile(BaseModel):
     id: int
     name: str
@@ -74,6 +182,23 @@ class MeetingUpdate(BaseModel):
     status: Optional[str] = None
     meetingLink: Optional[str] = None
 
+class MeetingBulkCreate(BaseModel):
+    meetings: List[MeetingCreate]
+    mode: str = "all_or_nothing"  # all_or_nothing: 하나라도 실패하면 모두 취소, best_effort: 가능한 것만 생성
+
+class MeetingSeriesCreate(MeetingCreate):
+    # startTime/endTime 은 첫 회차. count 나 until 중 하나는 필요 (첫 회차부터 SERIES_MAX_DAYS 일 안에 끝나야 함)
+    frequency: str  # "daily" or "weekly"
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+
+class MeetingSeriesUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    meetingLink: Optional[str] = None
+    until: Optional[datetime] = None  # 반복을 일찍 끝낼 때만 사용 (늘릴 수 없음)
+
 # SQLAlchemy 모델들
 class User(Base):
     __tablename__ = "users"
@@ -85,25 +210,45 @@ class User(Base):
     role = Column(String)  # "mentor" or "mentee"
     bio = Column(Text, default="")
     skills = Column(Text, default="")  # JSON string for mentor skills
-    profile_image = Column(LargeBinary)
+    profile_image_hash = Column(String, nullable=True)  # 이미지 저장소의 SHA-256 키 (바이트는 users 행에 두지 않음)
+    first_skill_key = Column(String, default="")  # 첫 번째 스킬의 casefold 값 (스킬순 정렬용)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # 멘토 목록 정렬(id / 이름 / 첫 스킬) + 키셋 페이지네이션용 인덱스
+    __table_args__ = (
+        Index("ix_users_role_id", "role", "id"),
+        Index("ix_users_role_name_id", "role", "name", "id"),
+        Index("ix_users_role_first_skill_key_id", "role", "first_skill_key", "id"),
+    )
 
 class MatchRequest(Base):
     __tablename__ = "match_requests"
     
     id = Column(Integer, primary_key=True, index=True)
-    mentor_id = Column(Integer)
-    mentee_id = Column(Integer)
+    mentor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    mentee_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     message = Column(Text)
     status = Column(String, default="pending")  # pending, accepted, rejected, cancelled
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))  # 상태가 바뀔 때마다 1 증가 (낙관적 동시성 제어)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __mapper_args__ = {"version_id_col": version}
+    __table_args__ = (
+        Index("ix_match_requests_mentor_id_status", "mentor_id", "status"),
+        Index("ix_match_requests_mentee_id_status", "mentee_id", "status"),
+        # 같은 멘토-멘티 쌍에는 진행 중(pending/accepted)인 요청이 하나만 존재
+        Index(
+            "ux_match_requests_active_pair", "mentor_id", "mentee_id", unique=True,
+            sqlite_where=text("status IN ('pending', 'accepted')")
+        ),
+    )
 
 class Meeting(Base):
     __tablename__ = "meetings"
     
     id = Column(Integer, primary_key=True, index=True)
-    mentor_id = Column(Integer)
-    mentee_id = Column(Integer)
+    mentor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    mentee_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     title = Column(String)
     description = Column(Text)
     start_time = Column(DateTime)
@@ -112,9 +257,1162 @@ class Meeting(Base):
     meeting_link = Column(String)  # Zoom, Google Meet 등 링크
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_meetings_mentor_id_start_time", "mentor_id", "start_time"),
+        Index("ix_meetings_mentee_id_start_time", "mentee_id", "start_time"),
+    )
+
+class MeetingSeries(Base):
+    """반복 미팅. 회차는 저장하지 않고 조회 범위 안에서만 펼침"""
+    __tablename__ = "meeting_series"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    mentor_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    mentee_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    title = Column(String)
+    description = Column(Text)
+    meeting_link = Column(String)
+    start_time = Column(DateTime)  # 첫 회차 시작
+    end_time = Column(DateTime)  # 첫 회차 끝
+    frequency = Column(String)  # daily, weekly
+    interval = Column(Integer, default=1)
+    occurrence_count = Column(Integer, nullable=True)
+    until = Column(DateTime, nullable=True)
+    ends_at = Column(DateTime, nullable=True)  # 마지막 회차 끝 (끝없이 반복하면 NULL), 범위 조회용
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_meeting_series_mentor_id_start_time", "mentor_id", "start_time"),
+        Index("ix_meeting_series_mentee_id_start_time", "mentee_id", "start_time"),
+    )
+
+class MeetingOccurrenceOverride(Base):
+    """반복 미팅 한 회차의 변경/취소. NULL 인 필드는 시리즈 값을 그대로 사용"""
+    __tablename__ = "meeting_occurrence_overrides"
+    
+    series_id = Column(Integer, ForeignKey("meeting_series.id", ondelete="CASCADE"), primary_key=True)
+    occurrence_start = Column(DateTime, primary_key=True)  # 규칙상 원래 시작 시각
+    title = Column(String, nullable=True)
+    description = Column(Text, nullable=True)
+    start_time = Column(DateTime, nullable=True)
+    end_time = Column(DateTime, nullable=True)
+    status = Column(String, nullable=True)
+    meeting_link = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class UserSkill(Base):
+    """users.skills(JSON) 를 검색용으로 정규화한 테이블. skill_key 는 casefold 된 값"""
+    __tablename__ = "user_skills"
+    
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    skill_key = Column(String, primary_key=True)
+    
+    __table_args__ = (
+        Index("ix_user_skills_skill_key_user_id", "skill_key", "user_id"),
+    )
+
+class MeetingDayCount(Base):
+    """참가자별 날짜(시작 시각 기준)·상태별 미팅 수. meetings 트리거가 증감하여 유지하는 파생 데이터"""
+    __tablename__ = "meeting_day_counts"
+    
+    user_id = Column(Integer, primary_key=True)
+    day = Column(String, primary_key=True)  # YYYY-MM-DD
+    status = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+class CacheVersion(Base):
+    """캐시 무효화용 단조 증가 버전 (여러 워커가 DB 로 같은 버전을 공유)"""
+    __tablename__ = "cache_versions"
+    
+    name = Column(String, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    
+    jti = Column(String, primary_key=True)  # 토큰의 JWT ID
+    user_id = Column(Integer, index=True)
+    family_id = Column(String, index=True)  # 로그인 1회에서 회전되어 이어진 토큰 묶음
+    expires_at = Column(DateTime)
+    revoked_at = Column(DateTime, nullable=True)  # 회전되었거나 로그아웃으로 폐기된 시각
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class EventOutbox(Base):
+    """sqlite 이벤트 버스 백엔드가 워커 간에 이벤트를 전달하는 테이블 (보관 기간이 지나면 삭제)"""
+    __tablename__ = "event_outbox"
+    
+    id = Column(Integer, primary_key=True)
+    user_ids = Column(Text, nullable=False)  # 수신자 id JSON 배열
+    frame = Column(Text, nullable=False)  # 직렬화된 SSE 프레임
+    created_at = Column(Float, nullable=False, index=True)  # unix time
+
+class SchemaMigration(Base):
+    """적용된 스키마 마이그레이션 버전 기록"""
+    __tablename__ = "schema_migrations"
+    
+    version = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow)
+
+# 스킬 정규화 헬퍼 함수들
+def normalize_skill_key(skill: str) -> str:
+    return skill.strip().casefold()
+
+def parse_skills_json(skills_json: Optional[str]) -> list:
+    try:
+        skills = json.loads(skills_json) if skills_json else []
+        return skills if isinstance(skills, list) else []
+    except ValueError:
+        return []
+
+def first_skill_key(skills: list) -> str:
+    for skill in skills:
+        if isinstance(skill, str) and skill.strip():
+            return normalize_skill_key(skill)
+    return ""
+
+def sync_user_skills(db: Session, user_id: int, skills: list):
+    """user_skills 와 users.first_skill_key 를 주어진 스킬 목록과 같게 맞춤 (commit 은 호출하는 쪽에서)"""
+    keys = {normalize_skill_key(skill) for skill in skills if isinstance(skill, str) and skill.strip()}
+    db.query(UserSkill).filter(UserSkill.user_id == user_id).delete(synchronize_session=False)
+    db.add_all([UserSkill(user_id=user_id, skill_key=key) for key in sorted(keys)])
+    db.query(User).filter(User.id == user_id).update(
+        {User.first_skill_key: first_skill_key(skills)}, synchronize_session=False
+    )
+
+# 멘토 전문 검색 (SQLite FTS5, rowid = users.id)
+MENTOR_SEARCH_BM25_WEIGHTS = (10.0, 1.0, 5.0)  # name, bio, skills 컬럼 가중치
+
+def create_mentor_search_table() -> bool:
+    """FTS5 가상 테이블 생성. 새로 만들었으면 True"""
+    with engine.begin() as conn:
+        exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mentor_search'")).first()
+        if exists:
+            return False
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE mentor_search USING fts5(name, bio, skills, tokenize = 'unicode61 remove_diacritics 2')"
+        ))
+        return True
+
+def index_mentor_search(db: Session, user_id: int, name: Optional[str], bio: Optional[str], skills: list):
+    """멘토 검색 인덱스 행을 교체 (commit 은 호출하는 쪽에서)"""
+    db.execute(text("DELETE FROM mentor_search WHERE rowid = :id"), {"id": user_id})
+    db.execute(
+        text("INSERT INTO mentor_search (rowid, name, bio, skills) VALUES (:id, :name, :bio, :skills)"),
+        {"id": user_id, "name": name or "", "bio": bio or "", "skills": " ".join(skill for skill in skills if isinstance(skill, str))}
+    )
+
+def build_mentor_search_query(q: str) -> Optional[str]:
+    """사용자 입력을 FTS5 문법 오류가 나지 않는 접두어 AND 검색식으로 변환"""
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+def mentor_search_subquery(match: str):
+    weights = ", ".join(str(weight) for weight in MENTOR_SEARCH_BM25_WEIGHTS)
+    return text(
+        f"SELECT rowid AS user_id, bm25(mentor_search, {weights}) AS score FROM mentor_search WHERE mentor_search MATCH :match"
+    ).bindparams(match=match).columns(user_id=Integer, score=Float).subquery("mentor_search_hits")
+
+# 미팅 시간 충돌 검사 (SQLite R*Tree, 예정된 미팅마다 참가자별 한 행)
+# 좌표는 (참가자 id, 분 단위 시각 구간). 분 단위로 넓게 잡은 후보를 실제 시각으로 다시 확인
+MEETING_INTERVAL_TRIGGER_VALUES = """
+    SELECT {row}.id * 2, {row}.mentor_id, {row}.mentor_id, {start}, {end}, {row}.id {source} {where}
+    UNION ALL
+    SELECT {row}.id * 2 + 1, {row}.mentee_id, {row}.mentee_id, {start}, {end}, {row}.id {source} {where}
+"""
+
+def meeting_interval_values(row: str, source: str = "") -> str:
+    """meetings 행을 meeting_intervals 두 행으로 바꾸는 SELECT (트리거와 백필에서 공용)"""
+    return MEETING_INTERVAL_TRIGGER_VALUES.format(
+        row=row,
+        source=source,
+        start=f"CAST(strftime('%s', {row}.start_time) AS INTEGER) / 60",
+        # strftime('%s') 는 초 미만을 버리므로 끝 시각은 1분 넉넉하게
+        end=f"CAST(strftime('%s', {row}.end_time) AS INTEGER) / 60 + 1",
+        where=f"WHERE {row}.status = 'scheduled' AND {row}.end_time > {row}.start_time"
+    )
+
+def create_meeting_interval_index():
+    """meeting_intervals R*Tree 와 meetings 변경 시 이를 맞추는 트리거 생성"""
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS meeting_intervals "
+            "USING rtree_i32(id, min_user_id, max_user_id, start_minute, end_minute, +meeting_id)"
+        ))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_intervals_insert AFTER INSERT ON meetings BEGIN
+                INSERT INTO meeting_intervals {meeting_interval_values("NEW")};
+            END
+        """))
+        conn.execute(text("""
+            CREATE TRIGGER IF NOT EXISTS meetings_intervals_delete AFTER DELETE ON meetings BEGIN
+                DELETE FROM meeting_intervals WHERE id IN (OLD.id * 2, OLD.id * 2 + 1);
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_intervals_update
+            AFTER UPDATE OF mentor_id, mentee_id, start_time, end_time, status ON meetings BEGIN
+                DELETE FROM meeting_intervals WHERE id IN (OLD.id * 2, OLD.id * 2 + 1);
+                INSERT INTO meeting_intervals {meeting_interval_values("NEW")};
+            END
+        """))
+
+def calendar_cache_name(user_id: int) -> str:
+    return f"calendar:{user_id}"
+
+def calendar_version_bump(*user_columns: str) -> str:
+    """트리거 안에서 주어진 참가자들의 달력 버전을 올리는 UPSERT"""
+    values = ", ".join(f"('calendar:' || {column}, 1)" for column in user_columns)
+    return (
+        f"INSERT INTO cache_versions (name, version) VALUES {values} "
+        "ON CONFLICT (name) DO UPDATE SET version = version + 1;"
+    )
+
+def create_calendar_version_triggers():
+    """미팅이 바뀌면 참가자별 달력 버전(cache_versions 의 calendar:<id>)을 올리는 트리거 생성"""
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_calendar_versions_insert AFTER INSERT ON meetings BEGIN
+                {calendar_version_bump("NEW.mentor_id", "NEW.mentee_id")}
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_calendar_versions_delete AFTER DELETE ON meetings BEGIN
+                {calendar_version_bump("OLD.mentor_id", "OLD.mentee_id")}
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_calendar_versions_update AFTER UPDATE ON meetings BEGIN
+                {calendar_version_bump("OLD.mentor_id", "OLD.mentee_id", "NEW.mentor_id", "NEW.mentee_id")}
+            END
+        """))
+
+def day_count_increment(row: str) -> str:
+    """트리거 안에서 미팅 행의 두 참가자 날짜별 수를 1 올리는 UPSERT"""
+    values = " UNION ALL ".join(
+        f"SELECT {row}.{column}, date({row}.start_time), COALESCE({row}.status, ''), 1 WHERE {row}.start_time IS NOT NULL"
+        for column in ("mentor_id", "mentee_id")
+    )
+    return (
+        f"INSERT INTO meeting_day_counts (user_id, day, status, count) {values} "
+        "ON CONFLICT (user_id, day, status) DO UPDATE SET count = count + 1;"
+    )
+
+def day_count_decrement(row: str) -> str:
+    """트리거 안에서 미팅 행의 두 참가자 날짜별 수를 1 내리고 0 이 된 행을 삭제"""
+    match = f"day = date({row}.start_time) AND status = COALESCE({row}.status, '')"
+    return (
+        f"UPDATE meeting_day_counts SET count = count - 1 WHERE {match} AND user_id = {row}.mentor_id; "
+        f"UPDATE meeting_day_counts SET count = count - 1 WHERE {match} AND user_id = {row}.mentee_id; "
+        f"DELETE FROM meeting_day_counts WHERE {match} AND user_id IN ({row}.mentor_id, {row}.mentee_id) AND count <= 0;"
+    )
+
+def create_meeting_day_count_triggers():
+    """미팅이 바뀔 때 meeting_day_counts 를 증감하는 트리거 생성"""
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_day_counts_insert AFTER INSERT ON meetings BEGIN
+                {day_count_increment("NEW")}
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_day_counts_delete AFTER DELETE ON meetings BEGIN
+                {day_count_decrement("OLD")}
+            END
+        """))
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS meetings_day_counts_update
+            AFTER UPDATE OF mentor_id, mentee_id, start_time, status ON meetings BEGIN
+                {day_count_decrement("OLD")}
+                {day_count_increment("NEW")}
+            END
+        """))
+
+def create_series_calendar_version_triggers():
+    """반복 미팅이나 회차 변경이 바뀌면 참가자별 달력 버전을 올리는 트리거 생성"""
+    series_mentor = "(SELECT mentor_id FROM meeting_series WHERE id = {row}.series_id)"
+    series_mentee = "(SELECT mentee_id FROM meeting_series WHERE id = {row}.series_id)"
+    with engine.begin() as conn:
+        for event_name, row in (("insert", "NEW"), ("update", "NEW"), ("delete", "OLD")):
+            conn.execute(text(f"""
+                CREATE TRIGGER IF NOT EXISTS meeting_series_calendar_versions_{event_name}
+                AFTER {event_name.upper()} ON meeting_series BEGIN
+                    {calendar_version_bump(f"{row}.mentor_id", f"{row}.mentee_id")}
+                END
+            """))
+            # 시리즈 삭제로 함께 지워지는 변경 행은 시리즈 트리거가 이미 버전을 올림
+            conn.execute(text(f"""
+                CREATE TRIGGER IF NOT EXISTS meeting_occurrence_overrides_calendar_versions_{event_name}
+                AFTER {event_name.upper()} ON meeting_occurrence_overrides
+                WHEN EXISTS (SELECT 1 FROM meeting_series WHERE id = {row}.series_id) BEGIN
+                    {calendar_version_bump(series_mentor.format(row=row), series_mentee.format(row=row))}
+                END
+            """))
+
+def get_calendar_versions(db: Session, user_ids) -> dict:
+    """참가자 id -> 달력 버전 (미팅이 한 번도 바뀌지 않았으면 0)"""
+    names = {calendar_cache_name(user_id): user_id for user_id in user_ids}
+    versions = {user_id: 0 for user_id in user_ids}
+    rows = db.query(CacheVersion.name, CacheVersion.version).filter(CacheVersion.name.in_(names)).all()
+    for name, version in rows:
+        versions[names[name]] = version
+    return versions
+
+def naive_datetime(value: datetime) -> datetime:
+    """DB 에는 tz 정보 없이 저장되므로 비교 전에 같은 형태로 맞춤"""
+    return value.replace(tzinfo=None)
+
+def meeting_minute(value: datetime) -> int:
+    """SQLite strftime('%s') / 60 과 같은 분 단위 시각"""
+    return calendar.timegm(naive_datetime(value).timetuple()) // 60
+
+def meeting_interval_subquery(user_id: int, start_time: datetime, end_time: datetime):
+    return text(
+        "SELECT meeting_id FROM meeting_intervals "
+        "WHERE min_user_id <= :user_id AND max_user_id >= :user_id "
+        "AND start_minute <= :end_minute AND end_minute > :start_minute"
+    ).bindparams(
+        user_id=user_id, start_minute=meeting_minute(start_time), end_minute=meeting_minute(end_time)
+    ).columns(meeting_id=Integer).subquery("meeting_interval_hits")
+
+def scheduled_meetings_overlapping(db: Session, user_id: int, start_time: datetime, end_time: datetime, *columns):
+    """참가자의 예정된 미팅 중 [start_time, end_time) 과 겹치는 미팅 쿼리 (R*Tree 후보를 실제 시각으로 확인)"""
+    start_time, end_time = naive_datetime(start_time), naive_datetime(end_time)
+    hits = meeting_interval_subquery(user_id, start_time, end_time)
+    return db.query(*columns).join(hits, Meeting.id == hits.c.meeting_id).filter(
+        Meeting.start_time < end_time,
+        Meeting.end_time > start_time
+    )
+
+# 반복 미팅 헬퍼 함수들
+@dataclass
+class MeetingOccurrence:
+    """펼쳐진 반복 미팅 회차. 미팅 행과 같은 속성 이름을 써서 목록/달력 코드를 함께 씀"""
+    series_id: int
+    occurrence_start: datetime
+    mentor_id: int
+    mentee_id: int
+    title: str
+    description: str
+    start_time: datetime
+    end_time: datetime
+    status: str
+    meeting_link: str
+    created_at: datetime
+    
+    @property
+    def id(self) -> None:
+        """회차는 미팅 행이 아니므로 id 가 없다 (/api/meetings/{id} 로 보낼 수 없음). seriesId + occurrenceStart 로 식별"""
+        return None
+
+def series_step(series) -> timedelta:
+    return SERIES_FREQUENCIES[series.frequency] * series.interval
+
+def series_ends_at(series) -> Optional[datetime]:
+    """마지막 회차의 끝 시각. count 와 until 이 모두 없으면 (이전에 만든 끝없는 시리즈) None"""
+    step = series_step(series)
+    last_index = None
+    if series.occurrence_count is not None:
+        last_index = series.occurrence_count - 1
+    if series.until is not None:
+        until_index = (series.until - series.start_time) // step
+        last_index = until_index if last_index is None else min(last_index, until_index)
+    if last_index is None:
+        return None
+    return series.start_time + step * last_index + (series.end_time - series.start_time)
+
+def series_occurrence_starts(series, window_start: datetime, window_end: datetime):
+    """[window_start, window_end) 와 겹치는 회차의 원래 시작 시각. 창 앞의 회차는 계산으로 건너뜀"""
+    step = series_step(series)
+    duration = series.end_time - series.start_time
+    index = max(0, (window_start - duration - series.start_time) // step)
+    while True:
+        occurrence_start = series.start_time + step * index
+        if occurrence_start >= window_end:
+            return
+        if series.occurrence_count is not None and index >= series.occurrence_count:
+            return
+        if series.until is not None and occurrence_start > series.until:
+            return
+        if occurrence_start + duration > window_start:
+            yield occurrence_start
+        index += 1
+
+def is_series_occurrence(series, occurrence_start: datetime) -> bool:
+    occurrence_start = naive_datetime(occurrence_start)
+    return occurrence_start in series_occurrence_starts(series, occurrence_start, occurrence_start + timedelta(seconds=1))
+
+def build_occurrence(series, occurrence_start: datetime, override=None) -> MeetingOccurrence:
+    duration = series.end_time - series.start_time
+    
+    def pick(field: str, default):
+        value = getattr(override, field) if override is not None else None
+        return default if value is None else value
+    
+    return MeetingOccurrence(
+        series_id=series.id,
+        occurrence_start=occurrence_start,
+        mentor_id=series.mentor_id,
+        mentee_id=series.mentee_id,
+        title=pick("title", series.title),
+        description=pick("description", series.description),
+        start_time=pick("start_time", occurrence_start),
+        end_time=pick("end_time", occurrence_start + duration),
+        status=pick("status", "scheduled"),
+        meeting_link=pick("meeting_link", series.meeting_link),
+        created_at=series.created_at
+    )
+
+def series_overlapping(db: Session, user_ids, window_start: datetime, window_end: datetime) -> list:
+    """참가자들의 반복 미팅 중 기간이 [window_start, window_end) 와 겹칠 수 있는 시리즈"""
+    user_ids = list(set(user_ids))
+    return db.query(MeetingSeries).filter(
+        MeetingSeries.mentor_id.in_(user_ids) | MeetingSeries.mentee_id.in_(user_ids),
+        MeetingSeries.start_time < window_end,
+        MeetingSeries.ends_at.is_(None) | (MeetingSeries.ends_at > window_start)
+    ).all()
+
+def expand_series_occurrences(db: Session, series_list: list, window_start: datetime, window_end: datetime) -> list:
+    """시리즈들을 [window_start, window_end) 와 겹치는 회차로 펼침 (변경/취소 반영, 시작 시각 순)"""
+    if not series_list:
+        return []
+    window_start, window_end = naive_datetime(window_start), naive_datetime(window_end)
+    series_by_id = {series.id: series for series in series_list}
+    longest = max(series.end_time - series.start_time for series in series_list)
+    # 원래 회차가 창 안에 있거나, 다른 시각으로 옮겨져 창 안에 들어온 변경만 읽음
+    overrides = db.query(MeetingOccurrenceOverride).filter(
+        MeetingOccurrenceOverride.series_id.in_(series_by_id),
+        ((MeetingOccurrenceOverride.occurrence_start >= window_start - longest) &
+         (MeetingOccurrenceOverride.occurrence_start < window_end)) |
+        ((MeetingOccurrenceOverride.start_time < window_end) & (MeetingOccurrenceOverride.end_time > window_start))
+    ).all()
+    overrides_by_key = {(override.series_id, override.occurrence_start): override for override in overrides}
+    
+    occurrences = []
+    for series in series_list:
+        for occurrence_start in series_occurrence_starts(series, window_start, window_end):
+            occurrences.append(build_occurrence(series, occurrence_start, overrides_by_key.pop((series.id, occurrence_start), None)))
+    # 창 밖의 회차가 창 안으로 옮겨진 경우
+    for (series_id, occurrence_start), override in overrides_by_key.items():
+        occurrences.append(build_occurrence(series_by_id[series_id], occurrence_start, override))
+    
+    occurrences = [
+        occurrence for occurrence in occurrences
+        if occurrence.start_time < window_end and occurrence.end_time > window_start
+    ]
+    occurrences.sort(key=lambda occurrence: occurrence.start_time)
+    return occurrences
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+def fetch_user_occurrences(db: Session, user_id: int, window_start: datetime, window_end: datetime) -> list:
+    return expand_series_occurrences(db, series_overlapping(db, (user_id,), window_start, window_end), window_start, window_end)
+
+def fetch_busy_intervals(db: Session, user_id: int, window_start: datetime, window_end: datetime,
+                         exclude_meeting_id: Optional[int] = None, exclude_occurrence=None) -> list:
+    """참가자의 예정된 미팅과 반복 회차 중 창과 겹치는 (시작, 끝) 목록 (시작 시각 순)"""
+    query = scheduled_meetings_overlapping(db, user_id, window_start, window_end, Meeting.start_time, Meeting.end_time)
+    if exclude_meeting_id is not None:
+        query = query.filter(Meeting.id != exclude_meeting_id)
+    meetings = [(row.start_time, row.end_time) for row in query.order_by(Meeting.start_time).all()]
+    occurrences = [
+        (occurrence.start_time, occurrence.end_time)
+        for occurrence in fetch_user_occurrences(db, user_id, window_start, window_end)
+        if occurrence.status == "scheduled" and (occurrence.series_id, occurrence.occurrence_start) != exclude_occurrence
+    ]
+    return list(heapq.merge(meetings, occurrences))
+
+def merge_busy_intervals(*interval_lists) -> list:
+    """시작 시각 순으로 정렬된 구간 목록들을 한 번의 스윕으로 합쳐 겹치거나 맞닿은 구간을 병합"""
+    merged = []
+    for start_time, end_time in heapq.merge(*interval_lists):
+        if merged and start_time <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end_time)
+        else:
+            merged.append([start_time, end_time])
+    return merged
+
+def find_first_overlap(busy: list, candidates: list) -> Optional[int]:
+    """병합된 바쁜 구간과 시작 시각 순 후보 구간들을 한 번에 훑어 처음 겹치는 후보의 index"""
+    position = 0
+    for index, (start_time, end_time) in enumerate(candidates):
+        while position < len(busy) and busy[position][1] <= start_time:
+            position += 1
+        if position < len(busy) and busy[position][0] < end_time:
+            return index
+    return None
+
+def find_conflicting_meeting(db: Session, participant_ids, start_time: datetime, end_time: datetime,
+                             exclude_meeting_id: Optional[int] = None, exclude_occurrence=None) -> bool:
+    """참가자들의 예정된 미팅이나 반복 회차 중 [start_time, end_time) 과 겹치는 것이 있는지"""
+    for user_id in set(participant_ids):
+        query = scheduled_meetings_overlapping(db, user_id, start_time, end_time, Meeting.id)
+        if exclude_meeting_id is not None:
+            query = query.filter(Meeting.id != exclude_meeting_id)
+        if query.first():
+            return True
+        for occurrence in fetch_user_occurrences(db, user_id, start_time, end_time):
+            if occurrence.status == "scheduled" and (occurrence.series_id, occurrence.occurrence_start) != exclude_occurrence:
+                return True
+    return False
+
+def begin_booking_transaction(db: Session):
+    """충돌 검사와 저장 사이에 다른 예약이 끼어들지 않도록 쓰기 잠금을 먼저 잡고 트랜잭션 시작"""
+    db.execute(text("BEGIN IMMEDIATE"))
+
+# 캐시 버전 헬퍼 함수들
+MENTOR_DIRECTORY_CACHE = "mentor_directory"
+MENTOR_DIRECTORY_CACHE_MAX_ENTRIES = 512
+
+def get_cache_version(db: Session, name: str) -> int:
+    return db.query(CacheVersion.version).filter(CacheVersion.name == name).scalar() or 0
+
+class VersionedResponseCache:
+    """(버전, 요청 키) → 직렬화된 응답을 보관하는 LRU 캐시. 새 버전을 보면 이전 항목을 모두 버림"""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.version = None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, version: int, key):
+        with self.lock:
+            if version == self.version and key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, version: int, key, value):
+        with self.lock:
+            if self.version is not None and version < self.version:
+                return
+            if version != self.version:
+                self.entries.clear()
+                self.version = version
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "version": self.version,
+                "size": len(self.entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+mentor_directory_cache = VersionedResponseCache(MENTOR_DIRECTORY_CACHE_MAX_ENTRIES)
+
+# 키셋 페이지네이션 커서 헬퍼 함수들
+def encode_cursor(data: dict) -> str:
+    """마지막 행의 정렬 키를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        if not isinstance(data, dict):
+            raise ValueError("Cursor must be an object")
+        return data
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# 프로필 이미지 저장소 설정 (SHA-256 콘텐츠 주소 기반 디스크 저장소)
+IMAGE_STORE_DIR = "uploads"
+IMAGE_ORPHAN_GRACE_SECONDS = 3600  # 저장 후 아직 users 에 기록되지 않은 업로드를 지우지 않도록 두는 유예 시간
+
+def prune_unreferenced_images() -> int:
+    """
+    어떤 사용자도 참조하지 않는 저장소 파일(교체된 이미지, 렌더링 전 원본, 남은 업로드/임시 파일)을
+    유예 시간이 지난 뒤 삭제하고 삭제 수 반환 (migrate.py --maintenance)
+    """
+    with engine.connect() as conn:
+        referenced = set(conn.execute(
+            text("SELECT DISTINCT profile_image_hash FROM users WHERE profile_image_hash IS NOT NULL")
+        ).scalars())
+    cutoff = time.time() - IMAGE_ORPHAN_GRACE_SECONDS
+    removed = 0
+    for dirpath, _, filenames in os.walk(IMAGE_STORE_DIR):
+        for filename in filenames:
+            # <해시>, <해시>_<크기>, <해시>_<크기>.<uuid>.tmp, incoming/<uuid>.upload
+            content_hash = filename.split(".", 1)[0].split("_", 1)[0]
+            if content_hash in referenced and not filename.endswith(".tmp"):
+                continue
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    return removed
+
+def image_store_path(content_hash: str, size: Optional[int] = None) -> str:
+    """콘텐츠 해시(와 렌더링 크기)에 해당하는 이미지 파일 경로 반환"""
+    filename = f"{content_hash}_{size}" if size else content_hash
+    return os.path.join(IMAGE_STORE_DIR, content_hash[:2], filename)
+
+def write_store_file(path: str, data: bytes):
+    """임시 파일에 쓴 뒤 rename 하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함"""
+    if os.path.exists(path):
+        # 같은 내용을 다시 저장하면 수정 시각을 갱신해 prune_unreferenced_images 의 유예 시간을 다시 적용
+        os.utime(path)
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def store_image_bytes(data: bytes) -> str:
+    """이미지 바이트를 저장소에 기록하고 콘텐츠 해시 반환 (같은 내용은 한 번만 저장)"""
+    content_hash = hashlib.sha256(data).hexdigest()
+    write_store_file(image_store_path(content_hash), data)
+    return content_hash
+
+def store_image_renditions(renditions: dict) -> str:
+    """미리 렌더링된 크기별 이미지를 저장하고 가장 큰 렌더링의 해시를 키로 반환"""
+    content_hash = hashlib.sha256(renditions[max(IMAGE_SIZES)]).hexdigest()
+    for size, data in renditions.items():
+        write_store_file(image_store_path(content_hash, size), data)
+    return content_hash
+
+def render_profile_image(source) -> dict:
+    """업로드 이미지(바이트 또는 파일 경로)를 검증하고 메타데이터를 제거한 뒤 크기별 WebP로 렌더링 (프로세스 풀에서 실행)"""
+    Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+    open_source = (lambda: io.BytesIO(source)) if isinstance(source, bytes) else (lambda: source)
+    try:
+        with Image.open(open_source()) as probe:
+            if probe.format not in IMAGE_ALLOWED_FORMATS:
+                raise ValueError(f"Unsupported image format: {probe.format}")
+            probe.verify()
+        
+        # verify() 이후에는 이미지를 다시 열어야 함
+        with Image.open(open_source()) as image:
+            image.seek(0)  # 애니메이션 GIF/WebP는 첫 프레임만 사용
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    except (OSError, Image.DecompressionBombError, SyntaxError) as e:
+        raise ValueError(f"Invalid image: {e}")
+    
+    renditions = {}
+    for size in IMAGE_SIZES:
+        # 정사각형 아바타로 가운데를 잘라 축소, EXIF 등 메타데이터는 저장하지 않음
+        resized = ImageOps.fit(image, (size, size), method=Image.LANCZOS)
+        output = io.BytesIO()
+        resized.save(output, format=IMAGE_OUTPUT_FORMAT, quality=IMAGE_OUTPUT_QUALITY, method=4)
+        renditions[size] = output.getvalue()
+    return renditions
+
+# 이미지 처리용 프로세스 풀 (import 하는 스크립트에서 프로세스가 생기지 않도록 지연 생성)
+image_executor: Optional[ProcessPoolExecutor] = None
+image_executor_lock = threading.Lock()
+
+def get_image_executor() -> ProcessPoolExecutor:
+    global image_executor
+    # 동시에 들어온 첫 업로드들이 풀을 두 개 만들지 않도록 잠금 안에서 생성
+    with image_executor_lock:
+        if image_executor is None:
+            image_executor = ProcessPoolExecutor(max_workers=IMAGE_PROCESS_WORKERS)
+        return image_executor
+
+async def process_profile_image(source) -> str:
+    """업로드 이미지(바이트 또는 디스크에 받은 파일 경로)를 프로세스 풀에서 처리하고 저장소 키 반환 (이벤트 루프를 막지 않음)"""
+    future = get_image_executor().submit(render_profile_image, source)
+    renditions = await asyncio.wait_for(asyncio.wrap_future(future), timeout=IMAGE_PROCESS_TIMEOUT_SECONDS)
+    return await run_in_threadpool(store_image_renditions, renditions)
+
+class MultipartFileReceiver:
+    """multipart 본문에서 지정한 파일 필드만 청크 단위로 파일에 기록하는 스트리밍 수신기"""
+    
+    def __init__(self, field_name: str, output, max_bytes: int):
+        self.field_name = field_name.encode()
+        self.output = output
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.found = False
+        self.capturing = False
+        self.headers = {}
+        self.header_field = b""
+        self.header_value = b""
+    
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+    
+    def on_part_begin(self):
+        self.headers = {}
+        self.capturing = False
+    
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self.header_field += data[start:end]
+    
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self.header_value += data[start:end]
+    
+    def on_header_end(self):
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+    
+    def on_headers_finished(self):
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        # 같은 이름의 파일 필드가 여러 개면 첫 번째만 사용
+        self.capturing = not self.found and options.get(b"name") == self.field_name and b"filename" in options
+        self.found = self.found or self.capturing
+    
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if not self.capturing:
+            return
+        self.size += end - start
+        if self.size > self.max_bytes:
+            raise HTTPException(status_code=413, detail="Image too large")
+        self.output.write(data[start:end])
+    
+    def on_part_end(self):
+        self.capturing = False
+
+async def receive_upload_file(request: Request, field_name: str, dest_path: str, max_bytes: int) -> int:
+    """요청 본문을 스트리밍으로 읽어 파일 필드를 dest_path 에 저장하고 크기 반환 (읽는 도중 크기 제한 적용)"""
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data")
+    
+    # 본문 크기를 미리 알 수 있으면 읽기 전에 거절
+    max_body_bytes = max_bytes + IMAGE_UPLOAD_MULTIPART_OVERHEAD
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_body_bytes:
+        raise HTTPException(status_code=413, detail="Image too large")
+    
+    with open(dest_path, "wb") as output:
+        receiver = MultipartFileReceiver(field_name, output, max_bytes)
+        parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_body_bytes:
+                raise HTTPException(status_code=413, detail="Image too large")
+            parser.write(chunk)
+        parser.finalize()
+    
+    if not receiver.found:
+        raise HTTPException(status_code=400, detail=f"Missing file field '{field_name}'")
+    return receiver.size
+
+def migrate_profile_images():
+    """기존 users.profile_image BLOB 컬럼을 이미지 저장소로 옮기는 마이그레이션"""
+    columns = {column["name"] for column in inspect(engine).get_columns("users")}
+    with engine.begin() as conn:
+        if "profile_image_hash" not in columns:
+            conn.execute(text("ALTER TABLE users ADD COLUMN profile_image_hash VARCHAR"))
+        
+        if "profile_image" not in columns:
+            return
+        
+        # 한 번에 모든 BLOB을 메모리에 올리지 않도록 한 행씩 옮김
+        user_ids = conn.execute(text("SELECT id FROM users WHERE profile_image IS NOT NULL")).scalars().all()
+        for user_id in user_ids:
+            data = conn.execute(
+                text("SELECT profile_image FROM users WHERE id = :id"), {"id": user_id}
+            ).scalar()
+            content_hash = store_image_bytes(data)
+            conn.execute(
+                text("UPDATE users SET profile_image_hash = :hash, profile_image = NULL WHERE id = :id"),
+                {"hash": content_hash, "id": user_id}
+            )
+
+def migrate_first_skill_keys():
+    """users.first_skill_key 컬럼을 추가하고 기존 skills JSON 으로 채우는 마이그레이션"""
+    columns = {column["name"] for column in inspect(engine).get_columns("users")}
+    if "first_skill_key" in columns:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE users ADD COLUMN first_skill_key VARCHAR DEFAULT ''"))
+        rows = conn.execute(text("SELECT id, skills FROM users WHERE skills IS NOT NULL AND skills != ''")).all()
+        for user_id, skills_json in rows:
+            conn.execute(
+                text("UPDATE users SET first_skill_key = :key WHERE id = :id"),
+                {"key": first_skill_key(parse_skills_json(skills_json)), "id": user_id}
+            )
+
+# 마이그레이션이 적용하는 DDL 은 작성 당시 스키마로 고정한다. 현재 모델을 읽으면 이후 모델 변경(컬럼/인덱스 추가)이
+# 이미 배포된 마이그레이션의 동작까지 바꾸어, 뒤 버전의 정리 작업보다 먼저 새 제약이 걸리기 때문
+USERS_INDEXES_V3 = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+    "CREATE INDEX IF NOT EXISTS ix_users_role_id ON users (role, id)",
+    "CREATE INDEX IF NOT EXISTS ix_users_role_name_id ON users (role, name, id)",
+    "CREATE INDEX IF NOT EXISTS ix_users_role_first_skill_key_id ON users (role, first_skill_key, id)",
+    "CREATE INDEX IF NOT EXISTS ix_user_skills_skill_key_user_id ON user_skills (skill_key, user_id)",
+)
+
+MATCH_REQUESTS_TABLE_V7 = """
+    CREATE TABLE match_requests (
+        id INTEGER NOT NULL,
+        mentor_id INTEGER,
+        mentee_id INTEGER,
+        message TEXT,
+        status VARCHAR,
+        created_at DATETIME,
+        PRIMARY KEY (id),
+        FOREIGN KEY(mentor_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY(mentee_id) REFERENCES users (id) ON DELETE CASCADE
+    )
+"""
+
+MATCH_REQUESTS_INDEXES_V7 = (
+    "CREATE INDEX IF NOT EXISTS ix_match_requests_id ON match_requests (id)",
+    "CREATE INDEX IF NOT EXISTS ix_match_requests_mentor_id_status ON match_requests (mentor_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_match_requests_mentee_id_status ON match_requests (mentee_id, status)",
+)
+
+MEETINGS_TABLE_V7 = """
+    CREATE TABLE meetings (
+        id INTEGER NOT NULL,
+        mentor_id INTEGER,
+        mentee_id INTEGER,
+        title VARCHAR,
+        description TEXT,
+        start_time DATETIME,
+        end_time DATETIME,
+        status VARCHAR,
+        meeting_link VARCHAR,
+        created_at DATETIME,
+        updated_at DATETIME,
+        PRIMARY KEY (id),
+        FOREIGN KEY(mentor_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY(mentee_id) REFERENCES users (id) ON DELETE CASCADE
+    )
+"""
+
+MEETINGS_INDEXES_V7 = (
+    "CREATE INDEX IF NOT EXISTS ix_meetings_id ON meetings (id)",
+    "CREATE INDEX IF NOT EXISTS ix_meetings_mentor_id_start_time ON meetings (mentor_id, start_time)",
+    "CREATE INDEX IF NOT EXISTS ix_meetings_mentee_id_start_time ON meetings (mentee_id, start_time)",
+)
+
+MATCH_REQUESTS_INDEXES_V13 = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_match_requests_active_pair ON match_requests (mentor_id, mentee_id) "
+    "WHERE status IN ('pending', 'accepted')",
+)
+
+# 멘토 목록 응답에 들어가는 멘토 행의 컬럼이 바뀌면 어떤 경로로 쓰든 같은 트랜잭션에서 디렉터리 버전을 올림
+USERS_MENTOR_DIRECTORY_TRIGGERS_V15 = (
+    """
+    CREATE TRIGGER IF NOT EXISTS users_mentor_directory_version_insert
+    AFTER INSERT ON users WHEN NEW.role = 'mentor' BEGIN
+        UPDATE cache_versions SET version = version + 1 WHERE name = 'mentor_directory';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_mentor_directory_version_update
+    AFTER UPDATE OF role, name, bio, skills, profile_image_hash ON users
+    WHEN NEW.role = 'mentor' OR OLD.role = 'mentor' BEGIN
+        UPDATE cache_versions SET version = version + 1 WHERE name = 'mentor_directory';
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS users_mentor_directory_version_delete
+    AFTER DELETE ON users WHEN OLD.role = 'mentor' BEGIN
+        UPDATE cache_versions SET version = version + 1 WHERE name = 'mentor_directory';
+    END
+    """,
+)
+
+# 달력에는 상대방 이름이 들어가므로 이름이 바뀌면 그 사용자와 미팅/반복 미팅이 있는 상대방들의 달력 버전을 올림
+USERS_CALENDAR_COUNTERPART_TRIGGERS_V16 = (
+    """
+    CREATE TRIGGER IF NOT EXISTS users_calendar_versions_name
+    AFTER UPDATE OF name ON users WHEN NEW.name IS NOT OLD.name BEGIN
+        INSERT INTO cache_versions (name, version)
+        SELECT 'calendar:' || counterpart_id, 1 FROM (
+            SELECT mentee_id AS counterpart_id FROM meetings WHERE mentor_id = NEW.id
+            UNION SELECT mentor_id FROM meetings WHERE mentee_id = NEW.id
+            UNION SELECT mentee_id FROM meeting_series WHERE mentor_id = NEW.id
+            UNION SELECT mentor_id FROM meeting_series WHERE mentee_id = NEW.id
+        ) WHERE counterpart_id IS NOT NULL
+        ON CONFLICT (name) DO UPDATE SET version = version + 1;
+    END
+    """,
+)
+
+def execute_ddl(conn, statements):
+    for statement in statements:
+        conn.execute(text(statement))
+
+def migrate_users_indexes():
+    """users, user_skills 의 조회용 인덱스를 기존 테이블에 추가하는 마이그레이션"""
+    with engine.begin() as conn:
+        execute_ddl(conn, USERS_INDEXES_V3)
+
+def migrate_user_skills():
+    """user_skills 테이블이 비어 있으면 users.skills JSON 으로부터 채우는 마이그레이션"""
+    with SessionLocal() as db:
+        if db.query(UserSkill.user_id).first() is not None:
+            return
+        rows = db.query(User.id, User.skills).filter(User.skills.isnot(None), User.skills != "").all()
+        for user_id, skills_json in rows:
+            sync_user_skills(db, user_id, parse_skills_json(skills_json))
+        db.commit()
+
+def migrate_mentor_search():
+    """mentor_search 가 새로 만들어졌으면 기존 멘토로 채우는 마이그레이션"""
+    if not create_mentor_search_table():
+        return
+    with SessionLocal() as db:
+        rows = db.query(User.id, User.name, User.bio, User.skills).filter(User.role == "mentor").all()
+        for user_id, name, bio, skills_json in rows:
+            index_mentor_search(db, user_id, name, bio, parse_skills_json(skills_json))
+        db.commit()
+
+def seed_cache_versions():
+    """버전을 올리는 트리거가 UPDATE 만 하도록 버전 행을 미리 생성"""
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT OR IGNORE INTO cache_versions (name, version) VALUES (:name, 0)"),
+            {"name": MENTOR_DIRECTORY_CACHE}
+        )
+
+def rebuild_table(conn, table_name: str, create_sql: str):
+    """SQLite 는 기존 테이블에 외래 키를 추가할 수 없으므로 고정된 스키마로 테이블을 새로 만들어 행을 복사"""
+    old_name = f"{table_name}_old"
+    old_columns = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    # 이름이 바뀐 테이블에도 인덱스 이름이 남아 새 테이블 인덱스와 충돌하므로 먼저 삭제
+    index_names = conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table AND sql IS NOT NULL"),
+        {"table": table_name}
+    ).scalars().all()
+    for index_name in index_names:
+        conn.execute(text(f'DROP INDEX "{index_name}"'))
+    conn.execute(text(f'ALTER TABLE "{table_name}" RENAME TO "{old_name}"'))
+    conn.execute(text(create_sql))
+    new_columns = [column["name"] for column in inspect(conn).get_columns(table_name)]
+    columns = ", ".join(column for column in new_columns if column in old_columns)
+    conn.execute(text(f'INSERT INTO "{table_name}" ({columns}) SELECT {columns} FROM "{old_name}"'))
+    conn.execute(text(f'DROP TABLE "{old_name}"'))
+
+def migrate_match_and_meeting_constraints():
+    """match_requests, meetings 에 users 외래 키와 조회용 복합 인덱스를 추가하는 마이그레이션"""
+    with engine.connect() as conn:
+        # 테이블 재생성 중에는 외래 키 검사를 끄고 (트랜잭션 밖에서만 바꿀 수 있음) 한 트랜잭션으로 교체
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.commit()
+        try:
+            with conn.begin():
+                conn.exec_driver_sql("BEGIN")
+                for table_name, create_sql, index_statements in (
+                    ("match_requests", MATCH_REQUESTS_TABLE_V7, MATCH_REQUESTS_INDEXES_V7),
+                    ("meetings", MEETINGS_TABLE_V7, MEETINGS_INDEXES_V7),
+                ):
+                    if not inspect(conn).get_foreign_keys(table_name):
+                        rebuild_table(conn, table_name, create_sql)
+                    execute_ddl(conn, index_statements)
+                orphans = conn.exec_driver_sql("PRAGMA foreign_key_check").all()
+        finally:
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+            conn.commit()
+    if orphans:
+        # 이미 있던 행은 그대로 두고 새로 쓰는 행부터 외래 키를 검사
+        print(f"⚠️ 존재하지 않는 사용자를 참조하는 기존 행 {len(orphans)}개가 남아 있습니다.")
+
+def migrate_meeting_intervals():
+    """meeting_intervals 를 만들고 기존 예정된 미팅으로 채우는 마이그레이션"""
+    create_meeting_interval_index()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM meeting_intervals"))
+        conn.execute(text(f"INSERT INTO meeting_intervals {meeting_interval_values('meetings', 'FROM meetings')}"))
+
+def migrate_calendar_versions():
+    """참가자별 달력 버전 트리거를 추가하는 마이그레이션 (기존 사용자는 버전 0 에서 시작)"""
+    create_calendar_version_triggers()
+
+def migrate_meeting_day_counts():
+    """meeting_day_counts 트리거를 만들고 기존 미팅으로 다시 집계하는 마이그레이션"""
+    create_meeting_day_count_triggers()
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM meeting_day_counts"))
+        conn.execute(text("""
+            INSERT INTO meeting_day_counts (user_id, day, status, count)
+            SELECT user_id, day, status, COUNT(*) FROM (
+                SELECT mentor_id AS user_id, date(start_time) AS day, COALESCE(status, '') AS status
+                FROM meetings WHERE start_time IS NOT NULL
+                UNION ALL
+                SELECT mentee_id, date(start_time), COALESCE(status, '') FROM meetings WHERE start_time IS NOT NULL
+            ) GROUP BY user_id, day, status
+        """))
+
+def migrate_meeting_series():
+    """반복 미팅 테이블(create_all 로 생성)의 달력 버전 트리거를 추가하는 마이그레이션"""
+    create_series_calendar_version_triggers()
+
+def migrate_match_request_versions():
+    """match_requests.version 컬럼을 추가하는 마이그레이션"""
+    columns = {column["name"] for column in inspect(engine).get_columns("match_requests")}
+    if "version" in columns:
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE match_requests ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+def migrate_match_request_active_pair():
+    """
+    진행 중인 요청의 (mentor_id, mentee_id) 부분 유니크 인덱스를 추가하는 마이그레이션.
+    
+    이전의 읽고-쓰기 중복 검사를 빠져나간 중복이 있으면 인덱스를 만들 수 없으므로
+    쌍마다 accepted 를 우선, 그다음 가장 오래된 요청 하나만 남기고 나머지는 cancelled 로 바꾼다.
+    """
+    with engine.begin() as conn:
+        cancelled = conn.execute(text("""
+            UPDATE match_requests SET status = 'cancelled', version = version + 1
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY mentor_id, mentee_id
+                        ORDER BY status = 'accepted' DESC, id
+                    ) AS rank
+                    FROM match_requests
+                    WHERE status IN ('pending', 'accepted')
+                )
+                WHERE rank > 1
+            )
+        """)).rowcount
+        if cancelled:
+            print(f"⚠️ 중복된 진행 중 매칭 요청 {cancelled}건을 cancelled 로 정리했습니다.")
+        execute_ddl(conn, MATCH_REQUESTS_INDEXES_V13)
+
+def migrate_profile_image_renditions():
+    """
+    크기별 렌더링 이전에 저장된 원본(마이그레이션 1 로 옮긴 이미지 등)을 렌더링하는 마이그레이션.
+    
+    렌더링 해시로 바꿔야 size 요청과 멘토 목록 카드가 원본 대신 작은 렌더링을 받는다.
+    이미지로 열 수 없는 원본은 그대로 둔다.
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, profile_image_hash FROM users WHERE profile_image_hash IS NOT NULL")).all()
+    
+    rendered = {}  # 같은 원본을 쓰는 사용자는 한 번만 렌더링
+    for user_id, content_hash in rows:
+        if content_hash not in rendered:
+            rendered[content_hash] = None
+            original_path = image_store_path(content_hash)
+            if not os.path.exists(image_store_path(content_hash, max(IMAGE_SIZES))) and os.path.exists(original_path):
+                try:
+                    rendered[content_hash] = store_image_renditions(render_profile_image(original_path))
+                except ValueError:
+                    print(f"⚠️ 렌더링할 수 없는 프로필 이미지를 원본으로 둡니다: {content_hash}")
+        if rendered[content_hash] is None:
+            continue
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE users SET profile_image_hash = :new_hash WHERE id = :id AND profile_image_hash = :old_hash"),
+                {"new_hash": rendered[content_hash], "id": user_id, "old_hash": content_hash}
+            )
+    
+    if any(rendered.values()):
+        # 멘토 목록 캐시에 남은 이전 이미지 URL 무효화
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE cache_versions SET version = version + 1 WHERE name = :name"),
+                {"name": MENTOR_DIRECTORY_CACHE}
+            )
+
+def migrate_mentor_directory_triggers():
+    """멘토 프로필이 바뀌면 멘토 목록 캐시 버전을 올리는 트리거를 추가하는 마이그레이션"""
+    with engine.begin() as conn:
+        execute_ddl(conn, USERS_MENTOR_DIRECTORY_TRIGGERS_V15)
+
+def migrate_calendar_counterpart_triggers():
+    """상대방이 이름을 바꾸면 달력 버전을 올리는 트리거를 추가하는 마이그레이션"""
+    with engine.begin() as conn:
+        execute_ddl(conn, USERS_CALENDAR_COUNTERPART_TRIGGERS_V16)
+
+def migrate_drop_profile_image_blob():
+    """마이그레이션 1 에서 비운 users.profile_image BLOB 컬럼을 삭제하는 마이그레이션 (SQLite 3.35 이상)"""
+    columns = {column["name"] for column in inspect(engine).get_columns("users")}
+    if "profile_image" not in columns:
+        return
+    if sqlite3.sqlite_version_info < (3, 35, 0):
+        print("⚠️ SQLite 3.35 미만이라 users.profile_image 컬럼을 남겨 둡니다 (값은 비어 있음).")
+        return
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE users DROP COLUMN profile_image"))
+
+# 버전 순서대로 한 번씩만 적용. 이미 배포된 마이그레이션은 수정하지 말고 새 버전을 추가
+MIGRATIONS = [
+    (1, "profile_images_to_store", migrate_profile_images),
+    (2, "users_first_skill_key", migrate_first_skill_keys),
+    (3, "users_indexes", migrate_users_indexes),
+    (4, "user_skills_backfill", migrate_user_skills),
+    (5, "mentor_search_fts", migrate_mentor_search),
+    (6, "cache_versions_seed", seed_cache_versions),
+    (7, "match_requests_meetings_fk_indexes", migrate_match_and_meeting_constraints),
+    (8, "meeting_intervals_rtree", migrate_meeting_intervals),
+    (9, "calendar_versions_triggers", migrate_calendar_versions),
+    (10, "meeting_day_counts", migrate_meeting_day_counts),
+    (11, "meeting_series", migrate_meeting_series),
+    (12, "match_request_versions", migrate_match_request_versions),
+    (13, "match_requests_active_pair_unique", migrate_match_request_active_pair),
+    (14, "profile_image_renditions", migrate_profile_image_renditions),
+    (15, "mentor_directory_version_triggers", migrate_mentor_directory_triggers),
+    (16, "calendar_counterpart_name_triggers", migrate_calendar_counterpart_triggers),
+    (17, "drop_users_profile_image_blob", migrate_drop_profile_image_blob),
+]
+
+def applied_migration_versions() -> set:
+    with SessionLocal() as db:
+        return set(db.scalars(select(SchemaMigration.version)))
+
+@contextmanager
+def migration_lock():
+    """
+    여러 uvicorn 워커나 import 하는 스크립트가 동시에 시작해도 버전 확인부터 적용까지 한 프로세스씩 하도록
+    잠금 전용 SQLite 파일에 EXCLUSIVE 트랜잭션을 잡는다 (본 DB 에 잡으면 마이그레이션 자신의 연결이 막힘).
+    """
+    conn = sqlite3.connect(MIGRATION_LOCK_PATH, timeout=MIGRATION_LOCK_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        conn.execute("BEGIN EXCLUSIVE")
+        yield
+    finally:
+        conn.close()  # 열린 트랜잭션은 닫을 때 롤백되어 잠금이 풀림
+
+def run_migrations() -> list:
+    """새 테이블을 만들고 아직 적용되지 않은 마이그레이션을 적용. 적용한 (버전, 이름) 목록 반환"""
+    with migration_lock():
+        Base.metadata.create_all(bind=engine)
+        os.makedirs(IMAGE_STORE_DIR, exist_ok=True)
+        applied = applied_migration_versions()
+        newly_applied = []
+        for version, name, migrate in MIGRATIONS:
+            if version in applied:
+                continue
+            migrate()
+            with SessionLocal() as db:
+                db.merge(SchemaMigration(version=version, name=name))
+                db.commit()
+            newly_applied.append((version, name))
+        return newly_applied
+
+# 데이터베이스 테이블 생성 및 마이그레이션 (여러 워커가 동시에 시작하면 잠금을 잡은 순서대로 한 번만 적용됨)
+if os.getenv("RUN_MIGRATIONS_ON_STARTUP", "1") == "1":
+    run_migrations()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -130,10 +1428,220 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-# 이미지 저장을 위한 uploads 디렉토리 생성
-os.makedirs("uploads", exist_ok=True)
+@app.on_event("shutdown")
+def shutdown_executors():
+    global image_executor
+    with image_executor_lock:
+        if image_executor is not None:
+            image_executor.shutdown(wait=False, cancel_futures=True)
+            image_executor = None
+    password_hasher.shutdown()
+    event_bus.shutdown()
+
+# 실시간 알림 이벤트 버스
+def encode_event_frame(event_type: str, data) -> bytes:
+    """SSE 프레임으로 한 번만 직렬화하여 모든 구독자가 같은 bytes 를 공유"""
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+EVENT_RESYNC_FRAME = encode_event_frame("resync", {})  # 밀린 이벤트를 버렸으니 목록을 다시 조회하라는 신호
+EVENT_HEARTBEAT_FRAME = b": ping\n\n"
+
+class EventSubscription:
+    """SSE 연결 하나의 대기열. 큐 크기가 제한되어 있어 느린 소비자도 연결당 메모리는 일정하다"""
+    
+    __slots__ = ("user_id", "loop", "queue", "overflows")
+    
+    def __init__(self, user_id: int, loop: asyncio.AbstractEventLoop, max_size: int):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue = asyncio.Queue(max_size)
+        self.overflows = 0
+    
+    def offer(self, frame: bytes):
+        """이벤트 루프 스레드에서만 호출. 큐가 가득 차면 밀린 이벤트를 버리고 resync 하나만 남긴다"""
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.overflows += 1
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(EVENT_RESYNC_FRAME)
+
+class InProcessEventBackend:
+    """단일 프로세스용 백엔드: 발행 즉시 같은 프로세스의 구독자에게 전달"""
+    
+    name = "memory"
+    local_only = True
+    
+    def start(self, deliver):
+        self.deliver = deliver
+    
+    def publish(self, user_ids: set, frame: bytes):
+        self.deliver(user_ids, frame)
+    
+    def shutdown(self):
+        pass
+
+class SQLiteEventBackend:
+    """
+    여러 워커용 백엔드: 공유 DB 의 event_outbox 테이블을 로컬 브로커로 사용.
+    
+    발행은 INSERT 한 번이고, 각 워커는 구독이 시작되면 띄우는 스레드에서 마지막으로 본 id 이후의 행을
+    PK 범위로 폴링하여 자기 프로세스의 구독자에게 전달한다 (발행한 워커도 같은 경로로 받음).
+    """
+    
+    name = "sqlite"
+    local_only = False
+    
+    def __init__(self, poll_interval: float, retention_seconds: float):
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.deliver = None
+        self.last_id = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def start(self, deliver):
+        self.deliver = deliver
+        with engine.connect() as conn:
+            self.last_id = conn.execute(select(func.max(EventOutbox.id))).scalar() or 0
+        self.thread = threading.Thread(target=self.poll_loop, name="event-outbox-poller", daemon=True)
+        self.thread.start()
+    
+    def publish(self, user_ids: set, frame: bytes):
+        now = time.time()
+        with engine.begin() as conn:
+            conn.execute(insert(EventOutbox).values(
+                user_ids=json.dumps(sorted(user_ids)), frame=frame.decode(), created_at=now
+            ))
+            conn.execute(EventOutbox.__table__.delete().where(EventOutbox.created_at < now - self.retention_seconds))
+    
+    def poll_loop(self):
+        while not self.stop_event.wait(self.poll_interval):
+            try:
+                self.poll_once()
+            except Exception:
+                # DB 가 잠시 잠겨 있어도 다음 주기에 이어서 읽음
+                continue
+    
+    def poll_once(self):
+        with engine.connect() as conn:
+            rows = conn.execute(
+                select(EventOutbox.id, EventOutbox.user_ids, EventOutbox.frame)
+                .where(EventOutbox.id > self.last_id).order_by(EventOutbox.id)
+            ).all()
+        for row_id, user_ids_json, frame in rows:
+            self.last_id = row_id
+            self.deliver(set(json.loads(user_ids_json)), frame.encode())
+    
+    def shutdown(self):
+        self.stop_event.set()
+
+EVENT_BACKENDS = {
+    "memory": InProcessEventBackend,
+    "sqlite": lambda: SQLiteEventBackend(EVENT_POLL_INTERVAL_SECONDS, EVENT_OUTBOX_RETENTION_SECONDS),
+}
+
+class EventBus:
+    """
+    사용자별 SSE 구독자에게 이벤트를 전달하는 프로세스 내 pub/sub.
+    
+    쓰기 엔드포인트는 커밋 후 publish 를 호출하고, 워커 간 전달은 backend 가 맡는다.
+    엔드포인트 스레드에서 발행해도 각 구독자의 이벤트 루프로 call_soon_threadsafe 를 통해 넘긴다.
+    """
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self.subscribers = {}  # user_id -> set[EventSubscription]
+        self.lock = threading.Lock()
+        self.started = False
+        self.published = 0
+        self.delivered = 0
+    
+    def ensure_started(self):
+        with self.lock:
+            if self.started:
+                return
+            self.started = True
+        self.backend.start(self.deliver)
+    
+    def subscribe(self, user_id: int, max_connections: int) -> Optional[EventSubscription]:
+        """이벤트 루프 안에서 호출. 개수 확인과 등록을 같은 잠금 안에서 하므로 동시 연결도 상한을 넘지 않으며, 넘으면 None"""
+        self.ensure_started()
+        subscription = EventSubscription(user_id, asyncio.get_running_loop(), EVENT_QUEUE_MAX_SIZE)
+        with self.lock:
+            subscriptions = self.subscribers.get(user_id, set())
+            if len(subscriptions) >= max_connections:
+                return None
+            subscriptions.add(subscription)
+            self.subscribers[user_id] = subscriptions
+        return subscription
+    
+    def unsubscribe(self, subscription: EventSubscription):
+        with self.lock:
+            subscriptions = self.subscribers.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscribers[subscription.user_id]
+    
+    def publish(self, user_ids, event_type: str, data):
+        """user_ids 에게 이벤트 발행. 전달 실패가 쓰기 요청을 실패시키지 않도록 예외는 삼킨다"""
+        user_ids = set(user_ids)
+        try:
+            if self.backend.local_only:
+                with self.lock:
+                    if not any(user_id in self.subscribers for user_id in user_ids):
+                        return
+            self.backend.publish(user_ids, encode_event_frame(event_type, data))
+            with self.lock:
+                self.published += 1
+        except Exception:
+            pass
+    
+    def deliver(self, user_ids: set, frame: bytes):
+        """backend 가 호출: 이 프로세스에 연결된 수신자 구독에 프레임을 넣음"""
+        with self.lock:
+            targets = [
+                subscription
+                for user_id in user_ids
+                for subscription in self.subscribers.get(user_id, ())
+            ]
+        delivered = 0
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, frame)
+                delivered += 1
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힌 연결
+                self.unsubscribe(subscription)
+        # 엔드포인트 스레드와 sqlite 폴링 스레드가 함께 호출하므로 카운터는 잠금 안에서 갱신
+        with self.lock:
+            self.delivered += delivered
+    
+    def shutdown(self):
+        self.backend.shutdown()
+    
+    def stats(self) -> dict:
+        with self.lock:
+            subscriptions = [subscription for group in self.subscribers.values() for subscription in group]
+            published, delivered = self.published, self.delivered
+        return {
+            "backend": self.backend.name,
+            "users": len({subscription.user_id for subscription in subscriptions}),
+            "connections": len(subscriptions),
+            "queued": sum(subscription.queue.qsize() for subscription in subscriptions),
+            "overflows": sum(subscription.overflows for subscription in subscriptions),
+            "published": published,
+            "delivered": delivered
+        }
+
+if EVENT_BUS_BACKEND not in EVENT_BACKENDS:
+    raise RuntimeError(f"Unknown EVENT_BUS_BACKEND: {EVENT_BUS_BACKEND}")
+event_bus = EventBus(EVENT_BACKENDS[EVENT_BUS_BACKEND]())
 
 # 의존성 함수들
 def get_db():
@@ -149,6 +1657,71 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password, hashed_password):
+    """(일치 여부, 비용이 낮은 해시라면 새 해시) 반환"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+class PasswordHasher:
+    """bcrypt 전용 프로세스 풀. 공용 스레드풀을 점유하지 않고, 대기열이 가득 차면 즉시 503 으로 거절"""
+    
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+        self.completed = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+    
+    def get_executor(self) -> ProcessPoolExecutor:
+        # import 하는 스크립트에서 프로세스가 생기지 않도록 지연 생성
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self.executor
+    
+    async def run(self, fn, *args):
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(status_code=503, detail="Server is busy, please retry", headers={"Retry-After": "1"})
+            self.pending += 1
+        
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self.get_executor().submit(fn, *args))
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.pending -= 1
+                self.completed += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+    
+    def shutdown(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+    
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "workers": self.workers,
+                "maxPending": self.max_pending,
+                "pending": self.pending,
+                "queued": max(self.pending - self.workers, 0),
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "avgLatencyMs": round(self.total_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+                "maxLatencyMs": round(self.max_seconds * 1000, 2),
+                "bcryptRounds": PASSWORD_BCRYPT_ROUNDS,
+            }
+
+password_hasher = PasswordHasher(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING)
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     now = datetime.utcnow()
@@ -172,18 +1745,173 @@ def create_access_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+def create_refresh_token(db: Session, user_id: int, family_id: Optional[str] = None) -> str:
+    """리프레시 토큰 행을 추가하고 서명된 토큰 반환 (commit 은 호출하는 쪽에서)"""
+    now = datetime.utcnow()
+    expire = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    jti = str(uuid.uuid4())
+    family_id = family_id or jti
+    
+    # 만료된 토큰은 서명 검증에서 거절되어 행이 필요 없으므로 발급할 때마다 그 사용자의 만료 행을 정리
+    db.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.expires_at <= now
+    ).delete(synchronize_session=False)
+    db.add(RefreshToken(jti=jti, user_id=user_id, family_id=family_id, expires_at=expire))
+    return jwt.encode({
+        "iss": "mentor-mentee-app",
+        "sub": str(user_id),
+        "aud": REFRESH_TOKEN_AUDIENCE,
+        "exp": expire,
+        "iat": now,
+        "jti": jti,
+        "fam": family_id
+    }, SECRET_KEY, algorithm=ALGORITHM)
+
+def prune_expired_refresh_tokens() -> int:
+    """오래 로그인하지 않은 사용자의 만료 행까지 모두 삭제하고 삭제 수 반환 (migrate.py --maintenance)"""
+    with engine.begin() as conn:
+        return conn.execute(
+            text("DELETE FROM refresh_tokens WHERE expires_at <= :now"), {"now": datetime.utcnow()}
+        ).rowcount
+
+def decode_refresh_token(token: str) -> dict:
+    """리프레시 토큰의 HMAC 서명과 만료를 검증하고 payload 반환
+    
+    폐기 여부는 refresh_tokens.revoked_at 으로만 판단한다. 여기서 먼저 거절하면 회전된 토큰의 재사용이
+    refresh_access_token 의 묶음 폐기 분기에 닿지 못해 탈취 감지가 재시작 후나 다른 워커에서만 동작한다.
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            audience=REFRESH_TOKEN_AUDIENCE,
+            issuer="mentor-mentee-app"
+        )
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    
+    if not payload.get("jti") or not payload.get("fam"):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    return payload
+
+class TokenDenylist:
+    """폐기된 토큰 jti 를 토큰 만료 시각까지만 보관하는 메모리 목록"""
+    
+    def __init__(self):
+        self.expires = {}  # jti -> exp (unix time)
+        self.heap = []  # (exp, jti), 만료된 항목 정리용
+        self.lock = threading.Lock()
+    
+    def add(self, jti: str, expires_at: float):
+        with self.lock:
+            self.purge_expired()
+            if expires_at > time.time():
+                self.expires[jti] = expires_at
+                heapq.heappush(self.heap, (expires_at, jti))
+    
+    def contains(self, jti: str) -> bool:
+        with self.lock:
+            expires_at = self.expires.get(jti)
+            return expires_at is not None and expires_at > time.time()
+    
+    def purge_expired(self):
+        now = time.time()
+        while self.heap and self.heap[0][0] <= now:
+            _, jti = heapq.heappop(self.heap)
+            self.expires.pop(jti, None)
+    
+    def stats(self) -> dict:
+        with self.lock:
+            self.purge_expired()
+            return {"size": len(self.expires)}
+
+token_denylist = TokenDenylist()
+
+class PrincipalCache:
+    """검증된 토큰의 해시 → 사용자 컬럼 값을 보관하는 LRU + TTL 캐시
+    
+    사용자별 세대(generation) 번호로 무효화하므로 프로필 변경 시 O(1)로 해당 사용자의 모든 토큰 항목이 무효가 된다.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries = OrderedDict()  # token_key -> (user_id, generation, expires_at, jti, values)
+        self.generations = {}  # user_id -> generation
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def generation(self, user_id: int) -> int:
+        with self.lock:
+            return self.generations.get(user_id, 0)
+    
+    def get(self, token_key: str) -> Optional[tuple]:
+        """(토큰 jti, 사용자 컬럼 값) 반환. 폐기 여부는 호출하는 쪽에서 jti 로 확인"""
+        with self.lock:
+            entry = self.entries.get(token_key)
+            if entry is not None:
+                user_id, generation, expires_at, jti, values = entry
+                if expires_at > time.time() and generation == self.generations.get(user_id, 0):
+                    self.entries.move_to_end(token_key)
+                    self.hits += 1
+                    return jti, values
+                del self.entries[token_key]
+            self.misses += 1
+            return None
+    
+    def put(self, token_key: str, user_id: int, generation: int, token_expires_at: float, jti: Optional[str], values: dict):
+        """조회 전에 받아 둔 generation 을 함께 저장하여 조회 도중 발생한 무효화를 놓치지 않음"""
+        expires_at = min(time.time() + self.ttl_seconds, token_expires_at)
+        with self.lock:
+            self.entries[token_key] = (user_id, generation, expires_at, jti, values)
+            self.entries.move_to_end(token_key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def invalidate_user(self, user_id: int):
+        with self.lock:
+            self.generations[user_id] = self.generations.get(user_id, 0) + 1
+            self.invalidations += 1
+    
+    def discard(self, token_key: str):
+        with self.lock:
+            self.entries.pop(token_key, None)
+    
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_MAX_ENTRIES, PRINCIPAL_CACHE_TTL_SECONDS)
+
+def user_column_values(user: "User") -> dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+def attach_cached_user(db: Session, values: dict) -> "User":
+    """캐시된 컬럼 값으로 User 를 만들어 SQL 없이 현재 세션에 연결 (변경 후 commit 하면 UPDATE 됨)"""
+    user = User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
-    if not credentials:
-        raise credentials_exception
-    
+
+def decode_access_token(token: str) -> dict:
+    """액세스 토큰의 서명과 표준 클레임을 검증하고 payload 반환"""
     try:
-        token = credentials.credentials
         payload = jwt.decode(
             token, 
             SECRET_KEY, 
@@ -191,20 +1919,68 @@ def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depen
             audience="mentor-mentee-client",
             issuer="mentor-mentee-app"
         )
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
     except JWTError as e:
         print(f"JWT Error: {e}")
-        raise credentials_exception
+        raise credentials_exception()
+    
+    if payload.get("sub") is None or token_denylist.contains(payload.get("jti")):
+        raise credentials_exception()
+    return payload
+
+def get_current_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security), db: Session = Depends(get_db)):
+    if not credentials:
+        raise credentials_exception()
+    
+    # 같은 토큰으로 다시 들어온 요청은 서명 검증과 SQL 없이 처리
+    token = credentials.credentials
+    token_key = hashlib.sha256(token.encode()).hexdigest()
+    cached = principal_cache.get(token_key)
+    if cached is not None:
+        jti, cached_values = cached
+        # 캐시 미스로 조회하는 도중 로그아웃되면 폐기된 토큰이 다시 캐시될 수 있으므로 적중해도 폐기 목록을 확인
+        if token_denylist.contains(jti):
+            principal_cache.discard(token_key)
+            raise credentials_exception()
+        return attach_cached_user(db, cached_values)
+    
+    payload = decode_access_token(token)
+    user_id: str = payload.get("sub")
     
     try:
+        generation = principal_cache.generation(int(user_id))
         user = db.query(User).filter(User.id == int(user_id)).first()
         if user is None:
-            raise credentials_exception
+            raise credentials_exception()
+        principal_cache.put(token_key, user.id, generation, payload["exp"], payload.get("jti"), user_column_values(user))
         return user
     except ValueError:
-        raise credentials_exception
+        raise credentials_exception()
+
+@dataclass(frozen=True)
+class Principal:
+    """검증된 JWT 클레임만으로 만든 가벼운 인증 주체 (DB 조회 없음)"""
+    id: int
+    role: str
+    email: str
+    name: str
+
+def get_current_principal(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)) -> Principal:
+    """id / role 만 필요한 엔드포인트용 의존성. 최신 프로필이 필요하면 get_current_user 를 사용"""
+    if not credentials:
+        raise credentials_exception()
+    return principal_from_token(credentials.credentials)
+
+def principal_from_token(token: str) -> Principal:
+    payload = decode_access_token(token)
+    try:
+        return Principal(
+            id=int(payload["sub"]),
+            role=payload.get("role"),
+            email=payload.get("email"),
+            name=payload.get("name")
+        )
+    except ValueError:
+        raise credentials_exception()
 
 # API 엔드포인트들
 
@@ -219,7 +1995,7 @@ def test_endpoint():
     return {"message": "API is working!", "timestamp": datetime.utcnow()}
 
 @app.get("/api/test-auth")
-def test_auth_endpoint(current_user: User = Depends(get_current_user)):
+def test_auth_endpoint(current_user: Principal = Depends(get_current_principal)):
     return {
         "message": "Authentication is working!",
         "user_id": current_user.id,
@@ -227,20 +2003,35 @@ def test_auth_endpoint(current_user: User = Depends(get_current_user)):
         "role": current_user.role
     }
 
+@app.get("/api/metrics")
+def get_metrics(x_metrics_token: Optional[str] = Header(None)):
+    """서버 내부 캐시/풀 상태 조회. 운영자만 METRICS_TOKEN 을 X-Metrics-Token 헤더로 보내 조회"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_metrics_token or not hmac.compare_digest(x_metrics_token, METRICS_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid metrics token")
+    return {
+        "principalCache": principal_cache.stats(),
+        "passwordHasher": password_hasher.stats(),
+        "tokenDenylist": token_denylist.stats(),
+        "mentorDirectoryCache": mentor_directory_cache.stats(),
+        "eventBus": event_bus.stats()
+    }
+
 # 1. 인증 엔드포인트들
 @app.post("/api/signup", status_code=201)
-def signup(user: UserSignup, db: Session = Depends(get_db)):
+async def signup(user: UserSignup, db: Session = Depends(get_db)):
     try:
         # 역할 유효성 검사
         if user.role not in ["mentor", "mentee"]:
             raise HTTPException(status_code=400, detail="Invalid role. Must be 'mentor' or 'mentee'")
         
         # 이메일 중복 확인
-        if db.query(User).filter(User.email == user.email).first():
+        if await run_in_threadpool(lambda: db.query(User.id).filter(User.email == user.email).first()):
             raise HTTPException(status_code=400, detail="Email already registered")
         
-        # 비밀번호 해싱
-        hashed_password = get_password_hash(user.password)
+        # 비밀번호 해싱 (전용 프로세스 풀)
+        hashed_password = await password_hasher.run(get_password_hash, user.password)
         
         # 사용자 생성
         db_user = User(
@@ -249,46 +2040,151 @@ def signup(user: UserSignup, db: Session = Depends(get_db)):
             name=user.name,
             role=user.role
         )
-        db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        
+        def save_user():
+            db.add(db_user)
+            if db_user.role == "mentor":
+                db.flush()  # ID를 얻기 위해 flush
+                index_mentor_search(db, db_user.id, db_user.name, "", [])
+            db.commit()
+        
+        await run_in_threadpool(save_user)
         
         return {"message": "User created successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.post("/api/login")
-def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: Session = Depends(get_db)):
     try:
         # 사용자 확인
-        db_user = db.query(User).filter(User.email == user.email).first()
-        if not db_user or not verify_password(user.password, db_user.hashed_password):
+        db_user = await run_in_threadpool(lambda: db.query(User).filter(User.email == user.email).first())
+        if not db_user:
             raise HTTPException(status_code=401, detail="Incorrect email or password")
         
-        # JWT 토큰 생성
-        access_token = create_access_token({
+        # 비밀번호 검증 (전용 프로세스 풀)
+        is_valid, new_hash = await password_hasher.run(verify_and_update_password, user.password, db_user.hashed_password)
+        if not is_valid:
+            raise HTTPException(status_code=401, detail="Incorrect email or password")
+        
+        token_data = {
             "user_id": db_user.id,
             "email": db_user.email,
             "name": db_user.name,
             "role": db_user.role
+        }
+        
+        # 설정과 비용이 다른 해시는 새 비용으로 교체
+        if new_hash:
+            db_user.hashed_password = new_hash
+        
+        # JWT 토큰 생성 (리프레시 토큰 행과 재해싱 결과를 한 번에 commit)
+        access_token = create_access_token(token_data)
+        refresh_token = create_refresh_token(db, token_data["user_id"])
+        await run_in_threadpool(db.commit)
+        if new_hash:
+            principal_cache.invalidate_user(token_data["user_id"])
+        
+        return {"token": access_token, "refreshToken": refresh_token}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.post("/api/token/refresh")
+def refresh_access_token(request: TokenRefresh, db: Session = Depends(get_db)):
+    """리프레시 토큰을 회전하며 새 액세스 토큰 발급 (bcrypt 없이 HMAC 검증 + 기본키 조회만 수행)"""
+    try:
+        payload = decode_refresh_token(request.refreshToken)
+        now = datetime.utcnow()
+        
+        # 조건부 UPDATE 로 회전하므로 같은 토큰으로 동시에 요청해도 한 번만 성공
+        rotated = db.query(RefreshToken).filter(
+            RefreshToken.jti == payload["jti"],
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+        
+        if rotated != 1:
+            # 이미 회전된 토큰의 재사용은 탈취로 보고 같은 묶음의 토큰을 모두 폐기
+            db.query(RefreshToken).filter(
+                RefreshToken.family_id == payload["fam"],
+                RefreshToken.revoked_at.is_(None)
+            ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+            db.commit()
+            raise HTTPException(status_code=401, detail="Invalid refresh token")
+        
+        user = db.query(User.id, User.email, User.name, User.role).filter(User.id == int(payload["sub"])).first()
+        if not user:
+            db.rollback()
+            raise HTTPException(status_code=401, detail="Invalid refresh token")
+        
+        access_token = create_access_token({
+            "user_id": user.id,
+            "email": user.email,
+            "name": user.name,
+            "role": user.role
         })
+        refresh_token = create_refresh_token(db, user.id, payload["fam"])
+        db.commit()
+        
+        return {"token": access_token, "refreshToken": refresh_token}
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.post("/api/logout")
+def logout(request: UserLogout, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security), db: Session = Depends(get_db)):
+    """현재 액세스 토큰과 (전달된 경우) 리프레시 토큰 묶음을 폐기"""
+    if not credentials:
+        raise credentials_exception()
+    
+    payload = decode_access_token(credentials.credentials)
+    try:
+        token_denylist.add(payload["jti"], payload["exp"])
+        principal_cache.discard(hashlib.sha256(credentials.credentials.encode()).hexdigest())
+        
+        if request.refreshToken:
+            refresh_payload = decode_refresh_token(request.refreshToken)
+            if refresh_payload["sub"] == payload["sub"]:
+                db.query(RefreshToken).filter(
+                    RefreshToken.family_id == refresh_payload["fam"],
+                    RefreshToken.revoked_at.is_(None)
+                ).update({RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False)
+                db.commit()
         
-        return {"token": access_token}
+        return {"message": "Logged out successfully"}
     except HTTPException:
         raise
     except Exception as e:
+        db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# 프로필 이미지 URL 헬퍼 함수
+def profile_image_url(role: str, user_id: int, image_hash: Optional[str], size: Optional[int] = None) -> str:
+    """이미지가 바뀌면 URL도 바뀌도록 콘텐츠 해시를 버전 파라미터로 붙임"""
+    url = f"/api/images/{role}/{user_id}"
+    params = []
+    if image_hash:
+        params.append(f"v={image_hash[:16]}")
+    if size:
+        params.append(f"size={size}")
+    if params:
+        url += "?" + "&".join(params)
+    return url
+
 # 사용자 정보 반환 헬퍼 함수
 def get_current_user_info(user: User):
     """사용자 정보를 API 명세서 형식으로 반환"""
     profile_data = {
         "name": user.name,
         "bio": user.bio,
-        "imageUrl": f"/api/images/{user.role}/{user.id}"
+        "imageUrl": profile_image_url(user.role, user.id, user.profile_image_hash)
     }
     
     # 멘토인 경우 기술스택 추가
@@ -306,6 +2202,26 @@ def get_current_user_info(user: User):
         "profile": profile_data
     }
 
+# 목록 카드용 사용자 요약 (이메일 제외, 소개는 앞부분만)
+USER_SUMMARY_COLUMNS = (User.role, User.name, User.bio, User.skills, User.profile_image_hash)
+
+def summarize_bio(bio: Optional[str]) -> str:
+    if not bio or len(bio) <= BIO_SUMMARY_LENGTH:
+        return bio or ""
+    return bio[:BIO_SUMMARY_LENGTH].rstrip() + "…"
+
+def user_summary(user_id: int, role: str, name: str, bio: Optional[str], skills_json: Optional[str], image_hash: Optional[str]) -> dict:
+    return {
+        "id": user_id,
+        "role": role,
+        "profile": {
+            "name": name,
+            "bio": summarize_bio(bio),
+            "imageUrl": profile_image_url(role, user_id, image_hash, IMAGE_LIST_SIZE),
+            "skills": parse_skills_json(skills_json)
+        }
+    }
+
 # 2. 사용자 정보 엔드포인트들
 @app.get("/api/me")
 def get_me(current_user: User = Depends(get_current_user)):
@@ -322,21 +2238,161 @@ def get_profile(current_user: User = Depends(get_current_user)):
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/api/users", response_class=ORJSONResponse)
+def get_users(ids: Optional[List[str]] = Query(None), current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """ids 는 반복(?ids=1&ids=2) 또는 쉼표 구분. 요청한 순서대로 요약 프로필을 반환하며 없는 id 는 건너뜀"""
+    try:
+        try:
+            user_ids = list(dict.fromkeys(int(value) for item in (ids or []) for value in item.split(",") if value.strip()))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid ids")
+        if len(user_ids) > USERS_BATCH_MAX_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {USERS_BATCH_MAX_IDS} ids can be requested")
+        if not user_ids:
+            return ORJSONResponse([])
+        
+        rows = db.query(User.id, *USER_SUMMARY_COLUMNS).filter(User.id.in_(user_ids)).all()
+        users = {row.id: row for row in rows}
+        
+        result = [user_summary(*users[user_id]) for user_id in user_ids if user_id in users]
+        return ORJSONResponse(result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+# 이미지 응답 헬퍼 함수들
+def detect_image_media_type(head: bytes) -> str:
+    """파일 시그니처로 이미지 MIME 타입 판별"""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+def parse_byte_range(range_header: Optional[str], size: int):
+    """단일 Range 헤더를 (start, end) 로 변환. 범위 요청이 아니면 None, 만족할 수 없으면 ValueError"""
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec:
+        # 다중 범위는 지원하지 않으므로 전체 응답으로 처리
+        return None
+    
+    start_text, sep, end_text = spec.partition("-")
+    if not sep:
+        return None
+    try:
+        if start_text == "":
+            # bytes=-N : 마지막 N 바이트
+            suffix = int(end_text)
+            if suffix <= 0:
+                raise ValueError("Unsatisfiable range")
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+            end = min(end, size - 1)
+    except ValueError:
+        raise ValueError("Unsatisfiable range")
+    
+    if start < 0 or start >= size or start > end:
+        raise ValueError("Unsatisfiable range")
+    return start, end
+
+def iter_mmap(mapped: mmap.mmap, start: int, end: int):
+    """메모리 맵에서 청크 단위로 바이트를 내보내고 끝나면 매핑 해제"""
+    try:
+        position = start
+        while position <= end:
+            chunk_end = min(position + IMAGE_CHUNK_SIZE, end + 1)
+            yield mapped[position:chunk_end]
+            position = chunk_end
+    finally:
+        mapped.close()
+
+def resolve_image_size(size: Optional[int]) -> int:
+    """요청 크기 이상인 가장 작은 렌더링 크기 선택 (없으면 가장 큰 크기)"""
+    if size is None:
+        return IMAGE_DEFAULT_SIZE
+    for candidate in IMAGE_SIZES:
+        if candidate >= size:
+            return candidate
+    return max(IMAGE_SIZES)
+
+def resolve_image_file(content_hash: str, size: int):
+    """렌더링 파일 경로와 ETag 반환. 렌더링 이전에 저장된 원본만 있으면 원본을 사용"""
+    path = image_store_path(content_hash, size)
+    if os.path.exists(path):
+        return path, f'"{content_hash}-{size}"'
+    path = image_store_path(content_hash)
+    if os.path.exists(path):
+        return path, f'"{content_hash}"'
+    return None, None
+
+def image_file_response(request: Request, content_hash: str, path: str, etag: str) -> Response:
+    """저장소 이미지를 ETag / 304 / Range / Cache-Control 을 지원하여 반환"""
+    version = request.query_params.get("v")
+    cache_control = IMAGE_CACHE_CONTROL_IMMUTABLE if version and content_hash.startswith(version) else IMAGE_CACHE_CONTROL_REVALIDATE
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return Response(content=b"", media_type="image/jpeg", headers=headers)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    media_type = detect_image_media_type(mapped[:12])
+    
+    # If-Range 가 현재 ETag와 다르면 Range를 무시하고 전체를 보냄
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range != etag:
+        range_header = None
+    
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        mapped.close()
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+    
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(iter_mmap(mapped, 0, size - 1), media_type=media_type, headers=headers)
+    
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(iter_mmap(mapped, start, end), status_code=206, media_type=media_type, headers=headers)
+
 @app.get("/api/images/{role}/{user_id}")
-def get_profile_image(role: str, user_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_profile_image(role: str, user_id: int, request: Request, size: Optional[int] = None,
+                      current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        # 이미지 바이트 대신 저장소 키만 조회
+        user = db.query(User.id, User.profile_image_hash).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        # 프로필 이미지가 있으면 반환, 없으면 기본 이미지 URL로 리다이렉트
-        if user.profile_image:
-            # 실제 구현에서는 임시 파일로 저장 후 반환
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-                tmp.write(user.profile_image)
-                tmp.flush()
-                return FileResponse(tmp.name, media_type="image/jpeg")
+        path, etag = None, None
+        if user.profile_image_hash:
+            path, etag = resolve_image_file(user.profile_image_hash, resolve_image_size(size))
+        
+        # 프로필 이미지가 있으면 저장소 파일을 반환, 없으면 기본 이미지 URL로 리다이렉트
+        if path:
+            return image_file_response(request, user.profile_image_hash, path, etag)
         else:
             # 기본 이미지로 리다이렉트
             if role == "mentor":
@@ -349,24 +2405,36 @@ def get_profile_image(role: str, user_id: int, current_user: User = Depends(get_
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/api/profile")
-def update_profile(profile: UserProfile, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+async def update_profile(profile: UserProfile, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    image_hash = None
+    if profile.image:
+        try:
+            # Base64 이미지 디코딩
+            image_data = base64.b64decode(profile.image)
+            # 검증, 메타데이터 제거, 크기별 렌더링은 프로세스 풀에서 처리 (요청 스레드를 점유하지 않고 대기)
+            image_hash = await process_profile_image(image_data)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid image format")
+    
+    return await run_in_threadpool(save_profile, db, current_user, profile, image_hash)
+
+def save_profile(db: Session, current_user: User, profile: UserProfile, image_hash: Optional[str]) -> dict:
     try:
         # 프로필 업데이트
         current_user.name = profile.name
         current_user.bio = profile.bio
-        
-        if profile.image:
-            try:
-                # Base64 이미지 디코딩
-                image_data = base64.b64decode(profile.image)
-                current_user.profile_image = image_data
-            except:
-                raise HTTPException(status_code=400, detail="Invalid image format")
+        if image_hash:
+            current_user.profile_image_hash = image_hash
         
         if current_user.role == "mentor" and profile.skills:
             current_user.skills = json.dumps(profile.skills)
+            sync_user_skills(db, current_user.id, profile.skills)
+        
+        if current_user.role == "mentor":
+            index_mentor_search(db, current_user.id, current_user.name, current_user.bio, parse_skills_json(current_user.skills))
         
         db.commit()
+        principal_cache.invalidate_user(current_user.id)
         
         # 업데이트된 정보 반환
         return get_current_user_info(current_user)
@@ -376,190 +2444,423 @@ def update_profile(profile: UserProfile, current_user: User = Depends(get_curren
         db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.put("/api/profile/image")
+async def upload_profile_image(request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """multipart/form-data 의 image 필드로 프로필 이미지를 업로드 (본문을 메모리에 모으지 않고 디스크로 스트리밍)"""
+    upload_dir = os.path.join(IMAGE_STORE_DIR, "incoming")
+    os.makedirs(upload_dir, exist_ok=True)
+    upload_path = os.path.join(upload_dir, f"{uuid.uuid4().hex}.upload")
+    try:
+        await receive_upload_file(request, "image", upload_path, IMAGE_UPLOAD_MAX_BYTES)
+        
+        try:
+            image_hash = await process_profile_image(upload_path)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid image format")
+        
+        current_user.profile_image_hash = image_hash
+        await run_in_threadpool(db.commit)
+        principal_cache.invalidate_user(current_user.id)
+        
+        return get_current_user_info(current_user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        await run_in_threadpool(db.rollback)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    finally:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
+
 # 3. 멘토 리스트 조회
+# 멘토 목록 정렬 기준별 정렬 컬럼 (항상 id 를 보조 키로 사용)
+MENTOR_ORDER_COLUMNS = {
+    "id": User.id,
+    "name": User.name,
+    "skill": User.first_skill_key,
+}
+
+def build_mentor_directory_page(db: Session, skill_keys: list, skill_match: str, order_by: Optional[str],
+                                q: Optional[str], limit: int, cursor: Optional[str]):
+    """멘토 목록 한 페이지를 조회하여 (응답 목록, 다음 페이지 커서) 반환"""
+    # 응답에 필요한 컬럼만 조회 (hashed_password 등은 읽지 않음)
+    query = db.query(
+        User.id, User.email, User.name, User.bio, User.skills, User.profile_image_hash
+    ).filter(User.role == "mentor")
+    
+    # 스킬 필터링 (user_skills 의 skill_key 인덱스로 대소문자 무시 정확 일치)
+    if skill_keys:
+        matching_users = select(UserSkill.user_id).where(UserSkill.skill_key.in_(skill_keys))
+        if skill_match == "all":
+            matching_users = matching_users.group_by(UserSkill.user_id).having(func.count() == len(skill_keys))
+        query = query.filter(User.id.in_(matching_users))
+    
+    # 전문 검색 (FTS5)
+    search = None
+    search_match = build_mentor_search_query(q) if q else None
+    if search_match:
+        search = mentor_search_subquery(search_match)
+        query = query.join(search, search.c.user_id == User.id)
+    
+    # 정렬 (DB 인덱스 (role, 정렬 컬럼, id) 순서로 조회, 검색어만 있으면 관련도 순)
+    if order_by in MENTOR_ORDER_COLUMNS:
+        order_key = order_by
+    else:
+        order_key = "relevance" if search is not None else "id"
+    order_column = search.c.score if order_key == "relevance" else MENTOR_ORDER_COLUMNS[order_key]
+    
+    # 키셋 페이지네이션: 이전 페이지 마지막 행의 (정렬 값, id) 이후부터 조회
+    if cursor:
+        position = decode_cursor(cursor)
+        if position.get("o") != order_key or not isinstance(position.get("k"), list) or len(position["k"]) != 2:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        last_value, last_id = position["k"]
+        # bool 은 int 의 하위 클래스이므로 따로 거름
+        if (not isinstance(last_value, (str, int, float)) or isinstance(last_value, bool)
+                or not isinstance(last_id, int) or isinstance(last_id, bool)):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if order_key == "id":
+            query = query.filter(User.id > last_id)
+        else:
+            query = query.filter(tuple_(order_column, User.id) > tuple_(last_value, last_id))
+    
+    if order_key == "id":
+        query = query.order_by(User.id)
+    else:
+        query = query.order_by(order_column, User.id)
+    
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    next_cursor = None
+    rows = query.add_columns(order_column.label("sort_value")).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"o": order_key, "k": [rows[-1].sort_value, rows[-1].id]})
+    
+    # 행 튜플에서 바로 응답 생성
+    result = [
+        {
+            "id": mentor_id,
+            "email": email,
+            "role": "mentor",
+            "profile": {
+                "name": name,
+                "bio": bio,
+                "imageUrl": profile_image_url("mentor", mentor_id, image_hash, IMAGE_LIST_SIZE),
+                "skills": parse_skills_json(skills_json)
+            }
+        }
+        for mentor_id, email, name, bio, skills_json, image_hash, _ in rows
+    ]
+    
+    return result, next_cursor
+
 @app.get("/api/mentors")
-def get_mentors(skill: Optional[str] = None, order_by: Optional[str] = None, 
-                current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_mentors(request: Request, skill: Optional[List[str]] = Query(None), skill_match: str = "any", order_by: Optional[str] = None,
+                q: Optional[str] = None, limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT), cursor: Optional[str] = None,
+                current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """skill 은 반복(?skill=a&skill=b) 또는 쉼표 구분으로 여러 개 지정 가능, skill_match=any|all
+    
+    q 는 이름/소개/스킬 전문 검색이며, order_by 가 없으면 BM25 관련도 순으로 정렬한다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려주며, 같은 조건에 cursor 를 붙여 다시 요청한다.
+    응답은 멘토 디렉터리 버전별로 캐시되며, ETag 가 같으면 304 를 반환한다.
+    """
     try:
         if current_user.role != "mentee":
             raise HTTPException(status_code=403, detail="Only mentees can access this endpoint")
+        if skill_match not in ["any", "all"]:
+            raise HTTPException(status_code=400, detail="Invalid skill_match. Must be 'any' or 'all'")
         
-        query = db.query(User).filter(User.role == "mentor")
+        skill_keys = sorted({normalize_skill_key(value) for item in (skill or []) for value in item.split(",") if value.strip()})
         
-        # 스킬 필터링
-        if skill:
-            query = query.filter(User.skills.contains(skill.lower()))
+        # 멘토가 가입하거나 프로필을 바꾸면 users 트리거가 버전을 올리므로 이전 버전의 캐시/ETag 는 자동으로 무효
+        version = get_cache_version(db, MENTOR_DIRECTORY_CACHE)
+        etag = f'"mentors-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
         
-        mentors = query.all()
+        cache_key = (tuple(skill_keys), skill_match, order_by, q, limit, cursor)
+        cached = mentor_directory_cache.get(version, cache_key)
+        if cached is None:
+            result, next_cursor = build_mentor_directory_page(db, skill_keys, skill_match, order_by, q, limit, cursor)
+            body = orjson.dumps(result)
+            cached = (body, next_cursor)
+            mentor_directory_cache.put(version, cache_key, cached)
         
-        # 정렬
-        if order_by == "name":
-            mentors.sort(key=lambda x: x.name)
-        elif order_by == "skill":
-            # 스킬 기준 정렬 (첫 번째 스킬 기준)
-            def get_first_skill(user):
-                try:
-                    skills = json.loads(user.skills) if user.skills else []
-                    return skills[0] if skills else ""
-                except:
-                    return ""
-            mentors.sort(key=get_first_skill)
-        else:
-            mentors.sort(key=lambda x: x.id)
-        
-        result = []
-        for mentor in mentors:
-            skills = []
-            if mentor.skills:
-                try:
-                    skills = json.loads(mentor.skills)
-                except:
-                    skills = []
-            
-            result.append({
-                "id": mentor.id,
-                "email": mentor.email,
-                "role": mentor.role,
-                "profile": {
-                    "name": mentor.name,
-                    "bio": mentor.bio,
-                    "imageUrl": f"/api/images/mentor/{mentor.id}",
-                    "skills": skills
-                }
-            })
-        
-        return result
+        body, next_cursor = cached
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return Response(content=body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # 4. 매칭 요청 엔드포인트들
+MATCH_REQUEST_COLUMNS = (
+    MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id,
+    MatchRequest.message, MatchRequest.status, MatchRequest.version
+)
+
+def match_request_response(row) -> dict:
+    return {
+        "id": row.id,
+        "mentorId": row.mentor_id,
+        "menteeId": row.mentee_id,
+        "message": row.message,
+        "status": row.status,
+        "version": row.version
+    }
+
 @app.post("/api/match-requests")
-def create_match_request(request: MatchRequestCreate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def create_match_request(request: MatchRequestCreate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         if current_user.role != "mentee":
             raise HTTPException(status_code=403, detail="Only mentees can send requests")
         
-        # 멘토 존재 확인
-        mentor = db.query(User).filter(User.id == request.mentorId, User.role == "mentor").first()
-        if not mentor:
-            raise HTTPException(status_code=400, detail="Mentor not found")
-        
-        # 이미 요청이 있는지 확인 (cancelled 상태 제외)
-        existing_request = db.query(MatchRequest).filter(
-            MatchRequest.mentor_id == request.mentorId,
-            MatchRequest.mentee_id == current_user.id,
-            MatchRequest.status.in_(["pending", "accepted"])
-        ).first()
-        
-        if existing_request:
+        # 멘토 확인과 생성을 INSERT ... SELECT 한 번으로 처리. 멘토 역할이 아니면 0 행이 삽입되고,
+        # 존재 여부는 외래 키가, 중복 요청은 부분 유니크 인덱스가 보장한다
+        mentor_row = select(
+            User.id,
+            literal(current_user.id, Integer),
+            literal(request.message, Text),
+            literal("pending", String),
+            literal(1, Integer),
+            literal(datetime.utcnow(), DateTime)
+        ).where(User.id == request.mentorId, User.role == "mentor")
+        try:
+            row = db.execute(
+                insert(MatchRequest).from_select(
+                    ["mentor_id", "mentee_id", "message", "status", "version", "created_at"], mentor_row
+                ).returning(*MATCH_REQUEST_COLUMNS)
+            ).first()
+        except IntegrityError:
+            db.rollback()
             raise HTTPException(status_code=400, detail="Request already exists")
-        
-        # 요청 생성
-        match_request = MatchRequest(
-            mentor_id=request.mentorId,
-            mentee_id=current_user.id,
-            message=request.message
-        )
-        db.add(match_request)
+        if row is None:
+            db.rollback()
+            raise HTTPException(status_code=400, detail="Mentor not found")
         db.commit()
-        db.refresh(match_request)
         
-        return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor_id,
-            "menteeId": match_request.mentee_id,
-            "message": match_request.message,
-            "status": match_request.status
-        }
+        response = match_request_response(row)
+        event_bus.publish([row.mentor_id], "match_request.created", response)
+        return response
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/api/match-requests/incoming")
-def get_incoming_requests(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+MATCH_REQUEST_STATUSES = ("pending", "accepted", "rejected", "cancelled")
+MATCH_REQUEST_COUNT_STATUSES = ("pending", "accepted", "rejected")
+
+def parse_match_request_statuses(status: Optional[List[str]]) -> list:
+    """status 는 반복(?status=a&status=b) 또는 쉼표 구분으로 여러 개 지정 가능"""
+    statuses = sorted({value.strip() for item in (status or []) for value in item.split(",") if value.strip()})
+    for value in statuses:
+        if value not in MATCH_REQUEST_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of {', '.join(MATCH_REQUEST_STATUSES)}")
+    return statuses
+
+def parse_match_request_expand(expand: Optional[str]) -> bool:
+    """expand=counterpart 이면 True"""
+    if expand is None:
+        return False
+    if expand != "counterpart":
+        raise HTTPException(status_code=400, detail="Invalid expand. Must be 'counterpart'")
+    return True
+
+def fetch_match_request_page(db: Session, columns: tuple, owner_column, owner_id: int,
+                             statuses: list, limit: int, cursor: Optional[str], counterpart_column=None):
+    """
+    받은/보낸 요청 한 페이지를 최신순으로 조회하여 (행 목록, 다음 페이지 커서) 반환.
+    
+    (mentor_id, status) / (mentee_id, status) 인덱스는 id 를 끝에 포함하므로
+    소유자 + 상태 조건과 id 키셋 조건이 모두 인덱스 안에서 처리된다.
+    counterpart_column 을 주면 상대방의 USER_SUMMARY_COLUMNS 를 같은 쿼리에 조인해 행 끝에 붙인다.
+    """
+    query = db.query(*columns).filter(owner_column == owner_id)
+    if counterpart_column is not None:
+        query = query.outerjoin(User, User.id == counterpart_column).add_columns(*USER_SUMMARY_COLUMNS)
+    if statuses:
+        query = query.filter(MatchRequest.status.in_(statuses))
+    
+    # 키셋 페이지네이션: 이전 페이지 마지막 요청 id 보다 작은 것부터 조회
+    if cursor:
+        position = decode_cursor(cursor)
+        if not isinstance(position.get("k"), int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(MatchRequest.id < position["k"])
+    
+    # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+    next_cursor = None
+    rows = query.order_by(MatchRequest.id.desc()).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor({"k": rows[-1].id})
+    
+    return rows, next_cursor
+
+def match_request_page_response(result: list, next_cursor: Optional[str]) -> ORJSONResponse:
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return ORJSONResponse(result, headers=headers)
+
+@app.get("/api/match-requests/incoming", response_class=ORJSONResponse)
+def get_incoming_requests(status: Optional[List[str]] = Query(None), limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+                          cursor: Optional[str] = None, expand: Optional[str] = None,
+                          current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """받은 요청을 최신순으로 반환. 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려준다.
+    
+    expand=counterpart 이면 각 요청에 멘티 요약 프로필(counterpart)을 함께 담는다.
+    """
     try:
         if current_user.role != "mentor":
             raise HTTPException(status_code=403, detail="Only mentors can access this endpoint")
         
-        requests = db.query(MatchRequest).filter(MatchRequest.mentor_id == current_user.id).all()
+        expand_counterpart = parse_match_request_expand(expand)
+        rows, next_cursor = fetch_match_request_page(
+            db,
+            (MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.message, MatchRequest.status),
+            MatchRequest.mentor_id, current_user.id, parse_match_request_statuses(status), limit, cursor,
+            counterpart_column=MatchRequest.mentee_id if expand_counterpart else None
+        )
         
         result = []
-        for req in requests:
-            result.append({
-                "id": req.id,
-                "mentorId": req.mentor_id,
-                "menteeId": req.mentee_id,
-                "message": req.message,
-                "status": req.status
-            })
+        for row in rows:
+            request_id, mentor_id, mentee_id, message, request_status = row[:5]
+            item = {
+                "id": request_id,
+                "mentorId": mentor_id,
+                "menteeId": mentee_id,
+                "message": message,
+                "status": request_status
+            }
+            if expand_counterpart:
+                item["counterpart"] = user_summary(mentee_id, *row[5:]) if row.role else None
+            result.append(item)
         
-        return result
+        return match_request_page_response(result, next_cursor)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/api/match-requests/outgoing")
-def get_outgoing_requests(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+@app.get("/api/match-requests/outgoing", response_class=ORJSONResponse)
+def get_outgoing_requests(status: Optional[List[str]] = Query(None), limit: int = Query(PAGE_DEFAULT_LIMIT, ge=1, le=PAGE_MAX_LIMIT),
+                          cursor: Optional[str] = None, expand: Optional[str] = None,
+                          current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """보낸 요청을 최신순으로 반환. 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려준다.
+    
+    expand=counterpart 이면 각 요청에 멘토 요약 프로필(counterpart)을 함께 담는다.
+    """
     try:
         if current_user.role != "mentee":
             raise HTTPException(status_code=403, detail="Only mentees can access this endpoint")
         
-        requests = db.query(MatchRequest).filter(MatchRequest.mentee_id == current_user.id).all()
+        expand_counterpart = parse_match_request_expand(expand)
+        rows, next_cursor = fetch_match_request_page(
+            db,
+            (MatchRequest.id, MatchRequest.mentor_id, MatchRequest.mentee_id, MatchRequest.status),
+            MatchRequest.mentee_id, current_user.id, parse_match_request_statuses(status), limit, cursor,
+            counterpart_column=MatchRequest.mentor_id if expand_counterpart else None
+        )
         
         result = []
-        for req in requests:
-            result.append({
-                "id": req.id,
-                "mentorId": req.mentor_id,
-                "menteeId": req.mentee_id,
-                "status": req.status
-            })
+        for row in rows:
+            request_id, mentor_id, mentee_id, request_status = row[:4]
+            item = {
+                "id": request_id,
+                "mentorId": mentor_id,
+                "menteeId": mentee_id,
+                "status": request_status
+            }
+            if expand_counterpart:
+                item["counterpart"] = user_summary(mentor_id, *row[4:]) if row.role else None
+            result.append(item)
+        
+        return match_request_page_response(result, next_cursor)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.get("/api/match-requests/counts", response_class=ORJSONResponse)
+def get_match_request_counts(current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """멘토는 받은 요청, 멘티는 보낸 요청의 상태별 개수를 GROUP BY 한 번으로 반환 (배지 표시용)"""
+    try:
+        owner_column = MatchRequest.mentor_id if current_user.role == "mentor" else MatchRequest.mentee_id
         
-        return result
+        # (소유자, status) 인덱스만 읽는 집계
+        rows = db.query(MatchRequest.status, func.count()).filter(
+            owner_column == current_user.id,
+            MatchRequest.status.in_(MATCH_REQUEST_COUNT_STATUSES)
+        ).group_by(MatchRequest.status).all()
+        
+        counts = dict.fromkeys(MATCH_REQUEST_COUNT_STATUSES, 0)
+        counts.update(rows)
+        return ORJSONResponse(counts)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
+def transition_match_request(db: Session, request_id: int, owner_column, owner_id: int,
+                             target_status: str, expected_version: Optional[int], from_statuses=("pending",)):
+    """
+    from_statuses 상태인 요청만 target_status 로 바꾸는 조건부 UPDATE 한 번. 바뀐 행은 RETURNING 으로 받아 다시 읽지 않음.
+    
+    동시에 들어온 다른 전이가 먼저 커밋되면 WHERE 의 상태/버전 조건에 걸려 0 행이 되므로
+    그때만 현재 행을 읽어 404/409 를 가린다. 이미 target_status 이면 멱등하게 현재 행을 반환.
+    """
+    conditions = [MatchRequest.id == request_id, owner_column == owner_id, MatchRequest.status.in_(from_statuses)]
+    if expected_version is not None:
+        conditions.append(MatchRequest.version == expected_version)
+    row = db.execute(
+        update(MatchRequest).where(*conditions)
+        .values(status=target_status, version=MatchRequest.version + 1)
+        .returning(*MATCH_REQUEST_COLUMNS)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is not None:
+        return row, True
+    
+    current = db.query(*MATCH_REQUEST_COLUMNS).filter(MatchRequest.id == request_id, owner_column == owner_id).first()
+    if current is None:
+        raise HTTPException(status_code=404, detail="Match request not found")
+    if expected_version is not None and current.version != expected_version:
+        raise HTTPException(status_code=409, detail="Match request was modified")
+    if current.status != target_status:
+        raise HTTPException(status_code=409, detail=f"Match request is already {current.status}")
+    return current, False
+
 @app.put("/api/match-requests/{request_id}/accept")
-def accept_match_request(request_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def accept_match_request(request_id: int, version: Optional[int] = None, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         if current_user.role != "mentor":
             raise HTTPException(status_code=403, detail="Only mentors can accept requests")
         
-        match_request = db.query(MatchRequest).filter(
-            MatchRequest.id == request_id,
-            MatchRequest.mentor_id == current_user.id
-        ).first()
-        
-        if not match_request:
-            raise HTTPException(status_code=404, detail="Match request not found")
-        
-        # 다른 요청들을 거절 처리
-        other_requests = db.query(MatchRequest).filter(
-            MatchRequest.mentor_id == current_user.id,
-            MatchRequest.status == "pending",
-            MatchRequest.id != request_id
-        ).all()
-        
-        for req in other_requests:
-            req.status = "rejected"
+        row, changed = transition_match_request(db, request_id, MatchRequest.mentor_id, current_user.id, "accepted", version)
         
-        match_request.status = "accepted"
+        # 다른 요청들을 한 번의 UPDATE 로 거절 처리
+        rejected_rows = []
+        if changed:
+            rejected_rows = db.execute(
+                update(MatchRequest).where(
+                    MatchRequest.mentor_id == current_user.id,
+                    MatchRequest.status == "pending",
+                    MatchRequest.id != request_id
+                ).values(status="rejected", version=MatchRequest.version + 1)
+                .returning(*MATCH_REQUEST_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).all()
         db.commit()
         
-        return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor_id,
-            "menteeId": match_request.mentee_id,
-            "message": match_request.message,
-            "status": match_request.status
-        }
+        response = match_request_response(row)
+        if changed:
+            event_bus.publish([row.mentee_id], "match_request.accepted", response)
+        for rejected_row in rejected_rows:
+            event_bus.publish([rejected_row.mentee_id], "match_request.rejected", match_request_response(rejected_row))
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -567,29 +2868,18 @@ def accept_match_request(request_id: int, current_user: User = Depends(get_curre
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/api/match-requests/{request_id}/reject")
-def reject_match_request(request_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def reject_match_request(request_id: int, version: Optional[int] = None, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         if current_user.role != "mentor":
             raise HTTPException(status_code=403, detail="Only mentors can reject requests")
         
-        match_request = db.query(MatchRequest).filter(
-            MatchRequest.id == request_id,
-            MatchRequest.mentor_id == current_user.id
-        ).first()
-        
-        if not match_request:
-            raise HTTPException(status_code=404, detail="Match request not found")
-        
-        match_request.status = "rejected"
+        row, changed = transition_match_request(db, request_id, MatchRequest.mentor_id, current_user.id, "rejected", version)
         db.commit()
         
-        return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor_id,
-            "menteeId": match_request.mentee_id,
-            "message": match_request.message,
-            "status": match_request.status
-        }
+        response = match_request_response(row)
+        if changed:
+            event_bus.publish([row.mentee_id], "match_request.rejected", response)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -597,29 +2887,22 @@ def reject_match_request(request_id: int, current_user: User = Depends(get_curre
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.delete("/api/match-requests/{request_id}")
-def cancel_match_request(request_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def cancel_match_request(request_id: int, version: Optional[int] = None, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         if current_user.role != "mentee":
             raise HTTPException(status_code=403, detail="Only mentees can cancel requests")
         
-        match_request = db.query(MatchRequest).filter(
-            MatchRequest.id == request_id,
-            MatchRequest.mentee_id == current_user.id
-        ).first()
-        
-        if not match_request:
-            raise HTTPException(status_code=404, detail="Match request not found")
-        
-        match_request.status = "cancelled"
+        # 수락된 매칭도 멘티가 끝낼 수 있어야 같은 멘토에게 다시 요청할 수 있음
+        row, changed = transition_match_request(
+            db, request_id, MatchRequest.mentee_id, current_user.id, "cancelled", version,
+            from_statuses=("pending", "accepted")
+        )
         db.commit()
         
-        return {
-            "id": match_request.id,
-            "mentorId": match_request.mentor_id,
-            "menteeId": match_request.mentee_id,
-            "message": match_request.message,
-            "status": match_request.status
-        }
+        response = match_request_response(row)
+        if changed:
+            event_bus.publish([row.mentor_id], "match_request.cancelled", response)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -630,8 +2913,44 @@ def cancel_match_request(request_id: int, current_user: User = Depends(get_curre
 # 미팅 관리 API
 # ========================
 
+def meeting_counterpart(meeting, user_id: int):
+    """미팅에서 user_id 의 상대방 (id, 역할)"""
+    if meeting.mentor_id == user_id:
+        return meeting.mentee_id, "mentee"
+    return meeting.mentor_id, "mentor"
+
+def fetch_meeting_counterparts(db: Session, meetings, user_id: int, *columns) -> dict:
+    """미팅 목록의 상대방 사용자들을 필요한 컬럼만 한 번의 쿼리로 조회해 id -> 행 dict 로 반환"""
+    other_ids = {meeting_counterpart(meeting, user_id)[0] for meeting in meetings}
+    if not other_ids:
+        return {}
+    rows = db.query(User.id, *columns).filter(User.id.in_(other_ids)).all()
+    return {row.id: row for row in rows}
+
+def commit_with_participants(db: Session):
+    """참가자 외래 키 위반(존재하지 않는 사용자)을 500 대신 400 으로 돌려줌"""
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="User not found")
+
+def meeting_response(meeting: Meeting) -> dict:
+    return {
+        "id": meeting.id,
+        "mentorId": meeting.mentor_id,
+        "menteeId": meeting.mentee_id,
+        "title": meeting.title,
+        "description": meeting.description,
+        "startTime": meeting.start_time.isoformat(),
+        "endTime": meeting.end_time.isoformat(),
+        "status": meeting.status,
+        "meetingLink": meeting.meeting_link,
+        "createdAt": meeting.created_at.isoformat()
+    }
+
 @app.post("/api/meetings")
-def create_meeting(meeting: MeetingCreate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def create_meeting(meeting: MeetingCreate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         # 멘토만 미팅을 생성할 수 있거나, 본인 관련 미팅만 생성 가능
         if current_user.role == "mentor" and meeting.mentorId != current_user.id:
@@ -639,16 +2958,12 @@ def create_meeting(meeting: MeetingCreate, current_user: User = Depends(get_curr
         elif current_user.role == "mentee" and meeting.menteeId != current_user.id:
             raise HTTPException(status_code=403, detail="Can only create meetings for yourself")
         
-        # 시간 충돌 확인
-        existing_meeting = db.query(Meeting).filter(
-            ((Meeting.mentor_id == meeting.mentorId) | (Meeting.mentee_id == meeting.menteeId)),
-            Meeting.status == "scheduled",
-            ((Meeting.start_time <= meeting.startTime) & (Meeting.end_time > meeting.startTime)) |
-            ((Meeting.start_time < meeting.endTime) & (Meeting.end_time >= meeting.endTime)) |
-            ((Meeting.start_time >= meeting.startTime) & (Meeting.end_time <= meeting.endTime))
-        ).first()
+        if naive_datetime(meeting.endTime) <= naive_datetime(meeting.startTime):
+            raise HTTPException(status_code=400, detail="End time must be after start time")
         
-        if existing_meeting:
+        # 시간 충돌 확인 (검사부터 저장까지 쓰기 잠금 유지)
+        begin_booking_transaction(db)
+        if find_conflicting_meeting(db, (meeting.mentorId, meeting.menteeId), meeting.startTime, meeting.endTime):
             raise HTTPException(status_code=400, detail="Time slot conflicts with existing meeting")
         
         db_meeting = Meeting(
@@ -662,43 +2977,191 @@ def create_meeting(meeting: MeetingCreate, current_user: User = Depends(get_curr
         )
         
         db.add(db_meeting)
-        db.commit()
+        commit_with_participants(db)
         db.refresh(db_meeting)
         
-        return {
-            "id": db_meeting.id,
-            "mentorId": db_meeting.mentor_id,
-            "menteeId": db_meeting.mentee_id,
-            "title": db_meeting.title,
-            "description": db_meeting.description,
-            "startTime": db_meeting.start_time.isoformat(),
-            "endTime": db_meeting.end_time.isoformat(),
-            "status": db_meeting.status,
-            "meetingLink": db_meeting.meeting_link,
-            "createdAt": db_meeting.created_at.isoformat()
-        }
+        response = meeting_response(db_meeting)
+        event_bus.publish([db_meeting.mentor_id, db_meeting.mentee_id], "meeting.created", response)
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+def bulk_meeting_error(index: int, status_code: int, detail: str) -> dict:
+    return {"index": index, "status": "error", "statusCode": status_code, "detail": detail}
+
+@app.post("/api/meetings/bulk")
+def create_meetings_bulk(bulk: MeetingBulkCreate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """
+    여러 미팅을 한 트랜잭션(커밋 1번)으로 생성하고 항목별 결과를 반환.
+    
+    참가자마다 기간 전체의 예정된 미팅/반복 회차를 한 번에 읽은 뒤, 항목을 시작 시각 순으로
+    한 번 훑으며 기존 일정 및 먼저 받아들인 항목과의 충돌을 검사한다.
+    mode=all_or_nothing 이면 하나라도 실패할 때 아무것도 만들지 않고 400 과 항목별 결과를 반환한다.
+    """
+    try:
+        if bulk.mode not in ("all_or_nothing", "best_effort"):
+            raise HTTPException(status_code=400, detail="Invalid mode")
+        if not bulk.meetings:
+            raise HTTPException(status_code=400, detail="No meetings given")
+        if len(bulk.meetings) > BULK_MEETINGS_MAX_ITEMS:
+            raise HTTPException(status_code=400, detail=f"Cannot create more than {BULK_MEETINGS_MAX_ITEMS} meetings at once")
+        
+        results = [None] * len(bulk.meetings)
+        candidates = []
+        for index, meeting in enumerate(bulk.meetings):
+            # 멘토만 미팅을 생성할 수 있거나, 본인 관련 미팅만 생성 가능
+            if current_user.role == "mentor" and meeting.mentorId != current_user.id:
+                results[index] = bulk_meeting_error(index, 403, "Can only create meetings for yourself")
+            elif current_user.role == "mentee" and meeting.menteeId != current_user.id:
+                results[index] = bulk_meeting_error(index, 403, "Can only create meetings for yourself")
+            elif naive_datetime(meeting.endTime) <= naive_datetime(meeting.startTime):
+                results[index] = bulk_meeting_error(index, 400, "End time must be after start time")
+            else:
+                candidates.append((naive_datetime(meeting.startTime), naive_datetime(meeting.endTime), index))
+        
+        # 시간 충돌 확인 (검사부터 저장까지 쓰기 잠금 유지)
+        begin_booking_transaction(db)
+        participant_ids = {user_id for _, _, index in candidates for user_id in (bulk.meetings[index].mentorId, bulk.meetings[index].menteeId)}
+        existing_ids = {row.id for row in db.query(User.id).filter(User.id.in_(participant_ids))} if participant_ids else set()
+        busy = {}
+        if candidates:
+            window_start = min(start_time for start_time, _, _ in candidates)
+            window_end = max(end_time for _, end_time, _ in candidates)
+            busy = {
+                user_id: merge_busy_intervals(fetch_busy_intervals(db, user_id, window_start, window_end))
+                for user_id in participant_ids & existing_ids
+            }
+        positions = {user_id: 0 for user_id in busy}
+        accepted_until = {}  # 참가자별로 이번 요청에서 받아들인 항목의 가장 늦은 끝 시각
+        
+        accepted = []
+        for start_time, end_time, index in sorted(candidates):
+            meeting = bulk.meetings[index]
+            participants = {meeting.mentorId, meeting.menteeId}
+            if not participants <= existing_ids:
+                results[index] = bulk_meeting_error(index, 400, "User not found")
+                continue
+            conflict = False
+            for user_id in participants:
+                user_busy = busy[user_id]
+                while positions[user_id] < len(user_busy) and user_busy[positions[user_id]][1] <= start_time:
+                    positions[user_id] += 1
+                if positions[user_id] < len(user_busy) and user_busy[positions[user_id]][0] < end_time:
+                    conflict = True
+                if accepted_until.get(user_id, start_time) > start_time:
+                    conflict = True
+            if conflict:
+                results[index] = bulk_meeting_error(index, 400, "Time slot conflicts with existing meeting")
+                continue
+            for user_id in participants:
+                accepted_until[user_id] = max(accepted_until.get(user_id, end_time), end_time)
+            accepted.append(index)
+        
+        failed = len(bulk.meetings) - len(accepted)
+        if failed and bulk.mode == "all_or_nothing":
+            db.rollback()
+            for index in accepted:
+                results[index] = {"index": index, "status": "skipped"}
+            return ORJSONResponse(
+                status_code=400,
+                content={"detail": "Some meetings could not be created", "created": 0, "results": results}
+            )
+        
+        db_meetings = [
+            Meeting(
+                mentor_id=bulk.meetings[index].mentorId,
+                mentee_id=bulk.meetings[index].menteeId,
+                title=bulk.meetings[index].title,
+                description=bulk.meetings[index].description,
+                start_time=bulk.meetings[index].startTime,
+                end_time=bulk.meetings[index].endTime,
+                meeting_link=bulk.meetings[index].meetingLink
+            )
+            for index in accepted
+        ]
+        db.add_all(db_meetings)
+        db.flush()
+        # commit 후에는 속성이 만료되어 행마다 다시 읽으므로 flush 직후에 응답을 만듦
+        for index, db_meeting in zip(accepted, db_meetings):
+            results[index] = {"index": index, "status": "created", "meeting": meeting_response(db_meeting)}
+        db.commit()
+        
+        # 참가자마다 자기 미팅만 담아 이벤트 하나씩 발행
+        created_by_user = {}
+        for index in accepted:
+            meeting_data = results[index]["meeting"]
+            for user_id in (meeting_data["mentorId"], meeting_data["menteeId"]):
+                created_by_user.setdefault(user_id, []).append(meeting_data)
+        for user_id, meetings in created_by_user.items():
+            event_bus.publish([user_id], "meetings.created", meetings)
+        
+        return ORJSONResponse({"created": len(db_meetings), "results": results})
     except HTTPException:
         raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/api/meetings")
-def get_meetings(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def occurrence_fields(meeting) -> dict:
+    """반복 회차면 시리즈 id 와 규칙상 원래 시작 시각 (단일 미팅이면 빈 dict)"""
+    if not isinstance(meeting, MeetingOccurrence):
+        return {}
+    return {"seriesId": meeting.series_id, "occurrenceStart": meeting.occurrence_start.isoformat()}
+
+@app.get("/api/meetings", response_class=ORJSONResponse)
+def get_meetings(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    내 미팅 목록 (최근 시작 순).
+    
+    start/end 를 주면 단일 미팅과 반복 회차 모두 그 기간과 겹치는 것만 반환한다. 하나만 주면 다른 쪽은
+    SERIES_DEFAULT_WINDOW_DAYS 일 떨어진 시각이며, 기간은 MEETINGS_RANGE_MAX_DAYS 일을 넘을 수 없다.
+    둘 다 없으면 단일 미팅은 전부 반환하고 반복 회차는 지금부터 SERIES_DEFAULT_WINDOW_DAYS 일 안에서만 펼친다.
+    """
+    window = timedelta(days=SERIES_DEFAULT_WINDOW_DAYS)
+    try:
+        if start is None and end is None:
+            window_start = datetime.utcnow()
+            window_end = window_start + window
+        else:
+            window_start = naive_datetime(start) if start is not None else naive_datetime(end) - window
+            window_end = naive_datetime(end) if end is not None else window_start + window
+    except OverflowError:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+    if window_end <= window_start:
+        raise HTTPException(status_code=400, detail="End time must be after start time")
+    if window_end - window_start > timedelta(days=MEETINGS_RANGE_MAX_DAYS):
+        raise HTTPException(status_code=400, detail=f"Range cannot exceed {MEETINGS_RANGE_MAX_DAYS} days")
+    
     try:
-        meetings = db.query(Meeting).filter(
+        query = db.query(
+            Meeting.id, Meeting.mentor_id, Meeting.mentee_id, Meeting.title, Meeting.description,
+            Meeting.start_time, Meeting.end_time, Meeting.status, Meeting.meeting_link, Meeting.created_at
+        ).filter(
             (Meeting.mentor_id == current_user.id) | (Meeting.mentee_id == current_user.id)
-        ).order_by(Meeting.start_time.desc()).all()
+        )
+        if start is not None or end is not None:
+            query = query.filter(Meeting.end_time > window_start, Meeting.start_time < window_end)
+        meetings = query.order_by(Meeting.start_time.desc()).all()
+        
+        occurrences = fetch_user_occurrences(db, current_user.id, window_start, window_end)
+        if occurrences:
+            meetings = sorted([*meetings, *occurrences], key=lambda meeting: meeting.start_time, reverse=True)
+        
+        # 상대방 정보는 한 번에 가져오기
+        counterparts = fetch_meeting_counterparts(db, meetings, current_user.id, User.name, User.email)
         
         result = []
         for meeting in meetings:
-            # 상대방 정보 가져오기
-            if meeting.mentor_id == current_user.id:
-                other_user = db.query(User).filter(User.id == meeting.mentee_id).first()
-                other_role = "mentee"
-            else:
-                other_user = db.query(User).filter(User.id == meeting.mentor_id).first()
-                other_role = "mentor"
+            other_id, other_role = meeting_counterpart(meeting, current_user.id)
+            other_user = counterparts.get(other_id)
             
             result.append({
                 "id": meeting.id,
@@ -716,64 +3179,262 @@ def get_meetings(current_user: User = Depends(get_current_user), db: Session = D
                     "name": other_user.name if other_user else "Unknown",
                     "email": other_user.email if other_user else "",
                     "role": other_role
-                }
+                },
+                **occurrence_fields(meeting)
             })
         
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.get("/api/meetings/calendar/{year}/{month}")
-def get_calendar_meetings(year: int, month: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def build_calendar_days(db: Session, user_id: int, range_start: datetime, range_end: datetime) -> dict:
+    """[range_start, range_end) 에 시작하는 미팅과 반복 회차를 날짜별로 묶은 달력 데이터"""
+    meetings = db.query(
+        Meeting.id, Meeting.mentor_id, Meeting.mentee_id, Meeting.title,
+        Meeting.start_time, Meeting.end_time, Meeting.status
+    ).filter(
+        (Meeting.mentor_id == user_id) | (Meeting.mentee_id == user_id),
+        Meeting.start_time >= range_start,
+        Meeting.start_time < range_end
+    ).order_by(Meeting.start_time).all()
+    occurrences = [
+        occurrence for occurrence in fetch_user_occurrences(db, user_id, range_start, range_end)
+        if occurrence.start_time >= range_start
+    ]
+    meetings = list(heapq.merge(meetings, occurrences, key=lambda meeting: meeting.start_time))
+    
+    # 상대방 정보는 한 번에 가져오기
+    counterparts = fetch_meeting_counterparts(db, meetings, user_id, User.name)
+    
+    # 날짜별로 미팅 그룹화
+    calendar_data = {}
+    for meeting in meetings:
+        date_key = meeting.start_time.date().isoformat()
+        if date_key not in calendar_data:
+            calendar_data[date_key] = []
+        
+        other_id, other_role = meeting_counterpart(meeting, user_id)
+        other_user = counterparts.get(other_id)
+        
+        calendar_data[date_key].append({
+            "id": meeting.id,
+            "title": meeting.title,
+            "startTime": meeting.start_time.strftime('%H:%M'),
+            "endTime": meeting.end_time.strftime('%H:%M'),
+            "status": meeting.status,
+            "otherUser": {
+                "name": other_user.name if other_user else "Unknown",
+                "role": other_role
+            },
+            **occurrence_fields(meeting)
+        })
+    return calendar_data
+
+def build_calendar_day_counts(db: Session, user_id: int, first_day: date, last_day: date) -> dict:
+    """미리 집계된 meeting_day_counts 에 기간 안의 반복 회차를 더한 날짜별 전체 수와 상태별 수"""
+    rows = db.query(MeetingDayCount.day, MeetingDayCount.status, MeetingDayCount.count).filter(
+        MeetingDayCount.user_id == user_id,
+        MeetingDayCount.day >= first_day.isoformat(),
+        MeetingDayCount.day <= last_day.isoformat()
+    ).order_by(MeetingDayCount.day).all()
+    
+    range_start = datetime.combine(first_day, datetime.min.time())
+    range_end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+    occurrence_rows = [
+        (occurrence.start_time.date().isoformat(), occurrence.status, 1)
+        for occurrence in fetch_user_occurrences(db, user_id, range_start, range_end)
+        if occurrence.start_time >= range_start
+    ]
+    
+    calendar_data = {}
+    for day, meeting_status, count in [*rows, *occurrence_rows]:
+        bucket = calendar_data.setdefault(day, {"total": 0, "statuses": {}})
+        bucket["total"] += count
+        bucket["statuses"][meeting_status] = bucket["statuses"].get(meeting_status, 0) + count
+    return dict(sorted(calendar_data.items()))
+
+@app.get("/api/meetings/calendar")
+def get_calendar_range(
+    request: Request,
+    start: date,
+    end: date,
+    view: str = Query("full", pattern="^(full|counts)$"),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    start ~ end (포함) 날짜의 달력. 여러 달을 한 번에 받아 이웃한 달을 미리 가져올 수 있다.
+    
+    view=counts 는 미팅 목록 대신 날짜별 전체 수와 상태별 수만 반환한다 (연간/히트맵 보기용).
+    ETag 는 사용자의 달력 버전이므로 미팅이나 상대방 이름이 바뀌기 전까지 304 로 재검증된다.
+    """
     try:
-        from calendar import monthrange
-        import calendar
+        if end < start:
+            raise HTTPException(status_code=400, detail="End date must not be before start date")
+        if (end - start).days + 1 > CALENDAR_RANGE_MAX_DAYS:
+            raise HTTPException(status_code=400, detail=f"Range cannot exceed {CALENDAR_RANGE_MAX_DAYS} days")
         
-        # 해당 월의 첫날과 마지막날 계산
+        version = get_calendar_versions(db, (current_user.id,))[current_user.id]
+        etag = f'"calendar-{version}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        if view == "counts":
+            calendar_data = build_calendar_day_counts(db, current_user.id, start, end)
+        else:
+            range_start = datetime.combine(start, datetime.min.time())
+            range_end = datetime.combine(end + timedelta(days=1), datetime.min.time())
+            calendar_data = build_calendar_days(db, current_user.id, range_start, range_end)
+        return Response(content=orjson.dumps(calendar_data), media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.get("/api/meetings/calendar/{year}/{month}", response_class=ORJSONResponse)
+def get_calendar_meetings(year: int, month: int, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    try:
+        # 해당 월의 첫날과 다음 달 첫날 계산
         first_day = datetime(year, month, 1)
-        last_day_num = monthrange(year, month)[1]
-        last_day = datetime(year, month, last_day_num, 23, 59, 59)
+        last_day_num = calendar.monthrange(year, month)[1]
+        next_month_day = first_day + timedelta(days=last_day_num)
         
-        meetings = db.query(Meeting).filter(
-            (Meeting.mentor_id == current_user.id) | (Meeting.mentee_id == current_user.id),
-            Meeting.start_time >= first_day,
-            Meeting.start_time <= last_day
-        ).order_by(Meeting.start_time).all()
+        return ORJSONResponse(build_calendar_days(db, current_user.id, first_day, next_month_day))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+def parse_work_time(value: Optional[str], name: str) -> Optional[int]:
+    """"HH:MM" 을 자정부터의 분으로 변환 ("24:00" 허용)"""
+    if value is None:
+        return None
+    match = re.fullmatch(r"(\d{1,2}):(\d{2})", value)
+    minutes = int(match.group(1)) * 60 + int(match.group(2)) if match else -1
+    if not match or int(match.group(2)) > 59 or not 0 <= minutes <= 24 * 60:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+    return minutes
+
+def availability_windows(range_start: datetime, range_end: datetime, work_start: Optional[int], work_end: Optional[int]):
+    """조회 기간을 날짜별 근무 시간 창으로 나눔. 근무 시간이 없으면 기간 전체가 한 창"""
+    if work_start is None:
+        yield range_start, range_end
+        return
+    day = datetime.combine(range_start.date(), datetime.min.time())
+    while day < range_end:
+        window_start = max(day + timedelta(minutes=work_start), range_start)
+        window_end = min(day + timedelta(minutes=work_end), range_end)
+        if window_start < window_end:
+            yield window_start, window_end
+        day += timedelta(days=1)
+
+def find_free_slots(busy: list, windows, slot: timedelta) -> list:
+    """각 창에서 병합된 바쁜 구간 사이의 빈 구간 중 slot 이상인 것 (busy, windows 모두 시간순)"""
+    free = []
+    index = 0
+    for window_start, window_end in windows:
+        while index < len(busy) and busy[index][1] <= window_start:
+            index += 1
+        cursor = window_start
+        position = index
+        while position < len(busy) and busy[position][0] < window_end:
+            if busy[position][0] - cursor >= slot:
+                free.append((cursor, busy[position][0]))
+            cursor = max(cursor, busy[position][1])
+            position += 1
+        if window_end - cursor >= slot:
+            free.append((cursor, window_end))
+    return free
+
+def has_accepted_match(db: Session, mentor_id: int, mentee_id: int) -> bool:
+    """두 사용자가 실제 멘토/멘티이고 수락된 매칭 요청으로 연결되어 있는지"""
+    mentor, mentee = aliased(User), aliased(User)
+    return db.query(MatchRequest.id).join(
+        mentor, mentor.id == MatchRequest.mentor_id
+    ).join(
+        mentee, mentee.id == MatchRequest.mentee_id
+    ).filter(
+        MatchRequest.mentor_id == mentor_id,
+        MatchRequest.mentee_id == mentee_id,
+        MatchRequest.status == "accepted",
+        mentor.role == "mentor",
+        mentee.role == "mentee"
+    ).first() is not None
+
+@app.get("/api/meetings/free-slots")
+def get_free_slots(
+    request: Request,
+    mentorId: int,
+    menteeId: int,
+    start: datetime,
+    end: datetime,
+    slotMinutes: int = Query(FREE_SLOTS_DEFAULT_SLOT_MINUTES, ge=5, le=24 * 60),
+    workStart: Optional[str] = None,
+    workEnd: Optional[str] = None,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    멘토와 멘티가 모두 비어 있는 시간 조회.
+    
+    본인이 참가자이고 두 사람 사이에 수락된 매칭이 있을 때만 상대방의 바쁜 시간을 보여 준다.
+    두 참가자의 예정된 미팅을 참가자마다 한 번의 인덱스 범위 쿼리로 읽고 한 번의 스윕으로 병합한다.
+    workStart/workEnd ("HH:MM") 를 주면 날짜마다 그 시간 안에서만 찾는다.
+    ETag 는 두 참가자의 달력 버전이므로 어느 쪽 미팅이든 바뀌기 전까지 304 로 재검증된다.
+    """
+    try:
+        if current_user.id not in (mentorId, menteeId):
+            raise HTTPException(status_code=403, detail="Can only view availability for your own meetings")
+        if not has_accepted_match(db, mentorId, menteeId):
+            raise HTTPException(status_code=403, detail="Can only view availability with a matched mentor or mentee")
         
-        # 날짜별로 미팅 그룹화
-        calendar_data = {}
-        for meeting in meetings:
-            date_key = meeting.start_time.strftime('%Y-%m-%d')
-            if date_key not in calendar_data:
-                calendar_data[date_key] = []
-            
-            # 상대방 정보 가져오기
-            if meeting.mentor_id == current_user.id:
-                other_user = db.query(User).filter(User.id == meeting.mentee_id).first()
-                other_role = "mentee"
-            else:
-                other_user = db.query(User).filter(User.id == meeting.mentor_id).first()
-                other_role = "mentor"
-            
-            calendar_data[date_key].append({
-                "id": meeting.id,
-                "title": meeting.title,
-                "startTime": meeting.start_time.strftime('%H:%M'),
-                "endTime": meeting.end_time.strftime('%H:%M'),
-                "status": meeting.status,
-                "otherUser": {
-                    "name": other_user.name if other_user else "Unknown",
-                    "role": other_role
-                }
-            })
+        range_start, range_end = naive_datetime(start), naive_datetime(end)
+        if range_end <= range_start:
+            raise HTTPException(status_code=400, detail="End time must be after start time")
+        if range_end - range_start > timedelta(days=FREE_SLOTS_MAX_DAYS):
+            raise HTTPException(status_code=400, detail=f"Range cannot exceed {FREE_SLOTS_MAX_DAYS} days")
+        
+        work_start = parse_work_time(workStart, "workStart")
+        work_end = parse_work_time(workEnd, "workEnd")
+        if (work_start is None) != (work_end is None) or (work_start is not None and work_end <= work_start):
+            raise HTTPException(status_code=400, detail="workStart and workEnd must both be given with workStart < workEnd")
+        
+        versions = get_calendar_versions(db, (mentorId, menteeId))
+        etag = f'"free-slots-{versions[mentorId]}-{versions[menteeId]}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
         
-        return calendar_data
+        busy = merge_busy_intervals(*[
+            fetch_busy_intervals(db, user_id, range_start, range_end) for user_id in {mentorId, menteeId}
+        ])
+        free = find_free_slots(
+            busy, availability_windows(range_start, range_end, work_start, work_end), timedelta(minutes=slotMinutes)
+        )
+        
+        body = orjson.dumps({
+            "mentorId": mentorId,
+            "menteeId": menteeId,
+            "start": range_start.isoformat(),
+            "end": range_end.isoformat(),
+            "slotMinutes": slotMinutes,
+            "busy": [{"startTime": busy_start.isoformat(), "endTime": busy_end.isoformat()} for busy_start, busy_end in busy],
+            "free": [{"startTime": free_start.isoformat(), "endTime": free_end.isoformat()} for free_start, free_end in free]
+        })
+        return Response(content=body, media_type="application/json", headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/api/meetings/{meeting_id}")
-def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
+        reschedules = any(
+            value is not None for value in (meeting_update.startTime, meeting_update.endTime, meeting_update.status)
+        )
+        if reschedules:
+            begin_booking_transaction(db)
+        
         meeting = db.query(Meeting).filter(
             Meeting.id == meeting_id,
             (Meeting.mentor_id == current_user.id) | (Meeting.mentee_id == current_user.id)
@@ -782,6 +3443,18 @@ def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user:
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
+        # 시간이나 상태가 바뀌어 예정된 미팅이 되면 생성 때와 같은 충돌 검사
+        if reschedules:
+            start_time = meeting_update.startTime if meeting_update.startTime is not None else meeting.start_time
+            end_time = meeting_update.endTime if meeting_update.endTime is not None else meeting.end_time
+            new_status = meeting_update.status if meeting_update.status is not None else meeting.status
+            if naive_datetime(end_time) <= naive_datetime(start_time):
+                raise HTTPException(status_code=400, detail="End time must be after start time")
+            if new_status == "scheduled" and find_conflicting_meeting(
+                db, (meeting.mentor_id, meeting.mentee_id), start_time, end_time, exclude_meeting_id=meeting.id
+            ):
+                raise HTTPException(status_code=400, detail="Time slot conflicts with existing meeting")
+        
         # 업데이트할 필드들 적용
         if meeting_update.title is not None:
             meeting.title = meeting_update.title
@@ -800,7 +3473,7 @@ def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user:
         
         db.commit()
         
-        return {
+        response = {
             "id": meeting.id,
             "mentorId": meeting.mentor_id,
             "menteeId": meeting.mentee_id,
@@ -812,6 +3485,8 @@ def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user:
             "meetingLink": meeting.meeting_link,
             "updatedAt": meeting.updated_at.isoformat()
         }
+        event_bus.publish([meeting.mentor_id, meeting.mentee_id], "meeting.updated", response)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -819,7 +3494,7 @@ def update_meeting(meeting_id: int, meeting_update: MeetingUpdate, current_user:
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.delete("/api/meetings/{meeting_id}")
-def delete_meeting(meeting_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def delete_meeting(meeting_id: int, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
     try:
         meeting = db.query(Meeting).filter(
             Meeting.id == meeting_id,
@@ -829,9 +3504,11 @@ def delete_meeting(meeting_id: int, current_user: User = Depends(get_current_use
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         
+        participant_ids = [meeting.mentor_id, meeting.mentee_id]
         db.delete(meeting)
         db.commit()
         
+        event_bus.publish(participant_ids, "meeting.deleted", {"id": meeting_id})
         return {"message": "Meeting deleted successfully"}
     except HTTPException:
         raise
@@ -839,6 +3516,353 @@ def delete_meeting(meeting_id: int, current_user: User = Depends(get_current_use
         db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# ========================
+# 반복 미팅 API
+# ========================
+
+def series_response(series: MeetingSeries) -> dict:
+    return {
+        "id": series.id,
+        "mentorId": series.mentor_id,
+        "menteeId": series.mentee_id,
+        "title": series.title,
+        "description": series.description,
+        "startTime": series.start_time.isoformat(),
+        "endTime": series.end_time.isoformat(),
+        "meetingLink": series.meeting_link,
+        "frequency": series.frequency,
+        "interval": series.interval,
+        "count": series.occurrence_count,
+        "until": series.until.isoformat() if series.until else None,
+        "endsAt": series.ends_at.isoformat() if series.ends_at else None,
+        "createdAt": series.created_at.isoformat()
+    }
+
+def occurrence_response(occurrence: MeetingOccurrence) -> dict:
+    return {
+        "id": occurrence.id,
+        "seriesId": occurrence.series_id,
+        "occurrenceStart": occurrence.occurrence_start.isoformat(),
+        "mentorId": occurrence.mentor_id,
+        "menteeId": occurrence.mentee_id,
+        "title": occurrence.title,
+        "description": occurrence.description,
+        "startTime": occurrence.start_time.isoformat(),
+        "endTime": occurrence.end_time.isoformat(),
+        "status": occurrence.status,
+        "meetingLink": occurrence.meeting_link
+    }
+
+def get_participant_series(db: Session, series_id: int, user_id: int) -> MeetingSeries:
+    series = db.query(MeetingSeries).filter(
+        MeetingSeries.id == series_id,
+        (MeetingSeries.mentor_id == user_id) | (MeetingSeries.mentee_id == user_id)
+    ).first()
+    if not series:
+        raise HTTPException(status_code=404, detail="Meeting series not found")
+    return series
+
+@app.post("/api/meeting-series")
+def create_meeting_series(series_create: MeetingSeriesCreate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """
+    반복 미팅 생성. 회차는 행으로 만들지 않고 조회할 때 기간 안에서만 펼친다.
+    
+    반복은 count 나 until 로 첫 회차부터 SERIES_MAX_DAYS 일 안에 끝나야 하며, 생성 시 모든 회차를
+    두 참가자의 미팅/반복 회차와 한 번의 스윕으로 비교해 충돌을 검사한다.
+    """
+    try:
+        if current_user.role == "mentor" and series_create.mentorId != current_user.id:
+            raise HTTPException(status_code=403, detail="Can only create meetings for yourself")
+        elif current_user.role == "mentee" and series_create.menteeId != current_user.id:
+            raise HTTPException(status_code=403, detail="Can only create meetings for yourself")
+        
+        if series_create.frequency not in SERIES_FREQUENCIES:
+            raise HTTPException(status_code=400, detail="Invalid frequency")
+        if series_create.count is None and series_create.until is None:
+            raise HTTPException(status_code=400, detail="Count or until is required")
+        if not 1 <= series_create.interval <= SERIES_MAX_INTERVAL:
+            raise HTTPException(status_code=400, detail=f"Interval must be between 1 and {SERIES_MAX_INTERVAL}")
+        # 하루에 두 번 이상 반복할 수 없으므로 count 가 SERIES_MAX_DAYS 를 넘으면 기간도 넘음 (날짜 계산 전에 거름)
+        if series_create.count is not None and not 1 <= series_create.count <= SERIES_MAX_DAYS:
+            raise HTTPException(status_code=400, detail=f"Count must be between 1 and {SERIES_MAX_DAYS}")
+        start_time, end_time = naive_datetime(series_create.startTime), naive_datetime(series_create.endTime)
+        if end_time <= start_time:
+            raise HTTPException(status_code=400, detail="End time must be after start time")
+        until = naive_datetime(series_create.until) if series_create.until is not None else None
+        if until is not None and until < start_time:
+            raise HTTPException(status_code=400, detail="Until must not be before start time")
+        
+        series = MeetingSeries(
+            mentor_id=series_create.mentorId,
+            mentee_id=series_create.menteeId,
+            title=series_create.title,
+            description=series_create.description,
+            meeting_link=series_create.meetingLink,
+            start_time=start_time,
+            end_time=end_time,
+            frequency=series_create.frequency,
+            interval=series_create.interval,
+            occurrence_count=series_create.count,
+            until=until
+        )
+        if end_time - start_time > series_step(series):
+            raise HTTPException(status_code=400, detail="Meeting duration cannot exceed the repeat interval")
+        try:
+            series.ends_at = series_ends_at(series)
+        except OverflowError:
+            raise HTTPException(status_code=400, detail=f"Series must end within {SERIES_MAX_DAYS} days")
+        if series.ends_at - start_time > timedelta(days=SERIES_MAX_DAYS):
+            raise HTTPException(status_code=400, detail=f"Series must end within {SERIES_MAX_DAYS} days")
+        
+        # 시간 충돌 확인 (검사부터 저장까지 쓰기 잠금 유지)
+        begin_booking_transaction(db)
+        duration = end_time - start_time
+        candidates = [
+            (occurrence_start, occurrence_start + duration)
+            for occurrence_start in series_occurrence_starts(series, start_time, series.ends_at)
+        ]
+        busy = merge_busy_intervals(*[
+            fetch_busy_intervals(db, user_id, start_time, series.ends_at)
+            for user_id in {series_create.mentorId, series_create.menteeId}
+        ])
+        if find_first_overlap(busy, candidates) is not None:
+            raise HTTPException(status_code=400, detail="Time slot conflicts with existing meeting")
+        
+        db.add(series)
+        commit_with_participants(db)
+        db.refresh(series)
+        
+        response = series_response(series)
+        event_bus.publish([series.mentor_id, series.mentee_id], "meeting_series.created", response)
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.get("/api/meeting-series", response_class=ORJSONResponse)
+def get_meeting_series(current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    try:
+        series_list = db.query(MeetingSeries).filter(
+            (MeetingSeries.mentor_id == current_user.id) | (MeetingSeries.mentee_id == current_user.id)
+        ).order_by(MeetingSeries.start_time.desc()).all()
+        return ORJSONResponse([series_response(series) for series in series_list])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.put("/api/meeting-series/{series_id}")
+def update_meeting_series(series_id: int, series_update: MeetingSeriesUpdate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    try:
+        series = get_participant_series(db, series_id, current_user.id)
+        
+        if series_update.title is not None:
+            series.title = series_update.title
+        if series_update.description is not None:
+            series.description = series_update.description
+        if series_update.meetingLink is not None:
+            series.meeting_link = series_update.meetingLink
+        if series_update.until is not None:
+            # 늘리면 새 회차의 충돌 검사가 필요하므로 반복을 일찍 끝내는 것만 허용
+            until = naive_datetime(series_update.until)
+            if until < series.start_time:
+                raise HTTPException(status_code=400, detail="Until must not be before start time")
+            previous_ends_at = series.ends_at
+            series.until = until
+            try:
+                series.ends_at = series_ends_at(series)
+            except OverflowError:
+                raise HTTPException(status_code=400, detail="Series can only be shortened")
+            if previous_ends_at is not None and series.ends_at > previous_ends_at:
+                raise HTTPException(status_code=400, detail="Series can only be shortened")
+            db.query(MeetingOccurrenceOverride).filter(
+                MeetingOccurrenceOverride.series_id == series.id,
+                MeetingOccurrenceOverride.occurrence_start > until
+            ).delete(synchronize_session=False)
+        
+        db.commit()
+        db.refresh(series)
+        
+        response = series_response(series)
+        event_bus.publish([series.mentor_id, series.mentee_id], "meeting_series.updated", response)
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.delete("/api/meeting-series/{series_id}")
+def delete_meeting_series(series_id: int, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    try:
+        series = get_participant_series(db, series_id, current_user.id)
+        participant_ids = [series.mentor_id, series.mentee_id]
+        db.delete(series)
+        db.commit()
+        
+        event_bus.publish(participant_ids, "meeting_series.deleted", {"id": series_id})
+        return {"message": "Meeting series deleted successfully"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@app.put("/api/meeting-series/{series_id}/occurrences/{occurrence_start}")
+def update_meeting_occurrence(series_id: int, occurrence_start: datetime, meeting_update: MeetingUpdate, current_user: Principal = Depends(get_current_principal), db: Session = Depends(get_db)):
+    """반복 미팅 한 회차만 변경하거나 취소 (status="cancelled"). occurrence_start 는 규칙상 원래 시작 시각"""
+    try:
+        reschedules = any(
+            value is not None for value in (meeting_update.startTime, meeting_update.endTime, meeting_update.status)
+        )
+        if reschedules:
+            begin_booking_transaction(db)
+        
+        series = get_participant_series(db, series_id, current_user.id)
+        occurrence_start = naive_datetime(occurrence_start)
+        if not is_series_occurrence(series, occurrence_start):
+            raise HTTPException(status_code=404, detail="Occurrence not found")
+        
+        override = db.get(MeetingOccurrenceOverride, (series.id, occurrence_start))
+        if override is None:
+            override = MeetingOccurrenceOverride(series_id=series.id, occurrence_start=occurrence_start)
+            db.add(override)
+        current = build_occurrence(series, occurrence_start, override)
+        
+        # 시간이나 상태가 바뀌어 예정된 회차가 되면 단일 미팅과 같은 충돌 검사
+        if reschedules:
+            start_time = naive_datetime(meeting_update.startTime) if meeting_update.startTime is not None else current.start_time
+            end_time = naive_datetime(meeting_update.endTime) if meeting_update.endTime is not None else current.end_time
+            new_status = meeting_update.status if meeting_update.status is not None else current.status
+            if end_time <= start_time:
+                raise HTTPException(status_code=400, detail="End time must be after start time")
+            if new_status == "scheduled" and find_conflicting_meeting(
+                db, (series.mentor_id, series.mentee_id), start_time, end_time,
+                exclude_occurrence=(series.id, occurrence_start)
+            ):
+                raise HTTPException(status_code=400, detail="Time slot conflicts with existing meeting")
+            override.start_time, override.end_time, override.status = start_time, end_time, new_status
+        
+        if meeting_update.title is not None:
+            override.title = meeting_update.title
+        if meeting_update.description is not None:
+            override.description = meeting_update.description
+        if meeting_update.meetingLink is not None:
+            override.meeting_link = meeting_update.meetingLink
+        
+        db.commit()
+        
+        response = occurrence_response(build_occurrence(series, occurrence_start, override))
+        event_bus.publish([series.mentor_id, series.mentee_id], "meeting_series.occurrence_updated", response)
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+# ========================
+# 실시간 알림 API
+# ========================
+
+def create_event_stream_ticket(access_payload: dict) -> str:
+    """
+    EventSource 용 1회용 티켓. 브라우저 EventSource 는 헤더를 붙일 수 없어 URL 에 자격 증명을 실어야 하므로
+    액세스 토큰 대신 짧게 살고 한 번만 쓰이는 티켓을 접근 로그에 남긴다.
+    원래 액세스 토큰의 jti/만료를 담아 스트림이 로그아웃·만료를 따라가게 한다.
+    """
+    now = int(time.time())
+    return jwt.encode({
+        "iss": "mentor-mentee-app",
+        "aud": EVENT_STREAM_TICKET_AUDIENCE,
+        "sub": access_payload["sub"],
+        "exp": min(now + EVENT_STREAM_TICKET_SECONDS, access_payload["exp"]),
+        "iat": now,
+        "jti": str(uuid.uuid4()),
+        "atj": access_payload.get("jti"),
+        "ate": access_payload["exp"]
+    }, SECRET_KEY, algorithm=ALGORITHM)
+
+def redeem_event_stream_ticket(ticket: str) -> dict:
+    """티켓을 검증하고 다시 쓸 수 없도록 만료 시각까지 폐기 목록에 넣은 뒤 (sub, jti, exp) 형태의 액세스 토큰 정보 반환"""
+    try:
+        payload = jwt.decode(
+            ticket,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            audience=EVENT_STREAM_TICKET_AUDIENCE,
+            issuer="mentor-mentee-app"
+        )
+    except JWTError:
+        raise credentials_exception()
+    
+    if not payload.get("jti") or token_denylist.contains(payload["jti"]) or token_denylist.contains(payload.get("atj")):
+        raise credentials_exception()
+    token_denylist.add(payload["jti"], payload["exp"])
+    return {"sub": payload["sub"], "jti": payload.get("atj"), "exp": payload["ate"]}
+
+def event_stream_authorized(access_payload: dict) -> bool:
+    """스트림을 연 액세스 토큰이 아직 만료되지 않았고 로그아웃으로 폐기되지 않았는지"""
+    return access_payload["exp"] > time.time() and not token_denylist.contains(access_payload.get("jti"))
+
+@app.post("/api/events/ticket")
+def create_event_ticket(credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)):
+    """GET /api/events?ticket= 에 쓸 1회용 티켓 발급 (EVENT_STREAM_TICKET_SECONDS 초 안에 사용)"""
+    if not credentials:
+        raise credentials_exception()
+    payload = decode_access_token(credentials.credentials)
+    return {"ticket": create_event_stream_ticket(payload), "expiresIn": EVENT_STREAM_TICKET_SECONDS}
+
+@app.get("/api/events")
+async def stream_events(ticket: Optional[str] = None, credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)):
+    """
+    매칭 요청/미팅 변경을 Server-Sent Events 로 전달.
+    
+    Authorization 헤더나 POST /api/events/ticket 으로 받은 ?ticket= 으로 인증한다.
+    이벤트가 없으면 EVENT_HEARTBEAT_SECONDS 마다 주석 줄을 보내 연결을 유지하며, 그때마다 토큰 만료와
+    로그아웃을 확인해 expired 이벤트를 보내고 스트림을 닫는다 (클라이언트는 새 티켓으로 다시 연결).
+    밀린 이벤트가 큐 크기를 넘으면 resync 이벤트 하나로 대체되므로 클라이언트는 목록을 다시 조회한다.
+    """
+    if credentials:
+        access_payload = decode_access_token(credentials.credentials)
+    elif ticket:
+        access_payload = redeem_event_stream_ticket(ticket)
+    else:
+        raise credentials_exception()
+    try:
+        user_id = int(access_payload["sub"])
+    except ValueError:
+        raise credentials_exception()
+    
+    subscription = event_bus.subscribe(user_id, EVENT_MAX_CONNECTIONS_PER_USER)
+    if subscription is None:
+        raise HTTPException(status_code=429, detail="Too many event streams")
+    
+    async def event_stream():
+        try:
+            yield b"retry: 3000\n" + encode_event_frame("ready", {"userId": user_id})
+            while True:
+                # 토큰이 하트비트 전에 만료되면 그 시각에 깨어나 바로 닫음
+                timeout = max(min(EVENT_HEARTBEAT_SECONDS, access_payload["exp"] - time.time()), 0)
+                try:
+                    frame = await asyncio.wait_for(subscription.queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    frame = EVENT_HEARTBEAT_FRAME
+                if not event_stream_authorized(access_payload):
+                    yield encode_event_frame("expired", {})
+                    return
+                yield frame
+        finally:
+            event_bus.unsubscribe(subscription)
+    
+    # 스트림이 한 번도 시작되지 않고 연결이 끊겨도 응답이 끝나면 background 로 구독을 해제 (중복 해제는 무시됨)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(event_bus.unsubscribe, subscription)
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
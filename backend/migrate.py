@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 스키마 마이그레이션 스크립트
+
+    python migrate.py           # 적용되지 않은 마이그레이션 적용
+    python migrate.py --status  # 마이그레이션 적용 여부 확인
+    python migrate.py --maintenance  # 만료된 리프레시 토큰, 참조되지 않는 이미지 등 쌓이는 데이터 정리
+"""
+
+import sys
+import os
+
+# 스크립트가 있는 디렉토리를 기준으로 경로 설정 (GitHub Actions 대응)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+os.chdir(SCRIPT_DIR)
+sys.path.insert(0, SCRIPT_DIR)
+
+# main 을 import 할 때 마이그레이션이 실행되지 않도록 하고 아래에서 명시적으로 실행
+os.environ["RUN_MIGRATIONS_ON_STARTUP"] = "0"
+
+from main import MIGRATIONS, applied_migration_versions, run_migrations, prune_expired_refresh_tokens, prune_unreferenced_images
+
+def show_status():
+    """각 마이그레이션의 적용 여부를 출력합니다."""
+    try:
+        applied = applied_migration_versions()
+    except Exception:
+        applied = set()
+    for version, name, _ in MIGRATIONS:
+        mark = "✅" if version in applied else "⏳"
+        print(f"{mark} {version:03d} {name}")
+
+def migrate():
+    """적용되지 않은 마이그레이션을 순서대로 적용합니다."""
+    print(f"🗄️ 데이터베이스 마이그레이션")
+    print(f"현재 작업 디렉토리: {os.getcwd()}")
+    print("")
+
+    newly_applied = run_migrations()
+    if not newly_applied:
+        print("적용할 마이그레이션이 없습니다.")
+    for version, name in newly_applied:
+        print(f"✅ {version:03d} {name} 적용 완료")
+
+def maintenance():
+    """주기적으로 (예: cron 으로 하루 한 번) 실행해 쌓이는 데이터를 정리합니다."""
+    print(f"🧹 만료된 리프레시 토큰 {prune_expired_refresh_tokens()}개 삭제")
+    print(f"🧹 참조되지 않는 이미지 파일 {prune_unreferenced_images()}개 삭제")
+
+if __name__ == "__main__":
+    if "--status" in sys.argv[1:]:
+        show_status()
+    elif "--maintenance" in sys.argv[1:]:
+        maintenance()
+    else:
+        migrate()
@@ -793,19 +793,22 @@ const Mentors = () => {
   const [loading, setLoading] = useState(true)
   const [searchSkill, setSearchSkill] = useState('')
   const [orderBy, setOrderBy] = useState('')
+  const [nextCursor, setNextCursor] = useState(null)
 
   useEffect(() => {
     fetchMentors()
   }, [searchSkill, orderBy])
 
-  const fetchMentors = async () => {
+  const fetchMentors = async (cursor = null) => {
     try {
       const params = {}
       if (searchSkill) params.skill = searchSkill
       if (orderBy) params.order_by = orderBy
+      if (cursor) params.cursor = cursor
 
       const response = await axios.get('/mentors', { params })
-      setMentors(response.data)
+      setMentors(cursor ? (prev) => [...prev, ...response.data] : response.data)
+      setNextCursor(response.headers['x-next-cursor'] || null)
     } catch (error) {
       console.error('Failed to fetch mentors:', error)
     } finally {
@@ -905,6 +908,11 @@ const Mentors = () => {
           ))}
         </div>
       )}
+      {!loading && nextCursor && (
+        <button onClick={() => fetchMentors(nextCursor)} className="btn btn-secondary" style={{ width: '100%', marginTop: '16px' }}>
+          더 보기
+        </button>
+      )}
     </div>
   )
 }
@@ -914,16 +922,57 @@ const Requests = () => {
   const { user } = useAuth()
   const [requests, setRequests] = useState([])
   const [loading, setLoading] = useState(true)
+  const [nextCursor, setNextCursor] = useState(null)
 
   useEffect(() => {
     fetchRequests()
   }, [])
 
-  const fetchRequests = async () => {
+  // 새 요청/수락/거절/취소 알림을 받으면 폴링 없이 목록을 다시 조회
+  // URL 에 액세스 토큰을 싣지 않도록 1회용 티켓으로 연결하고, 만료/끊김 시 새 티켓으로 다시 연결
+  useEffect(() => {
+    let events = null
+    let retryTimer = null
+    let closed = false
+    const refresh = () => fetchRequests()
+    const eventTypes = ['match_request.created', 'match_request.accepted', 'match_request.rejected', 'match_request.cancelled', 'resync']
+
+    const reconnect = () => {
+      if (events) events.close()
+      events = null
+      if (!closed) retryTimer = setTimeout(connect, 3000)
+    }
+
+    const connect = async () => {
+      try {
+        const response = await axios.post('/events/ticket')
+        if (closed) return
+        events = new EventSource(`${API_BASE}/events?ticket=${encodeURIComponent(response.data.ticket)}`)
+        eventTypes.forEach((type) => events.addEventListener(type, refresh))
+        events.addEventListener('expired', reconnect)
+        events.onerror = reconnect
+      } catch (error) {
+        console.error('Failed to open event stream:', error)
+        reconnect()
+      }
+    }
+
+    connect()
+    return () => {
+      closed = true
+      clearTimeout(retryTimer)
+      if (events) events.close()
+    }
+  }, [])
+
+  const fetchRequests = async (cursor = null) => {
     try {
       const endpoint = user.role === 'mentor' ? '/match-requests/incoming' : '/match-requests/outgoing'
-      const response = await axios.get(endpoint)
-      setRequests(response.data)
+      const params = { expand: 'counterpart' }
+      if (cursor) params.cursor = cursor
+      const response = await axios.get(endpoint, { params })
+      setRequests(cursor ? (prev) => [...prev, ...response.data] : response.data)
+      setNextCursor(response.headers['x-next-cursor'] || null)
     } catch (error) {
       console.error('Failed to fetch requests:', error)
     } finally {
@@ -1003,7 +1052,7 @@ const Requests = () => {
               {user.role === 'mentor' ? (
                 <>
                   <div className="mb-4">
-                    <strong>멘티 ID:</strong> {request.menteeId}
+                    <strong>멘티:</strong> {request.counterpart?.profile.name || `ID ${request.menteeId}`}
                   </div>
                   <div className="mb-4 request-message" mentee={request.menteeId}>
                     <strong>메시지:</strong> {request.message}
@@ -1030,7 +1079,7 @@ const Requests = () => {
               ) : (
                 <>
                   <div className="mb-4">
-                    <strong>멘토 ID:</strong> {request.mentorId}
+                    <strong>멘토:</strong> {request.counterpart?.profile.name || `ID ${request.mentorId}`}
                   </div>
                   {request.status === 'pending' && (
                     <button
@@ -1046,6 +1095,11 @@ const Requests = () => {
           ))}
         </div>
       )}
+      {!loading && nextCursor && (
+        <button onClick={() => fetchRequests(nextCursor)} className="btn btn-secondary" style={{ width: '100%', marginTop: '16px' }}>
+          더 보기
+        </button>
+      )}
     </div>
   )
 }
@@ -4,6 +4,7 @@ import axios from 'axios';
 const Calendar = ({ user }) => {
   const [currentDate, setCurrentDate] = useState(new Date());
   const [meetings, setMeetings] = useState({});
+  const [loadedMonths, setLoadedMonths] = useState({});
   const [selectedDate, setSelectedDate] = useState(null);
   const [showMeetingForm, setShowMeetingForm] = useState(false);
   const [newMeeting, setNewMeeting] = useState({
@@ -19,12 +20,35 @@ const Calendar = ({ user }) => {
     fetchCalendarData();
   }, [currentDate]);
 
-  const fetchCalendarData = async () => {
+  const monthKey = (date) => `${date.getFullYear()}-${date.getMonth() + 1}`;
+
+  const toDateParam = (date) => {
+    const month = String(date.getMonth() + 1).padStart(2, '0');
+    const day = String(date.getDate()).padStart(2, '0');
+    return `${date.getFullYear()}-${month}-${day}`;
+  };
+
+  // 현재 달과 앞뒤 달을 한 번에 받아 두고, 이미 받은 달로 이동할 때는 다시 요청하지 않음
+  const fetchCalendarData = async (refresh = false) => {
     try {
       const year = currentDate.getFullYear();
-      const month = currentDate.getMonth() + 1;
-      const response = await axios.get(`/meetings/calendar/${year}/${month}`);
-      setMeetings(response.data);
+      const month = currentDate.getMonth();
+      const months = [-1, 0, 1].map((offset) => new Date(year, month + offset, 1));
+      const missing = refresh ? months : months.filter((date) => !loadedMonths[monthKey(date)]);
+      if (missing.length === 0) return;
+
+      const first = missing[0];
+      const last = missing[missing.length - 1];
+      const response = await axios.get('/meetings/calendar', {
+        params: {
+          start: toDateParam(first),
+          end: toDateParam(new Date(last.getFullYear(), last.getMonth() + 1, 0))
+        }
+      });
+
+      const fetched = Object.fromEntries(missing.map((date) => [monthKey(date), true]));
+      setMeetings((prev) => (refresh ? response.data : { ...prev, ...response.data }));
+      setLoadedMonths((prev) => (refresh ? fetched : { ...prev, ...fetched }));
     } catch (error) {
       console.error('Failed to fetch calendar data:', error);
     }
@@ -93,7 +117,7 @@ const Calendar = ({ user }) => {
         mentorId: user?.role === 'mentor' ? user.id : '',
         menteeId: user?.role === 'mentee' ? user.id : ''
       });
-      fetchCalendarData();
+      fetchCalendarData(true);
     } catch (error) {
       console.error('Failed to create meeting:', error);
       alert('미팅 생성에 실패했습니다.');
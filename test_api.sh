@@ -225,20 +225,27 @@ log_section "4. 매칭 요청 테스트"
 
 # 매칭 요청 생성
 log_test "Alex Park이 Sarah Kim에게 매칭 요청"
-MATCH_REQUEST=$(curl -s -X POST "$API_BASE/match-requests" \
-  -H "Authorization: Bearer $ALEX_TOKEN" \
-  -H "Content-Type: application/json" \
-  -d '{
-    "mentorId": 1,
-    "message": "테스트 매칭 요청입니다!"
-  }')
-MATCH_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST "$API_BASE/match-requests" \
+# 이전 실행에서 남은 Sarah Kim 과의 대기/수락 요청이 있으면 중복으로 거절되므로 먼저 취소
+curl -s -X GET "$API_BASE/match-requests/outgoing" -H "Authorization: Bearer $ALEX_TOKEN" | \
+python3 -c "
+import sys, json
+for item in json.load(sys.stdin):
+    if item.get('mentorId') == 1 and item.get('status') in ('pending', 'accepted'):
+        print(item['id'])
+" 2>/dev/null | while read OLD_REQUEST_ID; do
+    curl -s -X DELETE "$API_BASE/match-requests/$OLD_REQUEST_ID" -H "Authorization: Bearer $ALEX_TOKEN" > /dev/null
+done
+
+# 같은 멘토에게 다시 보내면 중복 요청으로 거절되므로 한 번만 호출하여 응답과 상태 코드를 함께 받음
+MATCH_RESPONSE=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/match-requests" \
   -H "Authorization: Bearer $ALEX_TOKEN" \
   -H "Content-Type: application/json" \
   -d '{
     "mentorId": 1,
     "message": "테스트 매칭 요청입니다!"
   }')
+MATCH_STATUS=$(echo "$MATCH_RESPONSE" | tail -n 1)
+MATCH_REQUEST=$(echo "$MATCH_RESPONSE" | head -n -1)
 check_status "200" "$MATCH_STATUS" "매칭 요청 생성"
 
 # 요청 ID 추출
@@ -400,6 +407,735 @@ MENTOR_OUTGOING_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BAS
   -H "Authorization: Bearer $SARAH_TOKEN")
 check_status "403" "$MENTOR_OUTGOING_STATUS" "멘토의 outgoing 요청 조회"
 
+# 7. 반복 미팅 테스트 (회차 펼침, 회차 이동/취소, 충돌 검사)
+log_section "7. 반복 미팅 테스트"
+
+SERIES_TITLE="API 테스트 반복 미팅"
+ALEX_ID=$(curl -s -X GET "$API_BASE/me" -H "Authorization: Bearer $ALEX_TOKEN" | \
+  python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+
+# 이전 실행에서 남은 테스트 반복 미팅 정리
+curl -s -X GET "$API_BASE/meeting-series" -H "Authorization: Bearer $SARAH_TOKEN" | \
+python3 -c "
+import sys, json
+for series in json.load(sys.stdin):
+    if series.get('title') == '$SERIES_TITLE':
+        print(series['id'])
+" 2>/dev/null | while read OLD_SERIES_ID; do
+    curl -s -X DELETE "$API_BASE/meeting-series/$OLD_SERIES_ID" -H "Authorization: Bearer $SARAH_TOKEN" > /dev/null
+done
+
+# 회차 목록에서 (seriesId 가 같은) 회차만 골라 요약하는 함수
+series_occurrences() {
+    local series_id=$1
+    local start=$2
+    local end=$3
+    curl -s -X GET "$API_BASE/meetings?start=$start&end=$end" -H "Authorization: Bearer $SARAH_TOKEN" | \
+    python3 -c "
+import sys, json
+items = [item for item in json.load(sys.stdin) if item.get('seriesId') == $series_id]
+print(' '.join(f\"{item['occurrenceStart']}|{item['startTime']}|{item['status']}|{item['id']}\" for item in items))
+" 2>/dev/null
+}
+
+# 단일 미팅 생성 상태 코드만 확인하고, 만들어졌으면 바로 삭제하는 함수
+try_meeting() {
+    local start=$1
+    local end=$2
+    local response=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/meetings" \
+      -H "Authorization: Bearer $SARAH_TOKEN" \
+      -H "Content-Type: application/json" \
+      -d "{\"mentorId\": 1, \"menteeId\": $ALEX_ID, \"title\": \"충돌 확인용 미팅\", \"startTime\": \"$start\", \"endTime\": \"$end\"}")
+    local status=$(echo "$response" | tail -n 1)
+    if [ "$status" = "200" ]; then
+        local meeting_id=$(echo "$response" | head -n -1 | python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+        curl -s -X DELETE "$API_BASE/meetings/$meeting_id" -H "Authorization: Bearer $SARAH_TOKEN" > /dev/null
+    fi
+    echo "$status"
+}
+
+log_test "매주 4회 반복 미팅 생성"
+SERIES_RESPONSE=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/meeting-series" \
+  -H "Authorization: Bearer $SARAH_TOKEN" \
+  -H "Content-Type: application/json" \
+  -d "{
+    \"mentorId\": 1,
+    \"menteeId\": $ALEX_ID,
+    \"title\": \"$SERIES_TITLE\",
+    \"startTime\": \"2030-01-07T09:00:00\",
+    \"endTime\": \"2030-01-07T10:00:00\",
+    \"frequency\": \"weekly\",
+    \"count\": 4
+  }")
+SERIES_STATUS=$(echo "$SERIES_RESPONSE" | tail -n 1)
+check_status "200" "$SERIES_STATUS" "반복 미팅 생성"
+SERIES_ID=$(echo "$SERIES_RESPONSE" | head -n -1 | python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+
+if [ -n "$SERIES_ID" ]; then
+    log_test "조회 기간 안의 회차만 펼침"
+    WINDOW_TWO=$(series_occurrences "$SERIES_ID" "2030-01-01T00:00:00" "2030-01-15T00:00:00" | wc -w)
+    WINDOW_ALL=$(series_occurrences "$SERIES_ID" "2030-01-01T00:00:00" "2030-03-01T00:00:00" | wc -w)
+    WINDOW_NONE=$(series_occurrences "$SERIES_ID" "2030-02-01T00:00:00" "2030-03-01T00:00:00" | wc -w)
+    if [ "$WINDOW_TWO" = "2" ] && [ "$WINDOW_ALL" = "4" ] && [ "$WINDOW_NONE" = "0" ]; then
+        log_pass "기간별 회차 수 (2주: $WINDOW_TWO, 전체: $WINDOW_ALL, 종료 후: $WINDOW_NONE)"
+    else
+        log_fail "기간별 회차 수 (Expected: 2/4/0, Got: $WINDOW_TWO/$WINDOW_ALL/$WINDOW_NONE)"
+    fi
+    
+    log_test "회차의 id 는 null (미팅 id 와 섞이지 않음)"
+    FIRST_OCCURRENCE=$(series_occurrences "$SERIES_ID" "2030-01-07T00:00:00" "2030-01-08T00:00:00")
+    if [ "$FIRST_OCCURRENCE" = "2030-01-07T09:00:00|2030-01-07T09:00:00|scheduled|None" ]; then
+        log_pass "첫 회차 ($FIRST_OCCURRENCE)"
+    else
+        log_fail "첫 회차 (Got: $FIRST_OCCURRENCE)"
+    fi
+    
+    log_test "반복 회차와 겹치는 단일 미팅 생성 (400 예상)"
+    check_status "400" "$(try_meeting "2030-01-14T09:30:00" "2030-01-14T10:30:00")" "반복 회차와의 충돌"
+    
+    log_test "두 번째 회차를 오후로 이동"
+    MOVE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/meeting-series/$SERIES_ID/occurrences/2030-01-14T09:00:00" \
+      -H "Authorization: Bearer $SARAH_TOKEN" \
+      -H "Content-Type: application/json" \
+      -d '{"startTime": "2030-01-14T13:00:00", "endTime": "2030-01-14T14:00:00"}')
+    check_status "200" "$MOVE_STATUS" "회차 이동"
+    MOVED_OCCURRENCE=$(series_occurrences "$SERIES_ID" "2030-01-14T00:00:00" "2030-01-15T00:00:00")
+    if [ "$MOVED_OCCURRENCE" = "2030-01-14T09:00:00|2030-01-14T13:00:00|scheduled|None" ]; then
+        log_pass "이동된 회차는 원래 시작 시각을 유지하고 새 시각에 표시"
+    else
+        log_fail "이동된 회차 (Got: $MOVED_OCCURRENCE)"
+    fi
+    check_status "200" "$(try_meeting "2030-01-14T09:30:00" "2030-01-14T10:30:00")" "이동 전 시간대는 비어 있음"
+    check_status "400" "$(try_meeting "2030-01-14T13:30:00" "2030-01-14T14:30:00")" "이동한 시간대와의 충돌"
+    
+    log_test "세 번째 회차 취소"
+    CANCEL_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/meeting-series/$SERIES_ID/occurrences/2030-01-21T09:00:00" \
+      -H "Authorization: Bearer $SARAH_TOKEN" \
+      -H "Content-Type: application/json" \
+      -d '{"status": "cancelled"}')
+    check_status "200" "$CANCEL_STATUS" "회차 취소"
+    CANCELLED_OCCURRENCE=$(series_occurrences "$SERIES_ID" "2030-01-21T00:00:00" "2030-01-22T00:00:00")
+    if [ "$CANCELLED_OCCURRENCE" = "2030-01-21T09:00:00|2030-01-21T09:00:00|cancelled|None" ]; then
+        log_pass "취소된 회차는 cancelled 로 표시"
+    else
+        log_fail "취소된 회차 (Got: $CANCELLED_OCCURRENCE)"
+    fi
+    check_status "200" "$(try_meeting "2030-01-21T09:30:00" "2030-01-21T10:30:00")" "취소된 회차 시간대는 비어 있음"
+    
+    log_test "규칙에 없는 회차 변경 (404 예상)"
+    MISSING_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/meeting-series/$SERIES_ID/occurrences/2030-01-15T09:00:00" \
+      -H "Authorization: Bearer $SARAH_TOKEN" \
+      -H "Content-Type: application/json" \
+      -d '{"status": "cancelled"}')
+    check_status "404" "$MISSING_STATUS" "규칙에 없는 회차"
+    
+    log_test "반복 범위와 조회 기간 제한 (400 예상)"
+    for SERIES_LIMIT in '"count": 1000000000' '"interval": 1000000000, "count": 2' '"until": "9999-12-31T00:00:00"' '"interval": 1'; do
+        LIMIT_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST "$API_BASE/meeting-series" \
+          -H "Authorization: Bearer $SARAH_TOKEN" \
+          -H "Content-Type: application/json" \
+          -d "{\"mentorId\": 1, \"menteeId\": $ALEX_ID, \"title\": \"$SERIES_TITLE\", \"startTime\": \"2031-01-06T09:00:00\", \"endTime\": \"2031-01-06T10:00:00\", \"frequency\": \"weekly\", $SERIES_LIMIT}")
+        check_status "400" "$LIMIT_STATUS" "반복 미팅 생성 제한 ($SERIES_LIMIT)"
+    done
+    WIDE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/meetings?start=2032-01-01T00:00:00&end=2100-01-01T00:00:00" \
+      -H "Authorization: Bearer $SARAH_TOKEN")
+    check_status "400" "$WIDE_STATUS" "366일을 넘는 미팅 목록 조회 기간"
+    
+    log_test "반복 미팅 삭제"
+    DELETE_SERIES_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X DELETE "$API_BASE/meeting-series/$SERIES_ID" \
+      -H "Authorization: Bearer $SARAH_TOKEN")
+    check_status "200" "$DELETE_SERIES_STATUS" "반복 미팅 삭제"
+    REMAINING=$(series_occurrences "$SERIES_ID" "2030-01-01T00:00:00" "2030-03-01T00:00:00" | wc -w)
+    check_status "0" "$REMAINING" "삭제 후 남은 회차 수"
+fi
+
+# 8. 리프레시 토큰 회전 테스트 (회전, 재사용 감지 시 묶음 폐기, 로그아웃 폐기)
+log_section "8. 리프레시 토큰 회전 테스트"
+
+# 리프레시 토큰으로 새 토큰 쌍을 요청하고 "상태코드|액세스 토큰|리프레시 토큰" 을 출력하는 함수
+refresh_tokens() {
+    local refresh_token=$1
+    local response=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/token/refresh" \
+      -H "Content-Type: application/json" \
+      -d "{\"refreshToken\": \"$refresh_token\"}")
+    local status=$(echo "$response" | tail -n 1)
+    local tokens=$(echo "$response" | head -n -1 | python3 -c "import sys, json; data=json.load(sys.stdin); print(data.get('token', '') + '|' + data.get('refreshToken', ''))" 2>/dev/null)
+    echo "$status|$tokens"
+}
+
+# 다른 테스트의 SARAH_TOKEN 에 영향을 주지 않도록 별도 세션으로 로그인
+SESSION_LOGIN=$(curl -s -X POST "$API_BASE/login" \
+  -H "Content-Type: application/json" \
+  -d '{"email": "sarah.kim@example.com", "password": "password123"}')
+REFRESH_1=$(echo "$SESSION_LOGIN" | python3 -c "import sys, json; print(json.load(sys.stdin).get('refreshToken', ''))" 2>/dev/null)
+
+log_test "로그인 응답에 리프레시 토큰 포함"
+if [ -n "$REFRESH_1" ]; then
+    log_pass "리프레시 토큰 획득"
+else
+    log_fail "로그인 응답에 refreshToken 누락"
+fi
+
+log_test "리프레시 토큰으로 새 토큰 쌍 발급"
+ROTATED=$(refresh_tokens "$REFRESH_1")
+ROTATED_ACCESS=$(echo "$ROTATED" | cut -d'|' -f2)
+REFRESH_2=$(echo "$ROTATED" | cut -d'|' -f3)
+check_status "200" "$(echo "$ROTATED" | cut -d'|' -f1)" "토큰 회전"
+if [ -n "$REFRESH_2" ] && [ "$REFRESH_2" != "$REFRESH_1" ]; then
+    log_pass "회전된 리프레시 토큰은 이전 토큰과 다름"
+else
+    log_fail "회전된 리프레시 토큰 (Got: ${REFRESH_2:-없음})"
+fi
+ROTATED_ME_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/me" \
+  -H "Authorization: Bearer $ROTATED_ACCESS")
+check_status "200" "$ROTATED_ME_STATUS" "새 액세스 토큰으로 /me 조회"
+
+log_test "리프레시 토큰을 액세스 토큰으로 사용 (401 예상)"
+REFRESH_AS_ACCESS_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/me" \
+  -H "Authorization: Bearer $REFRESH_2")
+check_status "401" "$REFRESH_AS_ACCESS_STATUS" "리프레시 토큰의 액세스 사용 거부"
+
+log_test "이미 회전된 리프레시 토큰 재사용 (401 예상)"
+check_status "401" "$(refresh_tokens "$REFRESH_1" | cut -d'|' -f1)" "회전된 토큰 재사용 거부"
+check_status "401" "$(refresh_tokens "$REFRESH_2" | cut -d'|' -f1)" "재사용 감지 후 같은 묶음의 최신 토큰도 폐기"
+
+log_test "로그아웃 시 액세스 토큰과 리프레시 토큰 묶음 폐기"
+LOGOUT_LOGIN=$(curl -s -X POST "$API_BASE/login" \
+  -H "Content-Type: application/json" \
+  -d '{"email": "sarah.kim@example.com", "password": "password123"}')
+LOGOUT_ACCESS=$(echo "$LOGOUT_LOGIN" | python3 -c "import sys, json; print(json.load(sys.stdin).get('token', ''))" 2>/dev/null)
+LOGOUT_REFRESH=$(echo "$LOGOUT_LOGIN" | python3 -c "import sys, json; print(json.load(sys.stdin).get('refreshToken', ''))" 2>/dev/null)
+LOGOUT_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST "$API_BASE/logout" \
+  -H "Authorization: Bearer $LOGOUT_ACCESS" \
+  -H "Content-Type: application/json" \
+  -d "{\"refreshToken\": \"$LOGOUT_REFRESH\"}")
+check_status "200" "$LOGOUT_STATUS" "로그아웃"
+LOGGED_OUT_ME_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/me" \
+  -H "Authorization: Bearer $LOGOUT_ACCESS")
+check_status "401" "$LOGGED_OUT_ME_STATUS" "로그아웃한 액세스 토큰 거부"
+check_status "401" "$(refresh_tokens "$LOGOUT_REFRESH" | cut -d'|' -f1)" "로그아웃한 리프레시 토큰 거부"
+
+# 9. 스킬 필터 테스트 (대소문자 무시 정확 일치, 여러 스킬 AND/OR)
+log_section "9. 스킬 필터 테스트"
+
+# 멘토 목록 조회 결과 중 테스트 데이터 멘토(sarah.kim, david.lee)만 골라 출력하는 함수
+seeded_mentors() {
+    local query=$1
+    curl -s -X GET "$API_BASE/mentors?limit=100&$query" -H "Authorization: Bearer $ALEX_TOKEN" | \
+    python3 -c "
+import sys, json
+emails = [item['email'].split('@')[0] for item in json.load(sys.stdin)]
+print(' '.join(email for email in emails if email in ('sarah.kim', 'david.lee')))
+" 2>/dev/null
+}
+
+# 조회 조건별 기대 결과 확인 함수
+check_skill_filter() {
+    local query=$1
+    local expected=$2
+    local description=$3
+    local actual=$(seeded_mentors "$query")
+    if [ "$actual" = "$expected" ]; then
+        log_pass "$description ($query: ${actual:-없음})"
+    else
+        log_fail "$description ($query, Expected: ${expected:-없음}, Got: ${actual:-없음})"
+    fi
+}
+
+log_test "대소문자를 무시한 스킬 정확 일치"
+check_skill_filter "skill=REACT" "sarah.kim" "대문자 스킬 필터"
+check_skill_filter "skill=spring%20boot" "david.lee" "공백이 있는 소문자 스킬 필터"
+check_skill_filter "skill=Java" "david.lee" "Java 필터에 JavaScript 멘토는 제외"
+check_skill_filter "skill=Reac" "" "스킬 일부만 일치하면 제외"
+
+log_test "여러 스킬 필터 (skill_match=any|all)"
+check_skill_filter "skill=react&skill=java" "sarah.kim david.lee" "반복 파라미터 OR 필터"
+check_skill_filter "skill=react,java&skill_match=all" "" "쉼표 구분 AND 필터 (둘 다 가진 멘토 없음)"
+check_skill_filter "skill=react,aws&skill_match=all" "sarah.kim" "쉼표 구분 AND 필터"
+
+log_test "잘못된 skill_match (400 예상)"
+INVALID_MATCH_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/mentors?skill=react&skill_match=some" \
+  -H "Authorization: Bearer $ALEX_TOKEN")
+check_status "400" "$INVALID_MATCH_STATUS" "잘못된 skill_match 거부"
+
+# 10. 멘토 목록 페이지네이션 테스트 (limit, X-Next-Cursor 키셋 커서)
+log_section "10. 멘토 목록 페이지네이션 테스트"
+
+# 멘토 목록 한 페이지를 조회하여 "다음 커서|id 목록" 을 출력하는 함수
+mentor_page() {
+    local query=$1
+    curl -s -i -X GET "$API_BASE/mentors?$query" -H "Authorization: Bearer $ALEX_TOKEN" | \
+    python3 -c "
+import sys, json
+head, _, body = sys.stdin.read().replace('\r\n', '\n').partition('\n\n')
+cursor = next((line.split(':', 1)[1].strip() for line in head.split('\n') if line.lower().startswith('x-next-cursor:')), '')
+print(cursor + '|' + ' '.join(str(item['id']) for item in json.loads(body)))
+" 2>/dev/null
+}
+
+# limit=1 로 커서를 따라 끝까지 조회하여 "페이지 수|id 목록" 을 출력하는 함수
+walk_mentor_pages() {
+    local query=$1
+    local cursor=""
+    local ids=""
+    local pages=0
+    while [ $pages -lt 100 ]; do
+        local page=$(mentor_page "$query&limit=1${cursor:+&cursor=$cursor}")
+        ids="$ids ${page#*|}"
+        pages=$((pages + 1))
+        cursor=${page%%|*}
+        [ -z "$cursor" ] && break
+    done
+    echo "$pages|$(echo $ids)"
+}
+
+for MENTOR_ORDER in "order_by=id" "order_by=name" "order_by=skill"; do
+    log_test "limit=1 커서 페이지네이션 ($MENTOR_ORDER)"
+    FULL_IDS=$(mentor_page "$MENTOR_ORDER&limit=100" | cut -d'|' -f2)
+    WALKED=$(walk_mentor_pages "$MENTOR_ORDER")
+    WALKED_PAGES=${WALKED%%|*}
+    WALKED_IDS=${WALKED#*|}
+    MENTOR_COUNT=$(echo $FULL_IDS | wc -w)
+    UNIQUE_COUNT=$(echo $WALKED_IDS | tr ' ' '\n' | sort -u | wc -l)
+    if [ "$MENTOR_COUNT" -ge 2 ] && [ "$WALKED_IDS" = "$FULL_IDS" ] && [ "$UNIQUE_COUNT" = "$MENTOR_COUNT" ] && [ "$WALKED_PAGES" = "$MENTOR_COUNT" ]; then
+        log_pass "페이지를 이어 붙인 결과가 전체 목록과 같은 순서, 중복 없음 ($WALKED_PAGES 페이지)"
+    else
+        log_fail "커서 페이지네이션 (전체: $FULL_IDS, 페이지별: $WALKED_IDS, 페이지 수: $WALKED_PAGES)"
+    fi
+done
+
+log_test "마지막 페이지에는 X-Next-Cursor 없음"
+LAST_PAGE_CURSOR=$(mentor_page "limit=100" | cut -d'|' -f1)
+if [ -z "$LAST_PAGE_CURSOR" ]; then
+    log_pass "전체가 한 페이지에 들어가면 다음 커서 없음"
+else
+    log_fail "마지막 페이지의 다음 커서 (Got: $LAST_PAGE_CURSOR)"
+fi
+
+log_test "잘못된 커서 (400 예상)"
+NAME_CURSOR=$(mentor_page "order_by=name&limit=1" | cut -d'|' -f1)
+GARBAGE_CURSOR_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/mentors?limit=1&cursor=not-a-cursor" \
+  -H "Authorization: Bearer $ALEX_TOKEN")
+check_status "400" "$GARBAGE_CURSOR_STATUS" "해석할 수 없는 커서 거부"
+MISMATCH_CURSOR_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/mentors?order_by=id&limit=1&cursor=$NAME_CURSOR" \
+  -H "Authorization: Bearer $ALEX_TOKEN")
+check_status "400" "$MISMATCH_CURSOR_STATUS" "다른 정렬 기준의 커서 거부"
+
+log_test "범위를 벗어난 limit (422 예상)"
+for MENTOR_LIMIT in 0 101; do
+    LIMIT_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/mentors?limit=$MENTOR_LIMIT" \
+      -H "Authorization: Bearer $ALEX_TOKEN")
+    check_status "422" "$LIMIT_STATUS" "limit=$MENTOR_LIMIT 거부"
+done
+
+# 11. 멘토 전문 검색 테스트 (q 파라미터, 이름/소개/스킬 FTS5 검색)
+log_section "11. 멘토 전문 검색 테스트"
+
+log_test "이름, 소개, 스킬 전문 검색"
+check_skill_filter "q=system%20design%20aws" "sarah.kim" "여러 단어 AND 검색"
+check_skill_filter "q=mentoring%20junior" "sarah.kim" "소개 검색"
+check_skill_filter "q=lee" "david.lee" "이름 검색"
+check_skill_filter "q=KUBERNETES" "david.lee" "대소문자를 무시한 스킬 검색"
+check_skill_filter "q=micro" "david.lee" "접두어 검색"
+check_skill_filter "q=aws%20kubernetes" "" "모든 단어를 가진 멘토가 없으면 빈 결과"
+check_skill_filter "q=react&skill=java" "" "검색어와 스킬 필터 함께 적용"
+
+log_test "FTS5 문법 문자가 섞인 검색어"
+SPECIAL_QUERY_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/mentors?q=%22react%22%20OR%20(aws*%20NEAR" \
+  -H "Authorization: Bearer $ALEX_TOKEN")
+check_status "200" "$SPECIAL_QUERY_STATUS" "문법 문자가 섞인 검색어도 오류 없이 검색"
+check_skill_filter "q=%2A%2A%2A" "sarah.kim david.lee" "단어가 없는 검색어는 필터 없이 전체 목록"
+
+log_test "프로필 수정 시 검색 색인 갱신"
+DAVID_PROFILE=$(curl -s -X GET "$API_BASE/me" -H "Authorization: Bearer $DAVID_TOKEN")
+profile_update_body() {
+    local bio_suffix=$1
+    echo "$DAVID_PROFILE" | python3 -c "
+import sys, json
+data = json.load(sys.stdin)
+profile = data['profile']
+print(json.dumps({'id': data['id'], 'role': data['role'], 'name': profile['name'],
+                  'bio': profile['bio'] + '$bio_suffix', 'skills': profile['skills']}))
+" 2>/dev/null
+}
+UPDATE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/profile" \
+  -H "Authorization: Bearer $DAVID_TOKEN" \
+  -H "Content-Type: application/json" \
+  -d "$(profile_update_body " Also an amateur zeppelin pilot.")")
+check_status "200" "$UPDATE_STATUS" "멘토 소개 수정"
+check_skill_filter "q=zeppelin" "david.lee" "수정된 소개로 검색"
+RESTORE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/profile" \
+  -H "Authorization: Bearer $DAVID_TOKEN" \
+  -H "Content-Type: application/json" \
+  -d "$(profile_update_body "")")
+check_status "200" "$RESTORE_STATUS" "멘토 소개 복원"
+check_skill_filter "q=zeppelin" "" "복원 후 이전 소개의 단어는 검색되지 않음"
+
+# 12. 미팅 충돌 검사 테스트 (참가자별 충돌, 수정 시 충돌, 동시 예약 직렬화)
+log_section "12. 미팅 충돌 검사 테스트"
+
+BOOKING_TITLE="API 테스트 예약 미팅"
+DAVID_ID=$(curl -s -X GET "$API_BASE/me" -H "Authorization: Bearer $DAVID_TOKEN" | \
+  python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+
+# 기간 안에서 제목이 같은 단일 미팅을 모두 삭제하는 함수 (이전 실행에서 남은 미팅 정리용)
+delete_meetings_titled() {
+    local title=$1
+    local start=$2
+    local end=$3
+    curl -s -X GET "$API_BASE/meetings?start=$start&end=$end" -H "Authorization: Bearer $SARAH_TOKEN" | \
+    python3 -c "
+import sys, json
+for item in json.load(sys.stdin):
+    if item.get('title') == '$title' and item.get('id') is not None:
+        print(item['id'])
+" 2>/dev/null | while read OLD_MEETING_ID; do
+        curl -s -X DELETE "$API_BASE/meetings/$OLD_MEETING_ID" -H "Authorization: Bearer $SARAH_TOKEN" > /dev/null
+    done
+}
+
+# 미팅을 생성하고 "상태코드|미팅 id" 를 출력하는 함수
+book_meeting() {
+    local token=$1
+    local mentor_id=$2
+    local start=$3
+    local end=$4
+    local response=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/meetings" \
+      -H "Authorization: Bearer $token" \
+      -H "Content-Type: application/json" \
+      -d "{\"mentorId\": $mentor_id, \"menteeId\": $ALEX_ID, \"title\": \"$BOOKING_TITLE\", \"startTime\": \"$start\", \"endTime\": \"$end\"}")
+    local status=$(echo "$response" | tail -n 1)
+    local meeting_id=$(echo "$response" | head -n -1 | python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+    echo "$status|$meeting_id"
+}
+
+delete_meetings_titled "$BOOKING_TITLE" "2032-03-01T00:00:00" "2032-03-08T00:00:00"
+
+log_test "미팅 생성 후 겹치는 시간대 예약"
+BOOKED=$(book_meeting "$SARAH_TOKEN" 1 "2032-03-01T10:00:00" "2032-03-01T11:00:00")
+check_status "200" "${BOOKED%%|*}" "미팅 생성"
+check_status "400" "$(try_meeting "2032-03-01T10:30:00" "2032-03-01T11:30:00")" "뒤쪽이 겹치는 미팅"
+check_status "400" "$(try_meeting "2032-03-01T09:30:00" "2032-03-01T10:30:00")" "앞쪽이 겹치는 미팅"
+check_status "400" "$(try_meeting "2032-03-01T09:00:00" "2032-03-01T12:00:00")" "기존 미팅을 감싸는 미팅"
+check_status "200" "$(try_meeting "2032-03-01T11:00:00" "2032-03-01T12:00:00")" "끝나는 시각에 바로 이어지는 미팅"
+check_status "400" "$(book_meeting "$DAVID_TOKEN" "$DAVID_ID" "2032-03-01T10:15:00" "2032-03-01T10:45:00" | cut -d'|' -f1)" "다른 멘토라도 멘티 일정이 겹치면 충돌"
+
+log_test "미팅 시간 수정 시 충돌 검사"
+SECOND_BOOKED=$(book_meeting "$SARAH_TOKEN" 1 "2032-03-01T13:00:00" "2032-03-01T14:00:00")
+SECOND_MEETING_ID=${SECOND_BOOKED#*|}
+check_status "200" "${SECOND_BOOKED%%|*}" "두 번째 미팅 생성"
+MOVE_INTO_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/meetings/$SECOND_MEETING_ID" \
+  -H "Authorization: Bearer $SARAH_TOKEN" \
+  -H "Content-Type: application/json" \
+  -d '{"startTime": "2032-03-01T10:30:00", "endTime": "2032-03-01T11:30:00"}')
+check_status "400" "$MOVE_INTO_STATUS" "기존 미팅과 겹치도록 시간 수정"
+MOVE_FREE_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X PUT "$API_BASE/meetings/$SECOND_MEETING_ID" \
+  -H "Authorization: Bearer $SARAH_TOKEN" \
+  -H "Content-Type: application/json" \
+  -d '{"startTime": "2032-03-01T15:00:00", "endTime": "2032-03-01T16:00:00"}')
+check_status "200" "$MOVE_FREE_STATUS" "빈 시간대로 시간 수정"
+check_status "200" "$(try_meeting "2032-03-01T13:00:00" "2032-03-01T14:00:00")" "수정 전 시간대는 비어 있음"
+
+log_test "같은 시간대 동시 예약 5건 중 1건만 성공"
+CONCURRENT_DIR=$(mktemp -d)
+for ATTEMPT in 1 2 3 4 5; do
+    book_meeting "$SARAH_TOKEN" 1 "2032-03-02T10:00:00" "2032-03-02T11:00:00" > "$CONCURRENT_DIR/$ATTEMPT" &
+done
+wait
+CONCURRENT_CREATED=$(cat "$CONCURRENT_DIR"/* | grep -c "^200|")
+CONCURRENT_CONFLICTS=$(cat "$CONCURRENT_DIR"/* | grep -c "^400|")
+rm -rf "$CONCURRENT_DIR"
+if [ "$CONCURRENT_CREATED" = "1" ] && [ "$CONCURRENT_CONFLICTS" = "4" ]; then
+    log_pass "동시 예약 직렬화 (성공: $CONCURRENT_CREATED, 충돌: $CONCURRENT_CONFLICTS)"
+else
+    log_fail "동시 예약 직렬화 (Expected 성공/충돌: 1/4, Got: $CONCURRENT_CREATED/$CONCURRENT_CONFLICTS)"
+fi
+
+delete_meetings_titled "$BOOKING_TITLE" "2032-03-01T00:00:00" "2032-03-08T00:00:00"
+
+# 13. 미팅 일괄 생성 테스트 (all_or_nothing / best_effort, 항목별 결과)
+log_section "13. 미팅 일괄 생성 테스트"
+
+BULK_TITLE="API 테스트 일괄 미팅"
+
+# 시작 시각 목록으로 1시간짜리 미팅들을 일괄 생성하고 "상태코드|created|항목별 상태" 를 출력하는 함수
+bulk_meetings() {
+    local mode=$1
+    shift
+    local items=$(for start in "$@"; do
+        echo "{\"mentorId\": 1, \"menteeId\": $ALEX_ID, \"title\": \"$BULK_TITLE\", \"startTime\": \"$start\", \"endTime\": \"${start%T*}T$(printf '%02d' $((10#${start:11:2} + 1)))${start:13}\"}"
+    done | paste -sd, -)
+    local response=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/meetings/bulk" \
+      -H "Authorization: Bearer $SARAH_TOKEN" \
+      -H "Content-Type: application/json" \
+      -d "{\"mode\": \"$mode\", \"meetings\": [$items]}")
+    local status=$(echo "$response" | tail -n 1)
+    local summary=$(echo "$response" | head -n -1 | python3 -c "
+import sys, json
+data = json.load(sys.stdin)
+print(str(data.get('created')) + '|' + ' '.join(item['status'] for item in data.get('results', [])))
+" 2>/dev/null)
+    echo "$status|$summary"
+}
+
+# 기간 안에서 일괄 생성한 미팅 수
+bulk_meeting_count() {
+    curl -s -X GET "$API_BASE/meetings?start=2032-04-01T00:00:00&end=2032-04-30T00:00:00" -H "Authorization: Bearer $SARAH_TOKEN" | \
+    python3 -c "import sys, json; print(sum(1 for item in json.load(sys.stdin) if item.get('title') == '$BULK_TITLE'))" 2>/dev/null
+}
+
+# 결과 요약 비교 함수
+check_bulk_result() {
+    local actual=$1
+    local expected=$2
+    local description=$3
+    if [ "$actual" = "$expected" ]; then
+        log_pass "$description ($actual)"
+    else
+        log_fail "$description (Expected: $expected, Got: $actual)"
+    fi
+}
+
+delete_meetings_titled "$BULK_TITLE" "2032-04-01T00:00:00" "2032-04-30T00:00:00"
+delete_meetings_titled "$BOOKING_TITLE" "2032-04-01T00:00:00" "2032-04-30T00:00:00"
+BLOCKER_STATUS=$(book_meeting "$SARAH_TOKEN" 1 "2032-04-06T10:00:00" "2032-04-06T11:00:00" | cut -d'|' -f1)
+
+log_test "all_or_nothing: 한 항목이라도 충돌하면 아무것도 만들지 않음"
+check_status "200" "$BLOCKER_STATUS" "기존 미팅 생성"
+check_bulk_result "$(bulk_meetings all_or_nothing 2032-04-05T10:00:00 2032-04-06T10:30:00 2032-04-07T10:00:00)" \
+  "400|0|skipped error skipped" "기존 미팅과 충돌하는 항목 포함"
+check_bulk_result "$(bulk_meetings all_or_nothing 2032-04-05T10:00:00 2032-04-05T10:30:00)" \
+  "400|0|skipped error" "같은 요청 안에서 서로 겹치는 항목 포함"
+check_status "0" "$(bulk_meeting_count)" "실패한 일괄 생성 후 남은 미팅 수"
+
+log_test "best_effort: 가능한 항목만 생성"
+check_bulk_result "$(bulk_meetings best_effort 2032-04-07T10:00:00 2032-04-06T10:30:00 2032-04-05T10:00:00 2032-04-05T10:30:00)" \
+  "200|2|created error created error" "충돌 항목만 제외하고 생성 (입력 순서대로 결과)"
+check_status "2" "$(bulk_meeting_count)" "생성된 미팅 수"
+
+log_test "all_or_nothing: 충돌이 없으면 모두 생성"
+check_bulk_result "$(bulk_meetings all_or_nothing 2032-04-12T10:00:00 2032-04-12T11:00:00 2032-04-13T10:00:00)" \
+  "200|3|created created created" "충돌 없는 일괄 생성"
+check_status "5" "$(bulk_meeting_count)" "생성된 미팅 수"
+
+log_test "잘못된 일괄 생성 요청 (400 예상)"
+check_status "400" "$(bulk_meetings sometimes 2032-04-20T10:00:00 | cut -d'|' -f1)" "잘못된 mode"
+check_status "400" "$(bulk_meetings all_or_nothing | cut -d'|' -f1)" "빈 미팅 목록"
+
+delete_meetings_titled "$BULK_TITLE" "2032-04-01T00:00:00" "2032-04-30T00:00:00"
+delete_meetings_titled "$BOOKING_TITLE" "2032-04-01T00:00:00" "2032-04-30T00:00:00"
+
+# 14. 매칭 요청 상태 전이 테스트 (버전 불일치 409, 멱등 전이, 동시 수락/거절)
+log_section "14. 매칭 요청 상태 전이 테스트"
+
+# 테스트 데이터의 요청에 영향을 주지 않도록 실행마다 새 사용자를 만들어 사용
+RUN_ID=$(date +%s%N)
+
+# 회원가입 후 로그인하여 "사용자 id|토큰" 을 출력하는 함수
+signup_and_login() {
+    local role=$1
+    local name=$2
+    local email="api-test-$name-$RUN_ID@example.com"
+    curl -s -o /dev/null -X POST "$API_BASE/signup" \
+      -H "Content-Type: application/json" \
+      -d "{\"email\": \"$email\", \"password\": \"password123\", \"name\": \"API Test $name\", \"role\": \"$role\"}"
+    local token=$(curl -s -X POST "$API_BASE/login" \
+      -H "Content-Type: application/json" \
+      -d "{\"email\": \"$email\", \"password\": \"password123\"}" | \
+      python3 -c "import sys, json; print(json.load(sys.stdin).get('token', ''))" 2>/dev/null)
+    local user_id=$(curl -s -X GET "$API_BASE/me" -H "Authorization: Bearer $token" | \
+      python3 -c "import sys, json; print(json.load(sys.stdin).get('id', ''))" 2>/dev/null)
+    echo "$user_id|$token"
+}
+
+# 매칭 요청 API 를 호출하고 "상태코드|요청 상태|버전|요청 id" 를 출력하는 함수
+match_request_call() {
+    local method=$1
+    local path=$2
+    local token=$3
+    local body=$4
+    local response=$(curl -s -w "\n%{http_code}" -X "$method" "$API_BASE/$path" \
+      -H "Authorization: Bearer $token" \
+      -H "Content-Type: application/json" \
+      -d "$body")
+    local status=$(echo "$response" | tail -n 1)
+    local fields=$(echo "$response" | head -n -1 | python3 -c "
+import sys, json
+data = json.load(sys.stdin)
+print('|'.join(str(data.get(field, '')) for field in ('status', 'version', 'id')))
+" 2>/dev/null)
+    echo "$status|$fields"
+}
+
+# 받은 요청 목록에서 요청 하나의 상태를 출력하는 함수
+incoming_request_status() {
+    local token=$1
+    local request_id=$2
+    curl -s -X GET "$API_BASE/match-requests/incoming" -H "Authorization: Bearer $token" | \
+    python3 -c "import sys, json; print(next((item['status'] for item in json.load(sys.stdin) if item['id'] == $request_id), 'NOT_FOUND'))" 2>/dev/null
+}
+
+# 호출 결과의 "상태코드|요청 상태|버전" 부분 비교 함수
+check_transition() {
+    local actual=$1
+    local expected=$2
+    local description=$3
+    local summary=$(echo "$actual" | cut -d'|' -f1-3)
+    if [ "$summary" = "$expected" ]; then
+        log_pass "$description ($summary)"
+    else
+        log_fail "$description (Expected: $expected, Got: $summary)"
+    fi
+}
+
+TEST_MENTOR=$(signup_and_login mentor mentor)
+TEST_MENTOR_ID=${TEST_MENTOR%%|*}
+TEST_MENTOR_TOKEN=${TEST_MENTOR#*|}
+TEST_MENTEE_A=$(signup_and_login mentee mentee-a)
+TEST_MENTEE_A_TOKEN=${TEST_MENTEE_A#*|}
+TEST_MENTEE_B=$(signup_and_login mentee mentee-b)
+TEST_MENTEE_B_TOKEN=${TEST_MENTEE_B#*|}
+
+log_test "새 요청은 pending, 버전 1"
+REQUEST_A=$(match_request_call POST "match-requests" "$TEST_MENTEE_A_TOKEN" "{\"mentorId\": $TEST_MENTOR_ID, \"message\": \"상태 전이 테스트 A\"}")
+REQUEST_A_ID=$(echo "$REQUEST_A" | cut -d'|' -f4)
+REQUEST_B=$(match_request_call POST "match-requests" "$TEST_MENTEE_B_TOKEN" "{\"mentorId\": $TEST_MENTOR_ID, \"message\": \"상태 전이 테스트 B\"}")
+REQUEST_B_ID=$(echo "$REQUEST_B" | cut -d'|' -f4)
+check_transition "$REQUEST_A" "200|pending|1" "멘티 A 요청 생성"
+check_transition "$REQUEST_B" "200|pending|1" "멘티 B 요청 생성"
+
+log_test "버전이 다른 수락 (409 예상)"
+check_transition "$(match_request_call PUT "match-requests/$REQUEST_A_ID/accept?version=5" "$TEST_MENTOR_TOKEN")" "409||" "버전 불일치 수락 거부"
+check_status "pending" "$(incoming_request_status "$TEST_MENTOR_TOKEN" "$REQUEST_A_ID")" "거부된 수락 후 요청 상태"
+
+log_test "수락 시 같은 멘토의 다른 대기 요청은 거절"
+check_transition "$(match_request_call PUT "match-requests/$REQUEST_A_ID/accept?version=1" "$TEST_MENTOR_TOKEN")" "200|accepted|2" "버전을 지정한 수락"
+check_status "rejected" "$(incoming_request_status "$TEST_MENTOR_TOKEN" "$REQUEST_B_ID")" "다른 대기 요청 자동 거절"
+
+log_test "이미 끝난 전이 반복과 허용되지 않는 전이"
+check_transition "$(match_request_call PUT "match-requests/$REQUEST_A_ID/accept" "$TEST_MENTOR_TOKEN")" "200|accepted|2" "같은 수락 반복은 멱등 (버전 유지)"
+check_transition "$(match_request_call PUT "match-requests/$REQUEST_A_ID/reject" "$TEST_MENTOR_TOKEN")" "409||" "수락된 요청 거절 (409 예상)"
+check_transition "$(match_request_call DELETE "match-requests/$REQUEST_B_ID" "$TEST_MENTEE_B_TOKEN")" "409||" "거절된 요청 취소 (409 예상)"
+check_transition "$(match_request_call DELETE "match-requests/$REQUEST_A_ID" "$TEST_MENTEE_B_TOKEN")" "404||" "다른 멘티의 요청 취소 (404 예상)"
+
+log_test "멘티가 수락된 매칭 종료"
+check_transition "$(match_request_call DELETE "match-requests/$REQUEST_A_ID?version=1" "$TEST_MENTEE_A_TOKEN")" "409||" "이전 버전으로 취소 (409 예상)"
+check_transition "$(match_request_call DELETE "match-requests/$REQUEST_A_ID?version=2" "$TEST_MENTEE_A_TOKEN")" "200|cancelled|3" "수락된 요청 취소"
+check_transition "$(match_request_call DELETE "match-requests/$REQUEST_A_ID" "$TEST_MENTEE_A_TOKEN")" "200|cancelled|3" "같은 취소 반복은 멱등"
+
+log_test "같은 요청에 동시에 수락과 거절"
+RACE_REQUEST_ID=$(match_request_call POST "match-requests" "$TEST_MENTEE_A_TOKEN" "{\"mentorId\": $TEST_MENTOR_ID, \"message\": \"동시 전이 테스트\"}" | cut -d'|' -f4)
+RACE_DIR=$(mktemp -d)
+match_request_call PUT "match-requests/$RACE_REQUEST_ID/accept" "$TEST_MENTOR_TOKEN" > "$RACE_DIR/accept" &
+match_request_call PUT "match-requests/$RACE_REQUEST_ID/reject" "$TEST_MENTOR_TOKEN" > "$RACE_DIR/reject" &
+wait
+RACE_RESULTS=$(cut -d'|' -f1 "$RACE_DIR/accept" "$RACE_DIR/reject" | sort | paste -sd' ' -)
+RACE_FINAL=$(incoming_request_status "$TEST_MENTOR_TOKEN" "$RACE_REQUEST_ID")
+RACE_WINNER=$(grep -l "^200|" "$RACE_DIR/accept" "$RACE_DIR/reject" | xargs -r cat | cut -d'|' -f2)
+rm -rf "$RACE_DIR"
+if [ "$RACE_RESULTS" = "200 409" ] && [ "$RACE_FINAL" = "$RACE_WINNER" ]; then
+    log_pass "하나만 성공하고 나머지는 409 (최종 상태: $RACE_FINAL)"
+else
+    log_fail "동시 전이 (상태코드: $RACE_RESULTS, 최종 상태: $RACE_FINAL, 성공한 전이: $RACE_WINNER)"
+fi
+
+# 15. 중복 매칭 요청 테스트 (대기/수락 중인 같은 쌍은 하나만, 잘못된 멘토)
+log_section "15. 중복 매칭 요청 테스트"
+
+# 매칭 요청을 생성하고 "상태코드|detail" 을 출력하는 함수 (성공하면 detail 은 비어 있음)
+create_request_detail() {
+    local token=$1
+    local mentor_id=$2
+    local response=$(curl -s -w "\n%{http_code}" -X POST "$API_BASE/match-requests" \
+      -H "Authorization: Bearer $token" \
+      -H "Content-Type: application/json" \
+      -d "{\"mentorId\": $mentor_id, \"message\": \"중복 요청 테스트\"}")
+    local status=$(echo "$response" | tail -n 1)
+    local detail=$(echo "$response" | head -n -1 | python3 -c "import sys, json; print(json.load(sys.stdin).get('detail', ''))" 2>/dev/null)
+    echo "$status|$detail"
+}
+
+TEST_MENTEE_C=$(signup_and_login mentee mentee-c)
+TEST_MENTEE_C_ID=${TEST_MENTEE_C%%|*}
+TEST_MENTEE_C_TOKEN=${TEST_MENTEE_C#*|}
+
+log_test "같은 멘토에게 동시에 5번 요청하면 1건만 생성"
+DUPLICATE_DIR=$(mktemp -d)
+for ATTEMPT in 1 2 3 4 5; do
+    create_request_detail "$TEST_MENTEE_C_TOKEN" "$TEST_MENTOR_ID" > "$DUPLICATE_DIR/$ATTEMPT" &
+done
+wait
+DUPLICATE_CREATED=$(cat "$DUPLICATE_DIR"/* | grep -c "^200|")
+DUPLICATE_REJECTED=$(cat "$DUPLICATE_DIR"/* | grep -c "^400|Request already exists$")
+rm -rf "$DUPLICATE_DIR"
+if [ "$DUPLICATE_CREATED" = "1" ] && [ "$DUPLICATE_REJECTED" = "4" ]; then
+    log_pass "중복 요청 방지 (생성: $DUPLICATE_CREATED, 중복 거절: $DUPLICATE_REJECTED)"
+else
+    log_fail "중복 요청 방지 (Expected 생성/중복 거절: 1/4, Got: $DUPLICATE_CREATED/$DUPLICATE_REJECTED)"
+fi
+PENDING_C_ID=$(curl -s -X GET "$API_BASE/match-requests/outgoing" -H "Authorization: Bearer $TEST_MENTEE_C_TOKEN" | \
+  python3 -c "import sys, json; print(next((item['id'] for item in json.load(sys.stdin) if item['status'] == 'pending'), ''))" 2>/dev/null)
+
+log_test "수락된 요청이 있어도 중복 (400 예상)"
+check_transition "$(match_request_call PUT "match-requests/$PENDING_C_ID/accept" "$TEST_MENTOR_TOKEN")" "200|accepted|2" "요청 수락"
+check_status "400|Request already exists" "$(create_request_detail "$TEST_MENTEE_C_TOKEN" "$TEST_MENTOR_ID")" "수락된 쌍에 다시 요청"
+
+log_test "끝난 요청 뒤에는 다시 요청 가능"
+check_transition "$(match_request_call DELETE "match-requests/$PENDING_C_ID" "$TEST_MENTEE_C_TOKEN")" "200|cancelled|3" "수락된 요청 취소"
+check_status "200|" "$(create_request_detail "$TEST_MENTEE_C_TOKEN" "$TEST_MENTOR_ID")" "취소 후 같은 멘토에게 다시 요청"
+
+log_test "존재하지 않거나 멘토가 아닌 사용자에게 요청 (400 예상)"
+check_status "400|Mentor not found" "$(create_request_detail "$TEST_MENTEE_C_TOKEN" 999999)" "존재하지 않는 멘토"
+check_status "400|Mentor not found" "$(create_request_detail "$TEST_MENTEE_C_TOKEN" "$TEST_MENTEE_C_ID")" "멘티에게 요청"
+
+# 16. 실시간 이벤트 (SSE) 테스트 (1회용 티켓, 이벤트 전달)
+log_section "16. 실시간 이벤트 (SSE) 테스트"
+
+# 이벤트 스트림 티켓을 발급받아 출력하는 함수
+event_ticket() {
+    local token=$1
+    curl -s -X POST "$API_BASE/events/ticket" -H "Authorization: Bearer $token" | \
+    python3 -c "import sys, json; print(json.load(sys.stdin).get('ticket', ''))" 2>/dev/null
+}
+
+log_test "인증 없는 티켓 발급과 스트림 연결 (401 예상)"
+NO_AUTH_TICKET_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X POST "$API_BASE/events/ticket")
+check_status "401" "$NO_AUTH_TICKET_STATUS" "인증 없는 티켓 발급"
+NO_AUTH_STREAM_STATUS=$(curl -s -o /dev/null -w "%{http_code}" --max-time 3 "$API_BASE/events")
+check_status "401" "$NO_AUTH_STREAM_STATUS" "인증 없는 스트림 연결"
+QUERY_TOKEN_STATUS=$(curl -s -o /dev/null -w "%{http_code}" --max-time 3 "$API_BASE/events?access_token=$ALEX_TOKEN")
+check_status "401" "$QUERY_TOKEN_STATUS" "URL 의 access_token 은 인증으로 받지 않음"
+
+log_test "티켓으로 스트림 연결, 같은 티켓 재사용 (401 예상)"
+STREAM_TICKET=$(event_ticket "$ALEX_TOKEN")
+TICKET_AS_TOKEN_STATUS=$(curl -s -o /dev/null -w "%{http_code}" -X GET "$API_BASE/me" \
+  -H "Authorization: Bearer $STREAM_TICKET")
+check_status "401" "$TICKET_AS_TOKEN_STATUS" "티켓을 액세스 토큰으로 사용"
+READY_EVENT=$(curl -s -N --max-time 2 "$API_BASE/events?ticket=$STREAM_TICKET" | grep -A1 "^event: ready" | tail -n 1)
+if [ "$READY_EVENT" = "data: {\"userId\":$ALEX_ID}" ]; then
+    log_pass "연결 직후 ready 이벤트 ($READY_EVENT)"
+else
+    log_fail "연결 직후 ready 이벤트 (Got: ${READY_EVENT:-없음})"
+fi
+REUSED_TICKET_STATUS=$(curl -s -o /dev/null -w "%{http_code}" --max-time 3 "$API_BASE/events?ticket=$STREAM_TICKET")
+check_status "401" "$REUSED_TICKET_STATUS" "사용한 티켓 재사용"
+
+log_test "매칭 요청 생성과 거절이 양쪽 스트림으로 전달"
+TEST_MENTEE_D=$(signup_and_login mentee mentee-d)
+TEST_MENTEE_D_TOKEN=${TEST_MENTEE_D#*|}
+EVENT_DIR=$(mktemp -d)
+curl -s -N --max-time 4 "$API_BASE/events?ticket=$(event_ticket "$TEST_MENTOR_TOKEN")" > "$EVENT_DIR/mentor" &
+curl -s -N --max-time 4 "$API_BASE/events?ticket=$(event_ticket "$TEST_MENTEE_D_TOKEN")" > "$EVENT_DIR/mentee" &
+sleep 1
+EVENT_REQUEST_ID=$(match_request_call POST "match-requests" "$TEST_MENTEE_D_TOKEN" "{\"mentorId\": $TEST_MENTOR_ID, \"message\": \"이벤트 테스트\"}" | cut -d'|' -f4)
+match_request_call PUT "match-requests/$EVENT_REQUEST_ID/reject" "$TEST_MENTOR_TOKEN" > /dev/null
+wait
+MENTOR_EVENTS=$(grep "^event: " "$EVENT_DIR/mentor" | cut -d' ' -f2 | paste -sd' ' -)
+MENTEE_EVENTS=$(grep "^event: " "$EVENT_DIR/mentee" | cut -d' ' -f2 | paste -sd' ' -)
+rm -rf "$EVENT_DIR"
+check_status "ready match_request.created" "$MENTOR_EVENTS" "멘토 스트림 이벤트"
+check_status "ready match_request.rejected" "$MENTEE_EVENTS" "멘티 스트림 이벤트"
+
 # 테스트 결과 요약
 log_section "테스트 결과 요약"
 echo "📊 총 테스트: $TOTAL_TESTS"